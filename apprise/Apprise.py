@@ -24,16 +24,42 @@
 # THE SOFTWARE.
 
 import re
+import hashlib
 import logging
-from markdown import markdown
+import threading
+from copy import deepcopy
+from functools import partial
+from collections import OrderedDict
+from itertools import count
+
+try:
+    # Python 3.x (or Python 2.7 with the futures backport installed)
+    from concurrent.futures import ThreadPoolExecutor
+    from concurrent.futures import wait as futures_wait
+
+except ImportError:  # pragma: no cover
+    # Concurrent notifications are not supported
+    ThreadPoolExecutor = None
 
 from .common import NotifyType
 from .common import NotifyFormat
 from .utils import parse_list
 from .utils import compat_is_basestring
 from .utils import GET_SCHEMA_RE
+from .utils import LRUCache
 
 from .AppriseAsset import AppriseAsset
+from .AppriseResult import AppriseResult
+from .AppriseResult import NotifyResult
+from .circuit import CircuitBreakers
+from .circuit import CircuitState
+from .deadline import Deadline
+from .deadline import DeadlineExceeded
+from .deadline import Cutoff
+from .dispatcher import Dispatcher
+from .hooks import Hooks
+from .hooks import HookStage
+from .py3compat import ASYNCIO_SUPPORT
 
 from . import NotifyBase
 from . import plugins
@@ -41,49 +67,87 @@ from . import __version__
 
 logger = logging.getLogger(__name__)
 
+
+class SchemaMap(dict):
+    """
+    Maps each schema to the plugin that supports it.
+
+    Entries can be stored by the name of the plugin (as found in
+    plugins.PLUGIN_MANIFEST); the plugin is then only imported the first time
+    the schema is looked up.
+
+    """
+
+    def __getitem__(self, schema):
+        """
+        Returns the plugin associated with the schema
+        """
+        plugin = super(SchemaMap, self).__getitem__(schema)
+        if compat_is_basestring(plugin):
+            # Import our plugin and store it for next time
+            plugin = getattr(plugins, plugin)
+            super(SchemaMap, self).__setitem__(schema, plugin)
+
+        return plugin
+
+    def get(self, schema, default=None):
+        """
+        Returns the plugin associated with the schema (if found), otherwise
+        the default is returned.
+        """
+        try:
+            return self[schema]
+
+        except KeyError:
+            return default
+
+
 # Build a list of supported plugins
-SCHEMA_MAP = {}
+SCHEMA_MAP = SchemaMap()
+
+# Basic TEXT to HTML format map; supports keys only
+TEXT_TO_HTML_MAP = {
+    # Support Ampersand
+    r'&': '&amp;',
+
+    # Spaces to &nbsp; for formatting purposes since
+    # multiple spaces are treated as one an this may not
+    # be the callers intention
+    r' ': '&nbsp;',
+
+    # Tab support
+    r'\t': '&nbsp;&nbsp;&nbsp;',
+
+    # Greater than and Less than Characters
+    r'>': '&gt;',
+    r'<': '&lt;',
+}
+
+# Compile our map
+TEXT_TO_HTML_RE = re.compile(
+    r'(' + '|'.join(map(re.escape, TEXT_TO_HTML_MAP.keys())) + r')',
+    re.IGNORECASE,
+)
+
+# Used to swap out new lines and replace them with <br/>
+TEXT_TO_HTML_NEWLINE_RE = re.compile(r'\r*\n')
+
+# Used to identify the hostname found in a URL
+URL_HOSTNAME_RE = re.compile(
+    r'^(?P<prefix>[^:/]+://(?:[^@/?]*@)?)(?P<host>[^/:?]*)')
 
 
 # Load our Lookup Matrix
 def __load_matrix():
     """
-    Dynamically load our schema map; this allows us to gracefully
-    skip over plugins we simply don't have the dependecies for.
+    Build our schema map from the static manifest of plugins we support. None
+    of our plugins are imported until they are first looked up.
 
     """
-    # to add it's mapping to our hash table
-    for entry in dir(plugins):
-
-        # Get our plugin
-        plugin = getattr(plugins, entry)
-        if not hasattr(plugin, 'app_id'):  # pragma: no branch
-            # Filter out non-notification modules
-            continue
-
-        # Load protocol(s) if defined
-        proto = getattr(plugin, 'protocol', None)
-        if compat_is_basestring(proto):
-            if proto not in SCHEMA_MAP:
-                SCHEMA_MAP[proto] = plugin
-
-        elif isinstance(proto, (set, list, tuple)):
-            # Support iterables list types
-            for p in proto:
-                if p not in SCHEMA_MAP:
-                    SCHEMA_MAP[p] = plugin
-
-        # Load secure protocol(s) if defined
-        protos = getattr(plugin, 'secure_protocol', None)
-        if compat_is_basestring(protos):
-            if protos not in SCHEMA_MAP:
-                SCHEMA_MAP[protos] = plugin
-
-        if isinstance(protos, (set, list, tuple)):
-            # Support iterables list types
-            for p in protos:
-                if p not in SCHEMA_MAP:
-                    SCHEMA_MAP[p] = plugin
+    for (name, (_, protocols)) in plugins.PLUGIN_MANIFEST.items():
+        for protocol in protocols:
+            if protocol not in SCHEMA_MAP:
+                SCHEMA_MAP[protocol] = name
 
 
 # Dynamically build our module
@@ -95,18 +159,91 @@ class Apprise(object):
     Our Notification Manager
 
     """
-    def __init__(self, servers=None, asset=None):
+
+    # A cache of our converted message bodies shared by all of our Apprise
+    # objects; this saves us from converting the same (templated) messages
+    # over and over again.  Set its maxsize to zero (0) to disable it.
+    conversion_cache = LRUCache(maxsize=128)
+
+    # A cache of our parsed URLs shared by all of our Apprise objects. It is
+    # disabled by default; set its maxsize to the number of URLs you wish to
+    # keep if you're repeatedly loading the same ones.
+    url_cache = LRUCache(maxsize=0)
+
+    # The default number of threads used to load our servers with add_many()
+    bulk_max_workers = 8
+
+    def __init__(self, servers=None, asset=None, max_workers=None,
+                 outbox=None, digest=None, dedupe=None, dispatcher=None,
+                 circuit_breakers=None):
         """
         Loads a set of server urls while applying the Asset() module to each
         if specified.
 
         If no asset is provided, then the default asset is used.
 
+        If max_workers is set to a value larger then 1, then notifications
+        are sent to the loaded servers concurrently using a pool of (at most)
+        this many threads.  By default notifications are sent one at a time.
+
+        If an outbox (AppriseOutbox) is specified, then the notifications that
+        could not be delivered are stored in it so that they can be
+        redelivered later on.
+
+        If a digest (AppriseDigest) is specified, then the notifications sent
+        to each server are held and combined into fewer messages.
+
+        If a dedupe filter (DuplicateFilter) is specified, then notifications
+        identical to ones recently sent to the same server are suppressed;
+        share it between Apprise objects to suppress them across all of
+        them.
+
+        The dispatcher (Dispatcher) sends the notifications made with
+        notify(block=False) in the background; one is created (using its
+        defaults) the first time it's needed if none is specified.
+
+        If circuit breakers (CircuitBreakers) are specified, then servers that
+        fail too many times in a row are skipped for a while; share them
+        between Apprise objects to have all of them skip the same servers.
+
         """
 
-        # Initialize a server list of URLs
+        # Initialize a server list of URLs; it should only be altered using
+        # our own methods (such as add(), pop() and item assignment) so that
+        # our tag index keeps up with it
         self.servers = list()
 
+        # Our tag index allows us to look up the servers associated with a
+        # tag without having to visit each and every one of them.  Every
+        # server added is assigned a (unique and ever increasing) sequence
+        # number which is tracked in the same order as our servers list.
+        self._index_init()
+
+        # The maximum number of threads to use when notifying our servers
+        self.max_workers = max_workers
+
+        # Where the notifications we fail to deliver are stored (if anywhere)
+        self.outbox = outbox
+
+        # Where our notifications are held to be sent as digests (if anywhere)
+        self.digest = digest
+
+        # Used to suppress duplicate notifications (if specified)
+        self.dedupe = dedupe
+
+        # Sends our notifications in the background (if requested)
+        self.dispatcher = dispatcher
+
+        # Skips the servers that keep failing (if specified)
+        self.circuit_breakers = circuit_breakers
+
+        # Ensures only one dispatcher is ever created for us
+        self._dispatcher_lock = threading.Lock()
+
+        # The hooks fired around the stages of our notifications; the hooks
+        # of each server we load are linked to these
+        self.hooks = Hooks()
+
         # Assigns an central asset object that will be later passed into each
         # notification plugin.  Assets contain information such as the local
         # directory images can be found in. It can also identify remote
@@ -127,6 +264,67 @@ class Apprise(object):
         Server URL.  If the url fails to be parsed, then None is returned.
 
         """
+        # Parse our url details
+        # the server object is a dictionary containing all of the information
+        # parsed from our URL
+        results = Apprise._parse_url(url)
+        if not results:
+            # Failed to parse the server URL
+            return None
+
+        # Build a list of tags to associate with the newly added notifications
+        results['tag'] = set(parse_list(tag))
+
+        return Apprise._instantiate(
+            url, results, asset=asset,
+            suppress_exceptions=suppress_exceptions)
+
+    @staticmethod
+    def _instantiate(url, results, asset=None, suppress_exceptions=True):
+        """
+        Returns the instance of a plugin based on the results previously
+        parsed from the specified Server URL.
+
+        """
+        if suppress_exceptions:
+            try:
+                # Attempt to create an instance of our plugin using the parsed
+                # URL information
+                plugin = SCHEMA_MAP[results['schema']](**results)
+
+            except Exception:
+                # the arguments are invalid or can not be used.
+                logger.error('Could not load URL: %s' % url)
+                return None
+
+        else:
+            # Attempt to create an instance of our plugin using the parsed
+            # URL information but don't wrap it in a try catch
+            plugin = SCHEMA_MAP[results['schema']](**results)
+
+        # Save our asset
+        if asset:
+            plugin.asset = asset
+
+        return plugin
+
+    @staticmethod
+    def _parse_url(url):
+        """
+        Parses the URL using the plugin associated with its schema and
+        returns the results; None is returned if the URL can't be parsed.
+
+        If our url_cache is enabled, our results are cached (keyed by the URL
+        specified) and a copy of them is returned.
+
+        """
+        cache = Apprise.url_cache
+        results = cache.get(url) if cache.maxsize > 0 else None
+        if results is not None:
+            # We return a copy as our results are often altered by the plugin
+            # that is instantiated with them
+            return deepcopy(results)
+
         # swap hash (#) tag values with their html version
         # This is useful for accepting channels (as arguments to pushbullet)
         _url = url.replace('/#', '/%23')
@@ -153,8 +351,6 @@ class Apprise(object):
             return None
 
         # Parse our url details
-        # the server object is a dictionary containing all of the information
-        # parsed from our URL
         results = SCHEMA_MAP[schema].parse_url(_url)
 
         if not results:
@@ -162,30 +358,11 @@ class Apprise(object):
             logger.error('Could not parse URL: %s' % url)
             return None
 
-        # Build a list of tags to associate with the newly added notifications
-        results['tag'] = set(parse_list(tag))
+        if cache.maxsize > 0:
+            # Cache a copy of our results
+            cache.set(url, deepcopy(results))
 
-        if suppress_exceptions:
-            try:
-                # Attempt to create an instance of our plugin using the parsed
-                # URL information
-                plugin = SCHEMA_MAP[results['schema']](**results)
-
-            except Exception:
-                # the arguments are invalid or can not be used.
-                logger.error('Could not load URL: %s' % url)
-                return None
-
-        else:
-            # Attempt to create an instance of our plugin using the parsed
-            # URL information but don't wrap it in a try catch
-            plugin = SCHEMA_MAP[results['schema']](**results)
-
-        # Save our asset
-        if asset:
-            plugin.asset = asset
-
-        return plugin
+        return results
 
     def add(self, servers, asset=None, tag=None):
         """
@@ -208,7 +385,7 @@ class Apprise(object):
 
         if isinstance(servers, NotifyBase):
             # Go ahead and just add our plugin into our list
-            self.servers.append(servers)
+            self._append(servers)
             return True
 
         # build our server listings
@@ -217,7 +394,9 @@ class Apprise(object):
 
             # Instantiate ourselves an object, this function throws or
             # returns None if it fails
-            instance = Apprise.instantiate(_server, asset=asset, tag=tag)
+            with self.hooks.stage(HookStage.PARSE, url=_server) as stage:
+                instance = Apprise.instantiate(_server, asset=asset, tag=tag)
+                stage.update(server=instance)
             if not instance:
                 return_status = False
                 logging.error(
@@ -226,20 +405,341 @@ class Apprise(object):
                 continue
 
             # Add our initialized plugin to our server listings
-            self.servers.append(instance)
+            self._append(instance)
 
         # Return our status
         return return_status
 
+    def add_many(self, servers, asset=None, tag=None, max_workers=None):
+        """
+        Adds many server URLs into our list at once.
+
+        The servers can be specified just as they are with add(), or as a
+        dictionary mapping each URL to the tag(s) to associate with it (in
+        addition to those identified by the tag argument).
+
+        URLs that are identical once parsed are only loaded once; the server
+        they produce is associated with all of their tags.  The URLs are
+        loaded concurrently using (at most) max_workers threads; if not
+        specified our own max_workers (or bulk_max_workers) is used.
+
+        A dictionary is returned mapping each URL to the server it was loaded
+        into, or None if it could not be loaded.  A URL that fails to load
+        does not prevent the others from being added.
+        """
+
+        if asset is None:
+            # prepare default asset
+            asset = self.asset
+
+        if isinstance(servers, dict):
+            # Each URL has it's own tags
+            entries = [
+                (url, parse_list(tag, servers[url])) for url in servers]
+
+        else:
+            entries = [(url, parse_list(tag)) for url in parse_list(servers)]
+
+        # Our URLs mapped to the server they are loaded into
+        response = OrderedDict()
+
+        # The unique servers to load, keyed by their canonical form
+        unique = OrderedDict()
+
+        for url, tags in entries:
+            with self.hooks.stage(HookStage.PARSE, url=url):
+                results = Apprise._parse_url(url)
+            if not results:
+                # Failed to parse the server URL
+                response[url] = None
+                logging.error(
+                    "Failed to load notification url: {}".format(url),
+                )
+                continue
+
+            # The URL we were given is the only thing that can differ
+            key = Apprise._canonical(
+                {k: v for k, v in results.items() if k != 'url'})
+            if key not in unique:
+                results['tag'] = set()
+                unique[key] = (url, results, [])
+
+            # Collect all of the tags (and URLs) for our server
+            unique[key][1]['tag'].update(tags)
+            unique[key][2].append(url)
+            response[url] = key
+
+        if not unique:
+            # Nothing to load
+            return response
+
+        max_workers = min(
+            max_workers or self.max_workers or self.bulk_max_workers,
+            len(unique))
+
+        if ThreadPoolExecutor is None or max_workers <= 1:
+            # Load our servers one at a time
+            instances = [
+                Apprise._instantiate(url, results, asset=asset)
+                for url, results, _ in unique.values()]
+
+        else:
+            executor = ThreadPoolExecutor(max_workers=max_workers)
+            try:
+                instances = list(executor.map(
+                    lambda entry: Apprise._instantiate(
+                        entry[0], entry[1], asset=asset),
+                    unique.values()))
+
+            finally:
+                executor.shutdown(wait=True)
+
+        # URLs that parse differently can still produce identical servers
+        # (such as when a trailing slash is present); these are merged.  We
+        # only trust our identity if it describes our servers completely.
+        loaded = OrderedDict()
+        for (_, _, urls), instance in zip(unique.values(), instances):
+            if instance:
+                key = Apprise._identity(instance)
+                if key in loaded and not (
+                        loaded[key].url_lossless() and
+                        instance.url_lossless()):
+                    # Our servers can't be told apart; keep both of them
+                    key = (instance.__class__, id(instance))
+
+                if key in loaded:
+                    loaded[key].tags = loaded[key].tags | instance.tags
+                    instance = loaded[key]
+
+                else:
+                    loaded[key] = instance
+
+            else:
+                logging.error(
+                    "Failed to load notification url(s): {}".format(
+                        ', '.join(urls)),
+                )
+
+            for url in urls:
+                response[url] = instance
+
+        for instance in loaded.values():
+            # Add our initialized plugin to our server listings
+            self._append(instance)
+
+        return response
+
+    @staticmethod
+    def _identity(server):
+        """
+        Returns what identifies a loaded server; servers that share it are
+        identical as long as their URL describes them completely (refer to
+        NotifyBase.url_lossless()).  It's based on the URL the server
+        produces (with its hostname in lowercase since they're case
+        insensitive); their path and arguments are included.
+
+        """
+        try:
+            url = server.url()
+
+        except NotImplementedError:
+            # We can't tell; our server is unique
+            return (server.__class__, id(server))
+
+        return (server.__class__, URL_HOSTNAME_RE.sub(
+            lambda m: m.group('prefix') + m.group('host').lower(), url))
+
+    @staticmethod
+    def _canonical(results):
+        """
+        Returns a (hashable) canonical form of the results parsed from a
+        URL; URLs that produce the same one would result in identical
+        servers.
+
+        """
+        if isinstance(results, dict):
+            return tuple(sorted(
+                ((key, Apprise._canonical(value))
+                 for key, value in results.items()), key=repr))
+
+        elif isinstance(results, (list, tuple)):
+            return tuple(Apprise._canonical(value) for value in results)
+
+        elif isinstance(results, (set, frozenset)):
+            return tuple(sorted(
+                (Apprise._canonical(value) for value in results), key=repr))
+
+        return results
+
     def clear(self):
         """
         Empties our server list
 
         """
+        for server in self.servers:
+            if server.hooks.parent is self.hooks:
+                # Our hooks no longer apply
+                server.hooks.parent = None
+
+            server._tag_owners.discard(self)
+
         self.servers[:] = []
 
+        # Reset our index
+        self._index_init()
+
+    def _append(self, server):
+        """
+        Adds an instantiated plugin to our server list and tag index
+
+        """
+        # Our hooks are fired along with the server's own
+        server.hooks.parent = self.hooks
+
+        self.servers.append(server)
+        self._index_add(server)
+
+    def _index_init(self):
+        """
+        Initializes (or resets) our tag index
+
+        """
+        # Maps each tag to the set of sequence numbers of the servers that
+        # are associated with it
+        self._tag_index = dict()
+
+        # Maps each sequence number to its server
+        self._index_servers = dict()
+
+        # Maps each sequence number to the tags its server had when it was
+        # indexed
+        self._index_tags = dict()
+
+        # The sequence numbers in the same order as our servers list
+        self._index_seqs = list()
+
+        # Our sequence number generator
+        self._index_counter = count()
+
+        # Set when the tags of one of our servers change; our index is
+        # rebuilt the next time it's used
+        self._index_dirty = False
+
+    def _index_add(self, server, seq=None):
+        """
+        Adds a server to our tag index; a new sequence number is assigned
+        to it unless one is specified.
+
+        """
+        if seq is None:
+            seq = next(self._index_counter)
+            self._index_seqs.append(seq)
+
+        self._index_servers[seq] = server
+        self._index_tags[seq] = frozenset(server.tags)
+        for tag in self._index_tags[seq]:
+            self._tag_index.setdefault(tag, set()).add(seq)
+
+        # Have the server tell us when its tags change
+        server._tag_owners.add(self)
+
+    def _index_remove(self, seq):
+        """
+        Removes a sequence number from our tag index (but not from our list
+        of sequence numbers) and returns the server it was assigned to
+
+        """
+        server = self._index_servers.pop(seq)
+        for tag in self._index_tags.pop(seq):
+            seqs = self._tag_index.get(tag)
+            if seqs is not None:
+                seqs.discard(seq)
+                if not seqs:
+                    del self._tag_index[tag]
+
+        return server
+
+    def _index_invalidate(self):
+        """
+        Called by our servers when their tags change
+
+        """
+        self._index_dirty = True
+
+    def _index_verify(self):
+        """
+        Rebuilds our tag index if the tags of one of our servers changed
+        since it was added, or if servers were added to (or removed from)
+        our server list directly (as opposed to using add(), pop() and
+        clear()).
+
+        Servers replaced directly in our server list can't be detected
+        cheaply; use our own item assignment for that instead.
+
+        """
+        if not self._index_dirty and \
+                len(self._index_seqs) == len(self.servers):
+            # We're in good shape
+            return
+
+        self._index_init()
+        for server in self.servers:
+            self._index_add(server)
+
+    def _select(self, tag):
+        """
+        Returns the servers matching our tag expression (in the order they
+        were added to our server list) using our tag index.
+
+        The tag expression is evaluated as follows:
+          - top level entries are treated as an 'or'
+          - second level (or more) entries are treated as 'and'
+
+          examples:
+            tag="tagA"                      = tagA
+            tag=['tagA', 'tagB']            = tagA or tagB
+            tag=[('tagA', 'tagC'), 'tagB']  = (tagA and tagC) or tagB
+            tag=[('tagB', 'tagC')]          = tagB and tagC
+
+        """
+        self._index_verify()
+
+        if not isinstance(tag, (list, tuple, set)):
+            # A single tag
+            tag = (tag, )
+
+        # The sequence numbers of the servers we matched
+        matched = set()
+
+        # Every entry here will be or'ed with the next
+        for entry in tag:
+            if isinstance(entry, (list, tuple, set)):
+                # treat these entries as though all elements found must exist
+                # in the notification service
+                tags = set(parse_list(entry))
+                if not tags:
+                    # An empty set of tags matches everything
+                    matched.update(self._index_seqs)
+                    break
+
+                # Intersect our smallest sets first
+                results = sorted(
+                    (self._tag_index.get(t, set()) for t in tags), key=len)
+                matched.update(results[0].intersection(*results[1:]))
+
+            else:
+                try:
+                    matched.update(self._tag_index.get(entry, ()))
+
+                except TypeError:
+                    # Unhashable entries never match anything
+                    continue
+
+        return [self._index_servers[seq] for seq in sorted(matched)]
+
     def notify(self, body, title='', notify_type=NotifyType.INFO,
-               body_format=None, tag=None):
+               body_format=None, tag=None, deadline=None, details=False,
+               block=True, priority=None):
         """
         Send a notification to all of the plugins previously loaded.
 
@@ -251,139 +751,623 @@ class Apprise(object):
         tagged value are notified.  By default all added services
         are notified (tag=None)
 
+        If a deadline is specified (either a number of seconds or a Deadline
+        object), then we return once it passes; servers that could not be
+        notified in time are skipped and tracked in the Deadline's skipped
+        list.
+
+        By default True is returned if all of the notifications were sent
+        successfully.  If details is set to True, an AppriseResult object
+        is returned instead; it evaluates the same way, but also contains
+        the outcome (and timing) of every server notified.
+
+        If block is set to False, then our notification is queued to be
+        sent in the background by our dispatcher and a Future is returned
+        right away; its result is what we would have otherwise returned.
+        The Future is cancelled if our notification is dropped because our
+        dispatcher's queue is full.  Queued notifications are sent in order
+        of their priority; it's based on the notify_type unless one is
+        specified (lower values are sent first).
+
         """
 
-        # Initialize our return result
-        status = len(self.servers) > 0
+        if not block:
+            with self._dispatcher_lock:
+                if self.dispatcher is None:
+                    self.dispatcher = Dispatcher()
+
+                dispatcher = self.dispatcher
+
+            return dispatcher.submit(
+                self.notify, priority=priority, notify_type=notify_type,
+                body=body, title=title, body_format=body_format, tag=tag,
+                deadline=deadline, details=details)
+
+        # Acquire the servers we're going to notify (and what to send them)
+        deadline, groups, status = self._notify_prepare(
+            body=body, title=title, body_format=body_format, tag=tag,
+            deadline=deadline)
+
+        if not groups:
+            # Nothing to notify
+            return AppriseResult(success=status) if details else status
+
+        # The outcome of each server notified
+        results = list()
+
+        if ThreadPoolExecutor is None or not self.max_workers or \
+                self.max_workers <= 1 or len(groups) <= 1:
+            # Send our notifications one at a time
+            for group in groups:
+                results.extend(self._notify_group(
+                    group, title=title, notify_type=notify_type,
+                    outbox=self.outbox, deadline=deadline,
+                    digest=self.digest, dedupe=self.dedupe,
+                    breakers=self.circuit_breakers))
 
+        else:
+            # Send our notifications concurrently; we only return after every
+            # one of them has completed (or our deadline passes)
+            executor = ThreadPoolExecutor(
+                max_workers=min(self.max_workers, len(groups)))
+
+            # The groups we stop waiting on once our deadline passes are cut
+            # off so that they no longer record their outcome
+            cutoffs = [
+                None if deadline is None else Cutoff() for _ in groups]
+
+            try:
+                futures = [
+                    executor.submit(
+                        self._notify_group, group, title=title,
+                        notify_type=notify_type, outbox=self.outbox,
+                        deadline=deadline, digest=self.digest,
+                        dedupe=self.dedupe, breakers=self.circuit_breakers,
+                        cutoff=cutoff)
+                    for (group, cutoff) in zip(groups, cutoffs)]
+
+                if deadline is not None:
+                    # Stop waiting once our deadline passes; the stragglers
+                    # give up on their own as soon as their socket timeouts
+                    # allow
+                    futures_wait(futures, timeout=deadline.remaining())
+
+                for (group, future, cutoff) in zip(groups, futures, cutoffs):
+                    if cutoff is not None and cutoff.cut():
+                        # We ran out of time waiting on this group
+                        results.extend(Apprise._unfinished(group, deadline))
+                        continue
+
+                    results.extend(future.result())
+
+            finally:
+                executor.shutdown(wait=deadline is None)
+
+        if self.outbox is not None:
+            # Write the notifications we failed to deliver
+            self.outbox.sync()
+
+        return self._notify_outcome(results, details=details)
+
+    def _notify_prepare(self, body, title='', body_format=None, tag=None,
+                        deadline=None):
+        """
+        Prepares a notify() call; returns its deadline (as a Deadline object
+        if it was specified), the groups of servers to notify (refer to
+        _notify_groups()) and the status to return if there are none.
+
+        """
         if not (title or body):
-            return False
+            # There is nothing to send
+            return deadline, [], False
+
+        if deadline is not None and not isinstance(deadline, Deadline):
+            deadline = Deadline(deadline)
+
+        groups = self._notify_groups(
+            body=body, body_format=body_format, tag=tag)
+
+        return deadline, groups, len(self.servers) > 0
+
+    @staticmethod
+    def _notify_outcome(results, details=False):
+        """
+        Returns what a notify() call that produced the results specified
+        returns; refer to notify().
+
+        """
+        status = all(result.success for result in results)
+        return AppriseResult(results, success=status) if details else status
+
+    def async_notify(self, body, title='', notify_type=NotifyType.INFO,
+                     body_format=None, tag=None, deadline=None,
+                     details=False):
+        """
+        Returns a coroutine that sends a notification to all of the plugins
+        previously loaded without blocking the event loop it's awaited in.
+
+        The arguments are identical to notify(); all of the matched servers
+        are notified concurrently.  This requires Python v3.5 or newer.
+
+        """
+        if not ASYNCIO_SUPPORT:
+            raise NotImplementedError(
+                'async_notify() requires Python v3.5 or newer.')
+
+        from .py3compat import asyncio as py3aio
+        return py3aio.apprise_notify(
+            self, body=body, title=title, notify_type=notify_type,
+            body_format=body_format, tag=tag, deadline=deadline,
+            details=details)
+
+    @classmethod
+    def convert(cls, body, body_format, notify_format):
+        """
+        Converts the body from its body_format to the specified notify_format
+        (if required) and returns it.
+
+        Conversions are cached (keyed by a digest of the body and both of the
+        formats) in our conversion_cache.
+
+        """
+        if not body or notify_format != NotifyFormat.HTML or \
+                body_format not in (NotifyFormat.MARKDOWN, NotifyFormat.TEXT):
+            # No conversion required
+            return body
+
+        key = (cls._digest(body), body_format, notify_format)
+        converted = cls.conversion_cache.get(key)
+        if converted is not None:
+            return converted
+
+        if body_format == NotifyFormat.MARKDOWN:
+            # We import markdown here so that it is only loaded if required
+            from markdown import markdown
+
+            # Apply Markdown
+            converted = markdown(body)
+
+        else:
+            # Execute our map against our body in addition to swapping
+            # out new lines and replacing them with <br/>
+            converted = TEXT_TO_HTML_NEWLINE_RE.sub(
+                '<br/>\r\n', TEXT_TO_HTML_RE.sub(
+                    lambda x: TEXT_TO_HTML_MAP[x.group()], body))
+
+        cls.conversion_cache.set(key, converted)
+        return converted
+
+    @staticmethod
+    def _digest(content):
+        """
+        Returns a digest of the specified content
+
+        """
+        try:
+            content = content.encode('utf-8')
+
+        except (AttributeError, UnicodeDecodeError):
+            # Python v2.7 str objects are already encoded
+            pass
+
+        return hashlib.sha1(content).hexdigest()
+
+    def _notify_groups(self, body, body_format=None, tag=None):
+        """
+        Returns the loaded servers matching the specified tag along with the
+        body (converted to the format each of them expects) they should be
+        sent.
+
+        The results are returned as a list of groups; each group is a list of
+        (server, body) tuples that all reference the same plugin instance.
+
+        """
 
         # Tracks conversions
         conversion_map = dict()
 
-        # Build our tag setup
-        #   - top level entries are treated as an 'or'
-        #   - second level (or more) entries are treated as 'and'
-        #
-        #   examples:
-        #     tag="tagA, tagB"                = tagA or tagB
-        #     tag=['tagA', 'tagB']            = tagA or tagB
-        #     tag=[('tagA', 'tagC'), 'tagB']  = (tagA and tagC) or tagB
-        #     tag=[('tagB', 'tagC')]          = tagB and tagC
-
-        # Iterate over our loaded plugins
-        for server in self.servers:
+        # Tracks the servers we're going to notify along with the body we'll
+        # be sending each of them
+        targets = list()
 
-            if tag is not None:
+        # Iterate over our loaded plugins matching our tag (if specified)
+        for server in (self.servers if tag is None else self._select(tag)):
 
-                if isinstance(tag, (list, tuple, set)):
-                    # using the tags detected; determine if we'll allow the
-                    # notification to be sent or not
-                    matched = False
+            # Convert our body (once per format) to what the server expects
+            if server.notify_format not in conversion_map:
+                with self.hooks.stage(
+                        HookStage.CONVERT, body=body, body_format=body_format,
+                        notify_format=server.notify_format):
+                    conversion_map[server.notify_format] = self.convert(
+                        body, body_format, server.notify_format)
+
+            # Store our server and the content we'll be sending it
+            targets.append((server, conversion_map[server.notify_format]))
+
+        # Group our targets by their instance; the same plugin instance can be
+        # loaded more then once.  Each group is always processed in order by a
+        # single thread so that the messages it receives stay in sequence.
+        groups = list()
+        lookup = dict()
+        for (server, content) in targets:
+            if id(server) not in lookup:
+                lookup[id(server)] = list()
+                groups.append(lookup[id(server)])
+            lookup[id(server)].append((server, content))
+
+        return groups
 
-                    # Every entry here will be or'ed with the next
-                    for entry in tag:
-                        if isinstance(entry, (list, tuple, set)):
+    @staticmethod
+    def _skip(result, reason):
+        """
+        Flags a result as skipped; its server was not notified for the
+        specified reason.  This is tracked by the
+        apprise_notify_skipped_total metric.
 
-                            # treat these entries as though all elements found
-                            # must exist in the notification service
-                            tags = set(parse_list(entry))
+        """
+        result.skipped = True
 
-                            if len(tags.intersection(
-                                   server.tags)) == len(tags):
-                                # our set contains all of the entries found
-                                # in our notification server object
-                                matched = True
-                                break
+        server = result.server
+        if server.metrics.sinks:
+            server.metrics.increment(
+                'apprise_notify_skipped_total',
+                server.metric_labels(reason=reason))
 
-                        elif entry in server:
-                            # our entr(ies) match what was found in our server
-                            # object.
-                            matched = True
-                            break
+    @staticmethod
+    def _unfinished(group, deadline):
+        """
+        Returns the results of a group whose notifications did not complete
+        before our deadline passed; their outcome is unknown so they're
+        tracked as skipped.
 
-                        # else: keep looking
+        """
+        results = list()
+        for (server, _) in group:
+            logging.warning(
+                'Giving up on {} notification; our deadline has '
+                'passed.'.format(server.service_name or 'unknown'))
 
-                    if not matched:
-                        # We did not meet any of our and'ed criteria
-                        continue
+            result = NotifyResult(server)
+            result.error = DeadlineExceeded.__name__
+            deadline.skip(server)
+            Apprise._skip(result, reason='deadline')
+            results.append(result)
 
-                elif tag not in server:
-                    # one or more tags were defined and they didn't match the
-                    # entry in the current service; move along...
-                    continue
+        return results
 
-                # else: our content was found inside the server, so we're good
+    @staticmethod
+    def _coalesce(group, title='', notify_type=NotifyType.INFO, digest=None,
+                  dedupe=None, outbox=None, breakers=None):
+        """
+        Returns the (server, body, title, notify_type) entries to send for
+        each (server, body) entry in the group along with the results of the
+        ones suppressed as duplicates by the dedupe filter or held in the
+        digest (if specified).
 
-            # If our code reaches here, we either did not define a tag (it was
-            # set to None), or we did define a tag and the logic above
-            # determined we need to notify the service it's associated with
-            if server.notify_format not in conversion_map:
-                if body_format == NotifyFormat.MARKDOWN and \
-                        server.notify_format == NotifyFormat.HTML:
+        The digests flushed later on are delivered just like the rest of our
+        notifications; they honour our circuit breakers and the ones that
+        fail are added to the outbox (if specified).
 
-                    # Apply Markdown
-                    conversion_map[server.notify_format] = markdown(body)
+        """
+        if digest is None and dedupe is None:
+            # Everything is sent as is
+            return [
+                (server, body, title, notify_type)
+                for (server, body) in group], []
+
+        entries = list()
+        results = list()
+        for (server, body) in group:
+            if dedupe is not None and dedupe.seen(
+                    server, body=body, title=title, notify_type=notify_type):
+                # We recently sent the same notification
+                logging.info(
+                    'Suppressing duplicate {} notification.'.format(
+                        server.service_name or 'unknown'))
+                result = NotifyResult(server)
+                result.success = True
+                result.duplicate = True
+                Apprise._skip(result, reason='duplicate')
+                results.append(result)
+                continue
 
-                elif body_format == NotifyFormat.TEXT and \
-                        server.notify_format == NotifyFormat.HTML:
+            if digest is None:
+                entries.append((server, body, title, notify_type))
+                continue
 
-                    # Basic TEXT to HTML format map; supports keys only
-                    re_map = {
-                        # Support Ampersand
-                        r'&': '&amp;',
+            messages = digest.put(
+                server, body=body, title=title, notify_type=notify_type,
+                deliver=partial(
+                    Apprise._notify_digest, outbox=outbox,
+                    breakers=breakers))
+
+            if not messages:
+                # Our notification will be sent later on
+                result = NotifyResult(server)
+                result.success = True
+                result.deferred = True
+                results.append(result)
+                continue
 
-                        # Spaces to &nbsp; for formatting purposes since
-                        # multiple spaces are treated as one an this may not
-                        # be the callers intention
-                        r' ': '&nbsp;',
+            entries.extend(
+                (server, ) + message for message in messages)
 
-                        # Tab support
-                        r'\t': '&nbsp;&nbsp;&nbsp;',
+        return entries, results
 
-                        # Greater than and Less than Characters
-                        r'>': '&gt;',
-                        r'<': '&lt;',
-                    }
+    @staticmethod
+    def _notify_group(group, title='', notify_type=NotifyType.INFO,
+                      outbox=None, deadline=None, digest=None, dedupe=None,
+                      breakers=None, cutoff=None):
+        """
+        Sends a notification to each (server, body) entry in the group
+        sequentially.  Returns a list containing the NotifyResult of each
+        entry.
 
-                    # Compile our map
-                    re_table = re.compile(
-                        r'(' + '|'.join(map(re.escape, re_map.keys())) + r')',
-                        re.IGNORECASE,
-                    )
+        The notifications that fail are added to the outbox (if specified).
+        Servers are skipped once the deadline (if specified) passes.  If a
+        digest is specified, notifications are held in it and only the
+        digests that come due are sent.  Duplicate notifications are
+        suppressed if a dedupe filter is specified.  Servers are skipped
+        while their circuit breaker (if specified) is open.
 
-                    # Execute our map against our body in addition to swapping
-                    # out new lines and replacing them with <br/>
-                    conversion_map[server.notify_format] = \
-                        re.sub(r'\r*\n', '<br/>\r\n',
-                               re_table.sub(lambda x: re_map[x.group()], body))
+        Once our cutoff (if specified) is cut, we stop recording our
+        outcome and DeadlineExceeded is thrown instead.
 
-                else:
-                    # Store entry directly
-                    conversion_map[server.notify_format] = body
+        """
 
-            try:
-                # Send notification
-                if not server.notify(
-                        body=conversion_map[server.notify_format],
-                        title=title,
-                        notify_type=notify_type):
+        # Acquire what we're sending; our results include the notifications
+        # suppressed (or held in our digest)
+        entries, results = Apprise._coalesce(
+            group, title=title, notify_type=notify_type, digest=digest,
+            dedupe=dedupe, outbox=outbox, breakers=breakers)
 
-                    # Toggle our return status flag
-                    status = False
+        results.extend(Apprise._deliver(
+            entries, outbox=outbox, deadline=deadline, dedupe=dedupe,
+            breakers=breakers, cutoff=cutoff))
 
-            except TypeError:
-                # These our our internally thrown notifications
-                status = False
+        if cutoff is not None:
+            # Our outcome was recorded in full
+            cutoff.finish()
 
-            except Exception:
-                # A catch all so we don't have to abort early
-                # just because one of our plugins has a bug in it.
-                logging.exception("Notification Exception")
-                status = False
+        return results
+
+    @staticmethod
+    def _admit(server, deadline=None, breakers=None):
+        """
+        Returns the NotifyResult of a notification about to be sent to the
+        server specified along with its circuit breaker (if there is one).
+
+        The result is already flagged as skipped if our deadline (if
+        specified) passed or our server's circuit breaker is open; it isn't
+        to be notified then.
+
+        """
+        result = NotifyResult(server)
+
+        if deadline is not None and deadline.expired():
+            # We ran out of time
+            logging.warning(
+                'Skipping {} notification; our deadline has '
+                'passed.'.format(server.service_name or 'unknown'))
+            deadline.skip(server)
+            Apprise._skip(result, reason='deadline')
+            return result, None
+
+        breaker = breakers.breaker(server) \
+            if breakers is not None and breakers.threshold > 0 else None
+        if breaker is not None and not breaker.allow():
+            # Fail fast; our server is known to be unreachable
+            logging.warning(
+                'Skipping {} notification; its circuit breaker is '
+                'open.'.format(server.service_name or 'unknown'))
+            Apprise._skip(result, reason='circuit_open')
+            return result, None
+
+        return result, breaker
+
+    @staticmethod
+    def _failed(result, exception, deadline=None):
+        """
+        Tracks the exception the notification of our result's server was
+        aborted with; it's called from within the except clause that caught
+        it.
+
+        """
+        if isinstance(exception, DeadlineExceeded):
+            # We ran out of time; this isn't our server's fault
+            deadline.skip(result.server)
+            result.skipped = True
+
+        elif not isinstance(exception, TypeError):
+            # TypeErrors are thrown by our plugins internally; anything else
+            # is a bug in one of them (we don't have to abort early because
+            # of it though)
+            logging.exception("Notification Exception")
+
+        if result.error is None:
+            result.error = exception.__class__.__name__
+
+    @staticmethod
+    def _settle(result, breaker, body, title='', notify_type=NotifyType.INFO,
+                outbox=None, dedupe=None):
+        """
+        Records the outcome of a notification (as returned by _admit()) in
+        our server's circuit breaker (if specified); notifications that
+        failed are forgotten by the dedupe filter (if specified) and added
+        to the outbox (if specified).
+
+        """
+        server = result.server
+
+        if breaker is not None:
+            if result.skipped:
+                # Our outcome is unknown
+                breaker.cancel()
+
+            else:
+                breaker.record(result.success)
+
+        if not result.success and dedupe is not None:
+            # Don't suppress our next attempt
+            dedupe.forget(
+                server, body=body, title=title, notify_type=notify_type)
+
+        if not result.success and outbox is not None:
+            # Store our notification so it can be redelivered
+            outbox.put(
+                server, body=body, title=title, notify_type=notify_type)
+
+    @staticmethod
+    def _notify_digest(entries, outbox=None, deadline=None, breakers=None):
+        """
+        Sends the (server, body, title, notify_type) entries of a digest
+        flushed by AppriseDigest and returns a list containing the
+        NotifyResult of each.
+
+        Digests are delivered just like our other notifications; the ones
+        that fail are written to the outbox (if specified).
+
+        """
+        results = Apprise._deliver(
+            entries, outbox=outbox, deadline=deadline, breakers=breakers)
+
+        if outbox is not None:
+            # Write the digests we failed to deliver
+            outbox.sync()
+
+        return results
+
+    @staticmethod
+    def _deliver(entries, outbox=None, deadline=None, dedupe=None,
+                 breakers=None, cutoff=None):
+        """
+        Sends each (server, body, title, notify_type) entry sequentially and
+        returns a list containing the NotifyResult of each.
+
+        The notifications that fail are added to the outbox (if specified)
+        and forgotten by the dedupe filter (if specified).  Servers are
+        skipped once the deadline (if specified) passes or while their
+        circuit breaker (if specified) is open.  Outcomes are only recorded
+        until our cutoff (if specified) is cut.
+
+        """
+        results = list()
+
+        if cutoff is None:
+            # We're never cut off
+            cutoff = Cutoff()
+
+        for (server, body, title, notify_type) in entries:
+            with cutoff.recording():
+                result, breaker = Apprise._admit(
+                    server, deadline=deadline, breakers=breakers)
+            results.append(result)
+
+            if not result.skipped:
+                try:
+                    # Send notification
+                    with result:
+                        if deadline is None:
+                            result.success = server.notify(
+                                body=body,
+                                title=title,
+                                notify_type=notify_type)
+
+                        else:
+                            with deadline:
+                                result.success = server.notify(
+                                    body=body,
+                                    title=title,
+                                    notify_type=notify_type)
+
+                except Exception as e:
+                    with cutoff.recording(breaker):
+                        Apprise._failed(result, e, deadline=deadline)
+
+            with cutoff.recording(breaker):
+                Apprise._settle(
+                    result, breaker, body=body, title=title,
+                    notify_type=notify_type, outbox=outbox, dedupe=dedupe)
+
+        return results
+
+    @property
+    def queue_depth(self):
+        """
+        Returns the number of notifications waiting to be sent in the
+        background
+        """
+        return 0 if self.dispatcher is None else self.dispatcher.depth
+
+    def flush(self, timeout=None):
+        """
+        Waits for the notifications queued (with notify(block=False)) to be
+        sent; returns True if they were or False if our timeout (in seconds)
+        passed first.
+
+        """
+        return True if self.dispatcher is None \
+            else self.dispatcher.flush(timeout=timeout)
+
+    def close(self, timeout=None):
+        """
+        Waits (for up to timeout seconds) for the notifications queued to be
+        sent and then stops our dispatcher; anything still queued is
+        cancelled.  Returns True if every notification queued was sent.
+
+        """
+        with self._dispatcher_lock:
+            dispatcher = self.dispatcher
+            self.dispatcher = None
+
+        return True if dispatcher is None \
+            else dispatcher.close(timeout=timeout)
+
+    def circuit_state(self):
+        """
+        Returns the state of the circuit breaker associated with each of our
+        loaded servers as a dictionary keyed (in the same order as our
+        servers) by CircuitBreakers.key(); our keys never contain the
+        credentials found in their URLs.  Each state is a dictionary
+        containing the 'state' ('closed', 'open' or 'half-open'), the number
+        of consecutive 'failures' and the number of seconds before an open
+        breaker lets a notification through ('retry_in').
+
+        Every breaker is reported as closed if we have no circuit breakers.
+
+        """
+        response = OrderedDict()
+        for server in self.servers:
+            breaker = None if self.circuit_breakers is None \
+                else self.circuit_breakers.get(server)
+            if breaker is None:
+                # We've never notified this server
+                state = {
+                    'state': CircuitState.CLOSED,
+                    'failures': 0,
+                    'retry_in': 0.0,
+                }
+
+            else:
+                state = breaker.state()
+
+            response[CircuitBreakers.key(server)] = state
 
-        return status
+        return response
+
+    def circuit_reset(self):
+        """
+        Closes the circuit breakers associated with our loaded servers
+
+        """
+        if self.circuit_breakers is None:
+            # Nothing to reset
+            return
+
+        for server in self.servers:
+            breaker = self.circuit_breakers.get(server)
+            if breaker is not None:
+                breaker.reset()
 
     def details(self):
         """
@@ -401,14 +1385,11 @@ class Apprise(object):
             'asset': self.asset.details(),
         }
 
-        # to add it's mapping to our hash table
-        for entry in sorted(dir(plugins)):
+        # Iterate over all of our plugins (this loads each of them)
+        for entry in sorted(plugins.PLUGIN_MANIFEST):
 
             # Get our plugin
             plugin = getattr(plugins, entry)
-            if not hasattr(plugin, 'app_id'):  # pragma: no branch
-                # Filter out non-notification modules
-                continue
 
             # Standard protocol(s) should be None or a tuple
             protocols = getattr(plugin, 'protocol', None)
@@ -443,8 +1424,30 @@ class Apprise(object):
         returns it.
         """
 
+        self._index_verify()
+
+        # Remove our entry from our index
+        self._index_remove(self._index_seqs.pop(index))
+
         # Remove our entry
-        return self.servers.pop(index)
+        server = self.servers.pop(index)
+        self._release(server)
+        return server
+
+    def _release(self, server):
+        """
+        Detaches a server that was removed from our server list
+
+        """
+        if server in self.servers:
+            # The server was added more then once
+            return
+
+        if server.hooks.parent is self.hooks:
+            # Our hooks no longer apply
+            server.hooks.parent = None
+
+        server._tag_owners.discard(self)
 
     def __getitem__(self, index):
         """
@@ -452,6 +1455,31 @@ class Apprise(object):
         """
         return self.servers[index]
 
+    def __setitem__(self, index, server):
+        """
+        Replaces the indexed server entry with another (instantiated)
+        notification server
+        """
+        if not isinstance(server, NotifyBase):
+            raise TypeError(
+                'Expected a notification server, not {}'.format(
+                    type(server).__name__))
+
+        self._index_verify()
+
+        # Our replacement takes over the sequence number of the server it
+        # replaces so that it keeps its position
+        seq = self._index_seqs[index]
+        self._index_remove(seq)
+
+        previous = self.servers[index]
+        self.servers[index] = server
+        self._release(previous)
+
+        # Our hooks are fired along with the server's own
+        server.hooks.parent = self.hooks
+        self._index_add(server, seq=seq)
+
     def __iter__(self):
         """
         Returns an iterator to our server list
@@ -67,6 +67,12 @@ class AppriseAsset(object):
     # The default theme
     theme = 'default'
 
+    # The number of seconds our notification services wait to establish a
+    # connection to a remote server, and the number of seconds they wait for
+    # a response once connected.  Set these to None to wait forever.
+    socket_connect_timeout = 4.0
+    socket_read_timeout = 4.0
+
     # Image URL Mask
     image_url_mask = \
         'https://github.com/caronc/apprise/raw/master/apprise/assets/' \
@@ -87,7 +93,8 @@ class AppriseAsset(object):
     ))
 
     def __init__(self, theme='default', image_path_mask=None,
-                 image_url_mask=None, default_extension=None):
+                 image_url_mask=None, default_extension=None,
+                 socket_connect_timeout=None, socket_read_timeout=None):
         """
         Asset Initialization
 
@@ -104,6 +111,12 @@ class AppriseAsset(object):
         if default_extension is not None:
             self.default_extension = default_extension
 
+        if socket_connect_timeout is not None:
+            self.socket_connect_timeout = socket_connect_timeout
+
+        if socket_read_timeout is not None:
+            self.socket_read_timeout = socket_read_timeout
+
     def color(self, notify_type, color_type=None):
         """
         Returns an HTML mapped color based on passed in notify type
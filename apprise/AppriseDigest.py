@@ -0,0 +1,324 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2019 Chris Caron <lead2gold@gmail.com>
+# All rights reserved.
+#
+# This code is licensed under the MIT License.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files(the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and / or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions :
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import logging
+import threading
+
+from xml.sax.saxutils import escape
+
+from .common import NotifyType
+from .common import NotifyFormat
+from .deadline import Deadline
+
+try:
+    # Python 3.3+
+    from time import monotonic
+
+except ImportError:  # pragma: no cover
+    # Python 2.7
+    from time import time as monotonic
+
+logger = logging.getLogger(__name__)
+
+# Our notification types (most severe first); a digest is sent using the
+# most severe type of the notifications it contains
+DIGEST_SEVERITY = (
+    NotifyType.FAILURE,
+    NotifyType.WARNING,
+    NotifyType.SUCCESS,
+    NotifyType.INFO,
+)
+
+# How each notification is presented in a digest (and what separates them)
+# based on the format of the server being notified
+DIGEST_TEMPLATES = {
+    NotifyFormat.TEXT: ('{title}\r\n{body}', '\r\n\r\n'),
+    NotifyFormat.MARKDOWN: ('**{title}**\r\n{body}', '\r\n\r\n'),
+    NotifyFormat.HTML: ('<b>{title}</b><br/>{body}', '<br/><br/>'),
+}
+
+
+class AppriseDigest(object):
+    """
+    Coalesces the notifications sent to each server into digests.
+
+    Notifications are held (per server) until the first of them has been
+    held for window seconds, or until max_messages of them are collected;
+    they are then sent together as one message (or as few as possible if
+    they don't all fit within the server's body_maxlen).
+
+    Held notifications that come due are sent the next time the same server
+    is notified; start() a background thread (or call flush() yourself) to
+    have them sent even if it never is.  Either way, digests are delivered
+    by Apprise just like any other notification (honouring its circuit
+    breakers, outbox, hooks and metrics).
+
+    """
+
+    # The number of seconds notifications are held for
+    window = 60.0
+
+    # The maximum number of notifications held for a server; set this to
+    # zero (0) to only be bound by our window.
+    max_messages = 100
+
+    # The notification types that are never held; they are sent right away
+    bypass = ()
+
+    # The title of a digest containing more then one notification
+    title = '{count} notifications'
+
+    def __init__(self, window=None, max_messages=None, bypass=None):
+        """
+        Initialize our digest
+
+        Any argument not specified uses the default defined by the class.
+
+        """
+        if window is not None:
+            self.window = max(0.0, float(window))
+
+        if max_messages is not None:
+            self.max_messages = max(0, int(max_messages))
+
+        if bypass is not None:
+            self.bypass = tuple(bypass)
+
+        # The notifications held for each server (keyed by their id); each
+        # entry is a (server, started, notifications, deliver) list
+        self._held = dict()
+
+        # Protects our held notifications from concurrent access
+        self._lock = threading.Lock()
+
+        # Our background flush worker (if started)
+        self._worker = None
+        self._stop = threading.Event()
+
+    def put(self, server, body, title='', notify_type=NotifyType.INFO,
+            deliver=None):
+        """
+        Holds a notification for the specified server.
+
+        Returns the (body, title, notify_type) messages that are now due to
+        be sent to the server; this is empty if our notification is being
+        held.  Notifications that bypass our digest are returned as is.
+
+        The digests flush() sends are passed to deliver (if specified) as a
+        list of (server, body, title, notify_type) entries; it returns the
+        NotifyResult of each.  Apprise provides this so that its digests are
+        delivered the same way its other notifications are.
+
+        """
+        if notify_type in self.bypass:
+            # Send our notification right away
+            return [(body, title, notify_type)]
+
+        with self._lock:
+            entry = self._held.get(id(server))
+            if entry is None:
+                entry = [server, monotonic(), list(), deliver]
+                self._held[id(server)] = entry
+
+            elif deliver is not None:
+                # Our most recent means of delivery is used
+                entry[3] = deliver
+
+            entry[2].append((body, title, notify_type))
+
+            if not self._due(entry, monotonic()):
+                # Keep holding on to our notifications
+                return []
+
+            del self._held[id(server)]
+
+        return self.compose(server, entry[2])
+
+    def flush(self, force=False, deadline=None):
+        """
+        Sends the notifications that are due (or all of them if force is
+        set) to their servers.  Returns True if every digest was sent
+        successfully.
+
+        If a deadline is specified (either a number of seconds or a Deadline
+        object), then the digests that could not be sent before it passed
+        are skipped just as they are by Apprise.notify().
+
+        """
+        if deadline is not None and not isinstance(deadline, Deadline):
+            deadline = Deadline(deadline)
+
+        reference = monotonic()
+
+        with self._lock:
+            entries = [
+                entry for entry in self._held.values()
+                if force or self._due(entry, reference)]
+
+            for entry in entries:
+                del self._held[id(entry[0])]
+
+        status = True
+        for (server, _, notifications, deliver) in entries:
+            if deliver is None:
+                # Avoid a circular import
+                from .Apprise import Apprise
+                deliver = Apprise._notify_digest
+
+            try:
+                results = deliver([
+                    (server, ) + message
+                    for message in self.compose(server, notifications)],
+                    deadline=deadline)
+
+            except Exception:
+                logger.exception("Digest Notification Exception")
+                status = False
+                continue
+
+            if not all(result.success for result in results):
+                status = False
+
+        return status
+
+    def compose(self, server, notifications):
+        """
+        Returns the (body, title, notify_type) messages that combine the
+        specified notifications for the server.
+
+        Notifications are combined into as few messages as will fit within
+        the server's body_maxlen; a single notification is always sent as
+        it was.
+
+        """
+        if len(notifications) == 1:
+            return list(notifications)
+
+        template, separator = DIGEST_TEMPLATES.get(
+            server.notify_format, DIGEST_TEMPLATES[NotifyFormat.TEXT])
+
+        # Our title is placed in our body if the server can't display it
+        limit = server.body_maxlen
+        if server.title_maxlen <= 0:
+            limit -= len(self.title.format(count=len(notifications))) + 2
+
+        # Our digests; each is a list of (content, notification) entries
+        digests = [[]]
+        length = 0
+
+        for notification in notifications:
+            (body, title, _) = notification
+            if title:
+                content = template.format(
+                    title=escape(title)
+                    if server.notify_format == NotifyFormat.HTML else title,
+                    body=body)
+
+            else:
+                content = body
+
+            size = len(content) + (len(separator) if digests[-1] else 0)
+            if digests[-1] and length + size > limit:
+                # Start a new digest
+                digests.append([])
+                size = len(content)
+                length = 0
+
+            digests[-1].append((content, notification))
+            length += size
+
+        messages = list()
+        for digest in digests:
+            if len(digest) == 1:
+                # Nothing was combined with this notification; send it as is
+                messages.append(digest[0][1])
+                continue
+
+            types = set(n[2] for (_, n) in digest)
+            messages.append((
+                separator.join(content for (content, _) in digest),
+                self.title.format(count=len(digest)),
+                next((t for t in DIGEST_SEVERITY if t in types),
+                     NotifyType.INFO),
+            ))
+
+        return messages
+
+    def start(self, interval=None):
+        """
+        Starts a background thread that sends the notifications that come
+        due every interval seconds (by default a tenth of our window).
+
+        """
+        if self._worker is not None and self._worker.is_alive():
+            # Already running
+            return
+
+        if interval is None:
+            interval = max(0.1, self.window / 10.0)
+
+        def worker():
+            while not self._stop.wait(interval):
+                try:
+                    self.flush()
+
+                except Exception:
+                    # Never let our worker die
+                    logger.exception("Digest Exception")
+
+        self._stop.clear()
+        self._worker = threading.Thread(target=worker, name='AppriseDigest')
+        self._worker.daemon = True
+        self._worker.start()
+
+    def stop(self, deadline=None):
+        """
+        Stops our background thread (if running) and sends every
+        notification we're still holding on to (honouring the deadline if
+        one is specified).
+
+        """
+        if self._worker is not None:
+            self._stop.set()
+            self._worker.join()
+            self._worker = None
+
+        return self.flush(force=True, deadline=deadline)
+
+    def _due(self, entry, reference):
+        """
+        Returns True if the notifications held in the entry should be sent;
+        this function expects our lock to already be held.
+
+        """
+        return reference - entry[1] >= self.window or (
+            self.max_messages > 0 and len(entry[2]) >= self.max_messages)
+
+    def __len__(self):
+        """
+        Returns the number of notifications we're holding on to
+        """
+        with self._lock:
+            return sum(len(entry[2]) for entry in self._held.values())
@@ -0,0 +1,396 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2019 Chris Caron <lead2gold@gmail.com>
+# All rights reserved.
+#
+# This code is licensed under the MIT License.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files(the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and / or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions :
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import os
+import logging
+import threading
+
+from time import time
+from os.path import join
+from os.path import isdir
+from os.path import isfile
+from os.path import expanduser
+
+from .common import NotifyType
+
+logger = logging.getLogger(__name__)
+
+# The table our notifications are stored in
+OUTBOX_SCHEMA = (
+    'CREATE TABLE IF NOT EXISTS outbox ('
+    'id INTEGER PRIMARY KEY AUTOINCREMENT, '
+    'url TEXT NOT NULL, '
+    'title TEXT, '
+    'body TEXT, '
+    'notify_type TEXT NOT NULL, '
+    'attempts INTEGER NOT NULL DEFAULT 0, '
+    'created REAL NOT NULL, '
+    'updated REAL NOT NULL)'
+)
+
+
+class AppriseOutbox(object):
+    """
+    A persistent outbox (backed by an SQLite database) that notifications
+    which could not be delivered are stored in until they can be redelivered.
+
+    Notifications are identified by the URL of the server they were meant
+    for; the URLs stored contain the credentials needed to notify them so
+    the database is only made accessible to the user who created it.  Only
+    the servers whose URL describes them completely (refer to
+    NotifyBase.url_lossless()) can have their notifications stored.
+
+    """
+
+    # The name of the database kept in our outbox directory
+    filename = 'outbox.db'
+
+    # The maximum number of notifications our outbox holds on to; the oldest
+    # ones are discarded first.
+    max_entries = 1000
+
+    # Notifications are written to our outbox in batches; they're held in
+    # memory until this many are collected, or until sync() is called.
+    batch_size = 50
+
+    # The number of delivery attempts made before a notification is
+    # discarded. Set this to zero (0) to keep trying forever.
+    max_attempts = 0
+
+    # The number of seconds to wait for our database if it is locked
+    timeout = 10.0
+
+    def __init__(self, path, max_entries=None, batch_size=None,
+                 max_attempts=None):
+        """
+        Initialize our outbox; the path identifies the directory our database
+        is kept in. It is created if it doesn't already exist.
+
+        Any other argument not specified uses the default defined by the
+        class.
+
+        """
+        try:
+            # SQLite is only loaded when an outbox is actually used
+            import sqlite3
+
+        except ImportError:  # pragma: no cover
+            # Python was built without SQLite support
+            raise NotImplementedError(
+                'The outbox requires Python to be built with SQLite support.')
+
+        self._sqlite3 = sqlite3
+
+        self.path = expanduser(path)
+
+        if max_entries is not None:
+            self.max_entries = max_entries
+
+        if batch_size is not None:
+            self.batch_size = batch_size
+
+        if max_attempts is not None:
+            self.max_attempts = max_attempts
+
+        # Notifications waiting to be written to our database
+        self._pending = list()
+
+        # Protects our pending notifications from concurrent access
+        self._lock = threading.Lock()
+
+        # Only one delivery is performed at a time
+        self._deliver_lock = threading.Lock()
+
+        # Our background delivery worker (if started)
+        self._worker = None
+        self._stop = threading.Event()
+
+    @property
+    def database(self):
+        """
+        Returns the path to our database
+        """
+        return join(self.path, self.filename)
+
+    def put(self, server, body, title='', notify_type=NotifyType.INFO):
+        """
+        Adds a notification that could not be delivered to the specified
+        server into our outbox.  Returns True if it was added and False if
+        it could not be.
+
+        """
+        if not server.url_lossless():
+            # We'd otherwise redeliver our notification somewhere else (or
+            # not at all) later on
+            logger.warning(
+                '{} notifications can not be stored in the outbox.'.format(
+                    server.service_name or server.__class__.__name__))
+            return False
+
+        url = server.url()
+
+        with self._lock:
+            self._pending.append(
+                (url, title, body, notify_type, time()))
+            sync = len(self._pending) >= self.batch_size
+
+        if sync:
+            # Write our batch
+            return self.sync()
+
+        return True
+
+    def sync(self):
+        """
+        Writes the notifications added to our outbox to our database.  Returns
+        True if successful and False if they could not be written (they are
+        then kept until the next time sync() is called).
+
+        """
+        with self._lock:
+            pending = self._pending
+            self._pending = list()
+
+        if not pending:
+            # Nothing to write
+            return True
+
+        try:
+            conn = self._connect()
+            try:
+                with conn:
+                    conn.executemany(
+                        'INSERT INTO outbox (url, title, body, notify_type, '
+                        'attempts, created, updated) '
+                        'VALUES (?, ?, ?, ?, 0, ?, ?)',
+                        [entry + (entry[-1], ) for entry in pending])
+
+                    # Enforce our size limit
+                    cursor = conn.execute(
+                        'DELETE FROM outbox WHERE id NOT IN ('
+                        'SELECT id FROM outbox ORDER BY id DESC LIMIT ?)',
+                        (max(0, self.max_entries), ))
+
+                    if cursor.rowcount > 0:
+                        logger.warning(
+                            'Discarded {} notification(s) from the full '
+                            'outbox.'.format(cursor.rowcount))
+
+            finally:
+                conn.close()
+
+        except (OSError, IOError, self._sqlite3.Error) as e:
+            logger.error(
+                'Could not write to the outbox {}.'.format(self.database))
+            logger.debug('Outbox Exception: %s' % str(e))
+
+            # Hold on to our notifications so we can try again later
+            with self._lock:
+                self._pending = pending + self._pending
+
+            return False
+
+        logger.debug(
+            'Wrote {} notification(s) to the outbox.'.format(len(pending)))
+        return True
+
+    def deliver(self, asset=None):
+        """
+        Attempts to redeliver the notifications held in our outbox; the ones
+        successfully delivered are removed.  Returns True if our outbox is
+        empty afterwards and False if it isn't.
+
+        """
+        # Avoid a circular import
+        from .Apprise import Apprise
+
+        with self._deliver_lock:
+            # Write anything still pending to our database first
+            synced = self.sync()
+
+            if not isfile(self.database):
+                # Nothing was ever stored in our outbox
+                return synced
+
+            try:
+                conn = self._connect()
+                try:
+                    entries = conn.execute(
+                        'SELECT id, url, title, body, notify_type, attempts '
+                        'FROM outbox ORDER BY id').fetchall()
+
+                finally:
+                    conn.close()
+
+            except (OSError, IOError, self._sqlite3.Error) as e:
+                logger.error(
+                    'Could not read the outbox {}.'.format(self.database))
+                logger.debug('Outbox Exception: %s' % str(e))
+                return False
+
+            # Our servers (keyed by their URL)
+            servers = dict()
+
+            # The notifications delivered and the ones that failed
+            delivered = list()
+            failed = list()
+
+            for (_id, url, title, body, notify_type, attempts) in entries:
+                if url not in servers:
+                    servers[url] = Apprise.instantiate(url, asset=asset)
+
+                server = servers[url]
+                if server is None:
+                    # We couldn't load our server (or it failed earlier on);
+                    # don't bother trying again until our next delivery
+                    failed.append((_id, attempts))
+                    continue
+
+                try:
+                    status = server.notify(
+                        body=body, title=title, notify_type=notify_type)
+
+                except Exception:
+                    logger.exception("Outbox Notification Exception")
+                    status = False
+
+                if status:
+                    delivered.append(_id)
+
+                else:
+                    # Keep our notifications in order
+                    servers[url] = None
+                    failed.append((_id, attempts))
+
+            # Notifications that have been attempted too many times
+            discarded = [
+                _id for (_id, attempts) in failed
+                if self.max_attempts > 0
+                and attempts + 1 >= self.max_attempts]
+
+            if discarded:
+                logger.warning(
+                    'Discarded {} notification(s) from the outbox after {} '
+                    'attempts.'.format(len(discarded), self.max_attempts))
+
+            try:
+                conn = self._connect()
+                try:
+                    with conn:
+                        conn.executemany(
+                            'DELETE FROM outbox WHERE id = ?',
+                            [(_id, ) for _id in delivered + discarded])
+
+                        conn.executemany(
+                            'UPDATE outbox SET attempts = attempts + 1, '
+                            'updated = ? WHERE id = ?',
+                            [(time(), _id) for (_id, _) in failed])
+
+                finally:
+                    conn.close()
+
+            except (OSError, IOError, self._sqlite3.Error) as e:
+                logger.error(
+                    'Could not update the outbox {}.'.format(self.database))
+                logger.debug('Outbox Exception: %s' % str(e))
+                return False
+
+            logger.info(
+                'Redelivered {} of {} notification(s) from the outbox.'
+                .format(len(delivered), len(entries)))
+
+            return synced and len(failed) == len(discarded)
+
+    def start(self, interval=60, asset=None):
+        """
+        Starts a background thread that attempts to redeliver the contents of
+        our outbox every interval seconds.
+
+        """
+        if self._worker is not None and self._worker.is_alive():
+            # Already running
+            return
+
+        def worker():
+            while not self._stop.wait(interval):
+                try:
+                    self.deliver(asset=asset)
+
+                except Exception:
+                    # Never let our worker die
+                    logger.exception("Outbox Exception")
+
+        self._stop.clear()
+        self._worker = threading.Thread(target=worker, name='AppriseOutbox')
+        self._worker.daemon = True
+        self._worker.start()
+
+    def stop(self):
+        """
+        Stops our background thread (if running); any pending notifications
+        are written to our database.
+
+        """
+        if self._worker is not None:
+            self._stop.set()
+            self._worker.join()
+            self._worker = None
+
+        self.sync()
+
+    def _connect(self):
+        """
+        Returns a connection to our database; it is created (only accessible
+        to the current user) if it doesn't already exist.
+
+        """
+        if not isdir(self.path):
+            os.makedirs(self.path, 0o700)
+
+        if not isfile(self.database):
+            os.close(os.open(
+                self.database, os.O_WRONLY | os.O_CREAT, 0o600))
+
+        conn = self._sqlite3.connect(self.database, timeout=self.timeout)
+        conn.execute(OUTBOX_SCHEMA)
+        return conn
+
+    def __len__(self):
+        """
+        Returns the number of notifications held in our outbox
+        """
+        with self._lock:
+            count = len(self._pending)
+
+        if not isfile(self.database):
+            return count
+
+        conn = self._connect()
+        try:
+            return count + conn.execute(
+                'SELECT COUNT(*) FROM outbox').fetchone()[0]
+
+        finally:
+            conn.close()
@@ -0,0 +1,244 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2019 Chris Caron <lead2gold@gmail.com>
+# All rights reserved.
+#
+# This code is licensed under the MIT License.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files(the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and / or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions :
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import threading
+
+try:
+    # Python 3.3+
+    from time import monotonic
+
+except ImportError:  # pragma: no cover
+    # Python 2.7
+    from time import time as monotonic
+
+
+class NotifyResult(object):
+    """
+    The outcome of notifying a single server.
+
+    While a result is active (using it as a context manager), the server
+    being notified records the details of its work in it: the number of
+    chunks sent, the time spent throttling and the HTTP status (or the
+    exception) its requests ended with.
+
+    """
+
+    # Tracks the results active in each thread
+    _local = threading.local()
+
+    def __init__(self, server):
+        """
+        Initialize our result
+
+        """
+        # The server notified
+        self.server = server
+
+        # Whether or not our notification was successful
+        self.success = False
+
+        # Set if our server was skipped (without being notified)
+        self.skipped = False
+
+        # Set if our notification was held (in a digest) to be sent later on
+        self.deferred = False
+
+        # Set if our notification was suppressed as a duplicate of one
+        # recently sent
+        self.duplicate = False
+
+        # The HTTP status code of the last response received (if any)
+        self.status = None
+
+        # The name of the exception class that caused our notification to
+        # fail (if any)
+        self.error = None
+
+        # The number of chunks (messages) successfully sent
+        self.chunks = 0
+
+        # The number of bytes (of content) successfully sent
+        self.bytes = 0
+
+        # The number of seconds spent throttling
+        self.throttle = 0.0
+
+        # The number of seconds it took to notify our server
+        self.latency = 0.0
+
+        # The (monotonic) time we started at
+        self._started = None
+
+    @property
+    def url(self):
+        """
+        Returns the URL of the server notified without any of its
+        credentials (refer to NotifyBase.url_privacy()); use server.url()
+        for the URL itself.
+        """
+        return self.server.url_privacy()
+
+    def sent(self, chunk):
+        """
+        Tracks a chunk (as returned by _apply_overflow()) that was sent
+        successfully.
+
+        """
+        self.chunks += 1
+
+        for content in (chunk['title'], chunk['body']):
+            if not content:
+                continue
+
+            try:
+                self.bytes += len(content.encode('utf-8'))
+
+            except UnicodeDecodeError:  # pragma: no cover
+                # Python v2.7 byte strings are already encoded
+                self.bytes += len(content)
+
+    @classmethod
+    def current(cls):
+        """
+        Returns the result active in the current thread (if any)
+        """
+        stack = getattr(cls._local, 'stack', None)
+        return stack[-1] if stack else None
+
+    def __enter__(self):
+        """
+        Activates our result in the current thread and starts timing
+        """
+        if not hasattr(self._local, 'stack'):
+            self._local.stack = list()
+
+        self._local.stack.append(self)
+        self._started = monotonic()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        Deactivates our result
+        """
+        self.latency += monotonic() - self._started
+        self._local.stack.pop()
+
+        if exc_type is not None and self.error is None:
+            # Track the exception we're leaving with
+            self.error = exc_type.__name__
+
+    def __bool__(self):
+        """
+        Returns True if our notification was successful
+        """
+        return self.success
+
+    def __nonzero__(self):
+        """
+        Python v2.7 equivalent of __bool__()
+        """
+        return self.success
+
+    def __repr__(self):
+        """
+        Returns a printable version of our result
+        """
+        return '<NotifyResult url={} success={} status={} error={} ' \
+            'chunks={} throttle={:.3f}s latency={:.3f}s>'.format(
+                self.url, self.success, self.status, self.error,
+                self.chunks, self.throttle, self.latency)
+
+
+class AppriseResult(object):
+    """
+    The outcome of an Apprise.notify() call; it contains a NotifyResult for
+    every server we (attempted to) notify.
+
+    It evaluates to True if our notification was successful.
+
+    """
+
+    def __init__(self, results=None, success=False):
+        """
+        Initialize our result
+
+        """
+        # The results of each server notified
+        self.results = list(results) if results else list()
+
+        # Whether or not our notification was successful
+        self.success = success
+
+    @property
+    def failed(self):
+        """
+        Returns the results of the servers that failed to be notified
+        """
+        return [result for result in self.results if not result.success]
+
+    @property
+    def skipped(self):
+        """
+        Returns the results of the servers that were skipped
+        """
+        return [result for result in self.results if result.skipped]
+
+    @property
+    def suppressed(self):
+        """
+        Returns the results of the servers whose notification was suppressed
+        as a duplicate
+        """
+        return [result for result in self.results if result.duplicate]
+
+    def __iter__(self):
+        """
+        Iterates over the results of each server notified
+        """
+        return iter(self.results)
+
+    def __len__(self):
+        """
+        Returns the number of servers notified
+        """
+        return len(self.results)
+
+    def __getitem__(self, index):
+        """
+        Returns the result at the specified index
+        """
+        return self.results[index]
+
+    def __bool__(self):
+        """
+        Returns True if our notification was successful
+        """
+        return self.success
+
+    def __nonzero__(self):
+        """
+        Python v2.7 equivalent of __bool__()
+        """
+        return self.success
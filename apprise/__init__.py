@@ -39,10 +39,16 @@ from .common import NotifyFormat
 from .common import NOTIFY_FORMATS
 from .common import OverflowMode
 from .common import OVERFLOW_MODES
+from .common import QueuePolicy
+from .common import QUEUE_POLICIES
 from .plugins.NotifyBase import NotifyBase
 
 from .Apprise import Apprise
 from .AppriseAsset import AppriseAsset
+from .AppriseDigest import AppriseDigest
+from .AppriseOutbox import AppriseOutbox
+from .AppriseResult import AppriseResult
+from .AppriseResult import NotifyResult
 
 # Set default logging handler to avoid "No handler found" warnings.
 import logging
@@ -51,9 +57,11 @@ logging.getLogger(__name__).addHandler(NullHandler())
 
 __all__ = [
     # Core
-    'Apprise', 'AppriseAsset', 'NotifyBase',
+    'Apprise', 'AppriseAsset', 'AppriseDigest', 'AppriseOutbox',
+    'AppriseResult', 'NotifyResult', 'NotifyBase',
 
     # Reference
     'NotifyType', 'NotifyImageSize', 'NotifyFormat', 'OverflowMode',
-    'NOTIFY_TYPES', 'NOTIFY_IMAGE_SIZES', 'NOTIFY_FORMATS', 'OVERFLOW_MODES',
+    'QueuePolicy', 'NOTIFY_TYPES', 'NOTIFY_IMAGE_SIZES', 'NOTIFY_FORMATS',
+    'OVERFLOW_MODES', 'QUEUE_POLICIES',
 ]
@@ -0,0 +1,281 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2019 Chris Caron <lead2gold@gmail.com>
+# All rights reserved.
+#
+# This code is licensed under the MIT License.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files(the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and / or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions :
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import hashlib
+import threading
+
+try:
+    # Python 3.3+
+    from time import monotonic
+
+except ImportError:  # pragma: no cover
+    # Python 2.7
+    from time import time as monotonic
+
+
+class CircuitState(object):
+    """
+    The states a circuit breaker can be in
+    """
+    # Notifications flow normally
+    CLOSED = 'closed'
+
+    # Notifications are skipped (our target is presumed dead)
+    OPEN = 'open'
+
+    # A single notification is let through to see if our target recovered
+    HALF_OPEN = 'half-open'
+
+
+class CircuitBreaker(object):
+    """
+    A thread-safe circuit breaker.
+
+    After threshold consecutive failures the breaker opens and refuses every
+    request made for the next cooldown seconds.  It then lets a single
+    (probe) request through; if it succeeds the breaker closes again,
+    otherwise it re-opens for another cooldown period.
+
+    """
+
+    def __init__(self, threshold=5, cooldown=60.0):
+        """
+        Initialize our breaker
+
+        """
+        # The number of consecutive failures that open our breaker
+        self.threshold = threshold
+
+        # The number of seconds our breaker stays open for
+        self.cooldown = cooldown
+
+        # Our current state
+        self._state = CircuitState.CLOSED
+
+        # The number of consecutive failures
+        self._failures = 0
+
+        # The (monotonic) time our breaker was last opened
+        self._opened = None
+
+        # Set while our probe request (when half-open) is in progress
+        self._probing = False
+
+        # Protects our breaker from concurrent access
+        self._lock = threading.Lock()
+
+    def allow(self):
+        """
+        Returns True if a request can be made and False if it should be
+        skipped.  Every request allowed must have its outcome reported
+        through record().
+
+        """
+        with self._lock:
+            if self._state == CircuitState.CLOSED:
+                return True
+
+            if self._state == CircuitState.OPEN:
+                if monotonic() - self._opened < self.cooldown:
+                    # Fail fast
+                    return False
+
+                # Let a probe through
+                self._state = CircuitState.HALF_OPEN
+                self._probing = False
+
+            if self._probing:
+                # Only one probe at a time
+                return False
+
+            self._probing = True
+            return True
+
+    def record(self, success):
+        """
+        Records the outcome of a request that was allowed through
+
+        """
+        with self._lock:
+            self._probing = False
+
+            if success:
+                self._state = CircuitState.CLOSED
+                self._failures = 0
+                self._opened = None
+                return
+
+            self._failures += 1
+            if self._state == CircuitState.HALF_OPEN or \
+                    (self.threshold > 0 and
+                     self._failures >= self.threshold):
+                # Open (or re-open) our breaker
+                self._state = CircuitState.OPEN
+                self._opened = monotonic()
+
+    def cancel(self):
+        """
+        Called instead of record() for a request allowed through whose
+        outcome could not be determined.
+
+        """
+        with self._lock:
+            self._probing = False
+
+    def reset(self):
+        """
+        Closes our breaker
+
+        """
+        with self._lock:
+            self._state = CircuitState.CLOSED
+            self._failures = 0
+            self._opened = None
+            self._probing = False
+
+    def state(self):
+        """
+        Returns a dictionary describing our breaker: it's state, the number of
+        consecutive failures and (if open) the number of seconds remaining
+        before a probe request is let through.
+
+        """
+        with self._lock:
+            retry_in = 0.0
+            if self._state == CircuitState.OPEN:
+                retry_in = max(
+                    0.0, self.cooldown - (monotonic() - self._opened))
+
+            return {
+                'state': self._state,
+                'failures': self._failures,
+                'retry_in': retry_in,
+            }
+
+
+class CircuitBreakers(object):
+    """
+    A thread-safe collection of circuit breakers keyed by the notification
+    service each of them protects.  A collection can be shared by as many
+    Apprise objects as you like.
+
+    """
+
+    # The number of consecutive failures that open a breaker; set this to
+    # zero (0) to disable our breakers entirely.
+    threshold = 5
+
+    # The number of seconds a breaker stays open before letting a probe
+    # notification through.
+    cooldown = 60.0
+
+    def __init__(self, threshold=None, cooldown=None):
+        """
+        Initialize our breakers; any argument not specified uses the default
+        defined by the class.
+
+        """
+        if threshold is not None:
+            self.threshold = threshold
+
+        if cooldown is not None:
+            self.cooldown = cooldown
+
+        # Our breakers
+        self._breakers = {}
+
+        # Protects our breakers from concurrent access
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(server):
+        """
+        Returns the key that identifies the specified server; this is a
+        digest of it's URL (when it can provide one) prefixed with the name
+        of it's service.  Our URLs describe our servers completely (their
+        path included) so that every endpoint has a breaker of it's own.
+        URLs often carry passwords and tokens, so they never appear in our
+        keys.
+
+        """
+        try:
+            url = server.url()
+
+        except NotImplementedError:
+            url = '{}://{}'.format(
+                server.__class__.__name__.lower(), server.host)
+
+        try:
+            url = url.encode('utf-8')
+
+        except (AttributeError, UnicodeDecodeError):
+            # Python v2.7 str objects are already encoded
+            pass
+
+        return '{}:{}'.format(
+            server.__class__.__name__.lower(), hashlib.sha1(url).hexdigest())
+
+    def breaker(self, server):
+        """
+        Returns the breaker associated with the specified server; one is
+        created if it doesn't already exist.
+
+        """
+        key = self.key(server)
+        with self._lock:
+            breaker = self._breakers.get(key)
+            if breaker is None:
+                breaker = CircuitBreaker(
+                    threshold=self.threshold, cooldown=self.cooldown)
+                self._breakers[key] = breaker
+
+            else:
+                # Apply any changes made to our settings
+                breaker.threshold = self.threshold
+                breaker.cooldown = self.cooldown
+
+            return breaker
+
+    def get(self, server):
+        """
+        Returns the breaker associated with the specified server if one is
+        being tracked, otherwise None is returned.
+
+        """
+        with self._lock:
+            return self._breakers.get(self.key(server))
+
+    def clear(self):
+        """
+        Removes all of our breakers
+        """
+        with self._lock:
+            self._breakers.clear()
+
+    def __len__(self):
+        """
+        Returns the number of breakers we're tracking
+        """
+        return len(self._breakers)
@@ -27,10 +27,20 @@
 import click
 import logging
 import sys
+import threading
+
+try:
+    # Python 3.x
+    import queue
+
+except ImportError:  # pragma: no cover
+    # Python 2.7
+    import Queue as queue
 
 from . import NotifyType
 from . import Apprise
 from . import AppriseAsset
+from . import AppriseOutbox
 
 # Logging
 logger = logging.getLogger('apprise.plugins.NotifyBase')
@@ -39,6 +49,21 @@ logger = logging.getLogger('apprise.plugins.NotifyBase')
 # can be specified to get the help menu to come up
 CONTEXT_SETTINGS = dict(help_option_names=['-h', '--help'])
 
+# The outbox used by --flush-outbox if one isn't specified
+DEFAULT_OUTBOX_PATH = '~/.apprise/outbox'
+
+# The number of seconds --stream waits for more input before it sends what
+# it has read so far
+DEFAULT_STREAM_IDLE = 5.0
+
+# The size of the messages --stream sends when none of our servers impose a
+# limit on it
+DEFAULT_STREAM_SIZE = 32768
+
+# The number of lines --stream reads ahead of what it has sent; this (along
+# with the size of our messages) bounds the memory we use
+STREAM_BACKLOG = 1000
+
 
 def print_help_msg(command):
     """
@@ -49,6 +74,95 @@ def print_help_msg(command):
         click.echo(command.get_help(ctx))
 
 
+def read_stream(stream, size, lines=0, idle=DEFAULT_STREAM_IDLE):
+    """
+    A generator of the messages read (line by line) from the specified text
+    stream as its input arrives.
+
+    Lines are grouped into one message until the next line would exceed the
+    size specified, the number of lines specified is reached (if set), or
+    no more input arrives within our idle period (in seconds).  A line
+    longer than our size is broken up.
+
+    Our stream is read from a separate thread so that it keeps flowing while
+    our messages are sent; it never reads more than STREAM_BACKLOG lines
+    ahead of us.
+
+    """
+    backlog = queue.Queue(maxsize=STREAM_BACKLOG)
+
+    def reader():
+        try:
+            while True:
+                line = stream.readline(size)
+                if not line:
+                    break
+
+                backlog.put(line)
+
+        finally:
+            # Signal the end of our stream
+            backlog.put(None)
+
+    thread = threading.Thread(target=reader)
+    thread.daemon = True
+    thread.start()
+
+    # The lines of the message we're building
+    pending = []
+    length = 0
+
+    while True:
+        try:
+            # We only need to wait on our idle period if we have something
+            # to send
+            line = backlog.get(timeout=idle) if pending else backlog.get()
+
+        except queue.Empty:
+            # No more input arrived in time; send what we have
+            yield ''.join(pending)
+            pending, length = [], 0
+            continue
+
+        if line is None:
+            # We're done
+            break
+
+        if pending and length + len(line) > size:
+            # Our line doesn't fit
+            yield ''.join(pending)
+            pending, length = [], 0
+
+        pending.append(line)
+        length += len(line)
+
+        if lines > 0 and len(pending) >= lines:
+            yield ''.join(pending)
+            pending, length = [], 0
+
+    if pending:
+        yield ''.join(pending)
+
+
+def stream_size(servers, title=None):
+    """
+    Returns the size of the messages read from a stream; it's the smallest
+    body_maxlen of the servers specified.
+
+    """
+    size = None
+    for server in servers:
+        maxlen = server.body_maxlen
+        if title and server.title_maxlen <= 0:
+            # Our title is added to our body
+            maxlen -= len(title) + 2
+
+        if maxlen > 0 and (size is None or maxlen < size):
+            size = maxlen
+
+    return DEFAULT_STREAM_SIZE if size is None else size
+
+
 @click.command(context_settings=CONTEXT_SETTINGS)
 @click.option('--title', '-t', default=None, type=str,
               help='Specify the message title.')
@@ -58,10 +172,27 @@ def print_help_msg(command):
               metavar='TYPE', help='Specify the message type (default=info).')
 @click.option('--theme', '-T', default='default', type=str,
               help='Specify the default theme.')
+@click.option('--outbox', '-o', default=None, type=str, metavar='PATH',
+              help='Store the notifications that could not be delivered in '
+              'the outbox found in this directory.')
+@click.option('--flush-outbox', is_flag=True,
+              help='Redeliver the notifications held in the outbox '
+              '(default={}).'.format(DEFAULT_OUTBOX_PATH))
+@click.option('--stream', '-s', is_flag=True,
+              help='Send the content of STDIN as it arrives; its lines are '
+              'grouped into messages that fit all of the specified servers.')
+@click.option('--stream-lines', default=0, type=int, metavar='COUNT',
+              help='The maximum number of lines sent in each message when '
+              'streaming (default=unlimited).')
+@click.option('--stream-idle', default=DEFAULT_STREAM_IDLE, type=float,
+              metavar='SECONDS', help='Send what has been read when no more '
+              'input arrives within this period when streaming '
+              '(default={}).'.format(DEFAULT_STREAM_IDLE))
 @click.option('-v', '--verbose', count=True)
 @click.argument('urls', nargs=-1,
                 metavar='SERVER_URL [SERVER_URL2 [SERVER_URL3]]',)
-def main(title, body, urls, notification_type, theme, verbose):
+def main(title, body, urls, notification_type, theme, outbox, flush_outbox,
+         stream, stream_lines, stream_idle, verbose):
     """
     Send a notification to all of the specified servers identified by their
     URLs the content provided within the title, body and notification-type.
@@ -86,21 +217,49 @@ def main(title, body, urls, notification_type, theme, verbose):
     ch.setFormatter(formatter)
     logger.addHandler(ch)
 
+    # Prepare our asset
+    asset = AppriseAsset(theme=theme)
+
+    if outbox or flush_outbox:
+        # Prepare our outbox
+        outbox = AppriseOutbox(outbox or DEFAULT_OUTBOX_PATH)
+
+    if flush_outbox:
+        # Redeliver the contents of our outbox
+        if outbox.deliver(asset=asset):
+            sys.exit(0)
+        sys.exit(1)
+
     if not urls:
         logger.error('You must specify at least one server URL.')
         print_help_msg(main)
         sys.exit(1)
 
-    # Prepare our asset
-    asset = AppriseAsset(theme=theme)
-
     # Create our object
-    a = Apprise(asset=asset)
+    a = Apprise(asset=asset, outbox=outbox)
 
     # Load our inventory up
     for url in urls:
         a.add(url)
 
+    if stream and body is None:
+        # Send the content of STDIN as it arrives
+        status = True
+        for message in read_stream(
+                click.get_text_stream('stdin'),
+                size=stream_size(a.servers, title=title),
+                lines=stream_lines, idle=stream_idle):
+
+            if not message.strip():
+                # Nothing to send
+                continue
+
+            if not a.notify(
+                    title=title, body=message, notify_type=notification_type):
+                status = False
+
+        sys.exit(0 if status else 1)
+
     if body is None:
         # if no body was specified, then read from STDIN
         body = click.get_text_stream('stdin').read()
@@ -105,3 +105,28 @@ OVERFLOW_MODES = (
     OverflowMode.TRUNCATE,
     OverflowMode.SPLIT,
 )
+
+
+class QueuePolicy(object):
+    """
+    A list of pre-defined policies of how to handle a notification that is
+    queued (to be sent in the background) when the queue is already full.
+    """
+
+    # Wait for there to be room in the queue
+    BLOCK = 'block'
+
+    # Drop the notification being queued
+    DROP_NEWEST = 'drop-newest'
+
+    # Drop the oldest info notification in the queue to make room; the
+    # notification being queued is dropped if there isn't one
+    DROP_OLDEST_INFO = 'drop-oldest-info'
+
+
+# Define our policies so we can verify if we need to
+QUEUE_POLICIES = (
+    QueuePolicy.BLOCK,
+    QueuePolicy.DROP_NEWEST,
+    QueuePolicy.DROP_OLDEST_INFO,
+)
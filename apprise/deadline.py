@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2019 Chris Caron <lead2gold@gmail.com>
+# All rights reserved.
+#
+# This code is licensed under the MIT License.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files(the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and / or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions :
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import threading
+from contextlib import contextmanager
+
+try:
+    # Python 3.3+
+    from time import monotonic
+
+except ImportError:  # pragma: no cover
+    # Python 2.7
+    from time import time as monotonic
+
+
+class DeadlineExceeded(Exception):
+    """
+    Thrown when there isn't enough time left before our deadline to carry
+    out an operation.
+    """
+
+
+class Deadline(object):
+    """
+    Places an upper bound on the time it takes to send a notification.
+
+    While a deadline is active (using it as a context manager), our
+    notification services honour it: throttles that would run past it are
+    refused, socket timeouts never exceed the time remaining and any work
+    that hasn't started by the time it passes is skipped.  The servers
+    skipped are tracked in our skipped list.
+
+    """
+
+    # Tracks the deadlines active in each thread
+    _local = threading.local()
+
+    def __init__(self, seconds):
+        """
+        Initialize our deadline; it passes the specified number of seconds
+        from now.
+
+        """
+        # Our duration
+        self.seconds = float(seconds)
+
+        # The (monotonic) time our deadline passes
+        self.expires = monotonic() + self.seconds
+
+        # The servers that were skipped because our deadline passed
+        self.skipped = list()
+
+        # Protects our skipped list from concurrent access
+        self._lock = threading.Lock()
+
+    def remaining(self):
+        """
+        Returns the number of seconds left before our deadline passes
+        """
+        return max(0.0, self.expires - monotonic())
+
+    def expired(self):
+        """
+        Returns True if our deadline has passed
+        """
+        return monotonic() >= self.expires
+
+    def skip(self, server):
+        """
+        Records a server that was skipped because of our deadline
+        """
+        with self._lock:
+            if server not in self.skipped:
+                self.skipped.append(server)
+
+    @classmethod
+    def current(cls):
+        """
+        Returns the deadline active in the current thread (if any)
+        """
+        stack = getattr(cls._local, 'stack', None)
+        return stack[-1] if stack else None
+
+    def __enter__(self):
+        """
+        Activates our deadline in the current thread
+        """
+        if not hasattr(self._local, 'stack'):
+            self._local.stack = list()
+
+        self._local.stack.append(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        Deactivates our deadline
+        """
+        self._local.stack.pop()
+
+
+class Cutoff(object):
+    """
+    Shared between a notify() call that has a deadline and the thread
+    notifying one of its groups of servers in the background.
+
+    The thread records the outcome of each notification while it holds our
+    lock (see recording()), and tells us when it's done.  If our deadline
+    passes first, notify() cuts the thread off (see cut()) and reports
+    the group as skipped itself.  From then on, the thread records nothing
+    further.
+
+    """
+
+    def __init__(self):
+        """
+        Initialize our cutoff
+        """
+        # Set once notify() reported our group as skipped
+        self.passed = False
+
+        # Set once our thread recorded the outcome of our entire group
+        self.done = False
+
+        # Held while an outcome is recorded
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def recording(self, breaker=None):
+        """
+        Returns a context manager to record an outcome in.  DeadlineExceeded
+        is thrown instead if we were cut off; the circuit breaker specified
+        (if any) is told that its outcome is unknown then.
+
+        """
+        with self._lock:
+            if self.passed:
+                if breaker is not None:
+                    breaker.cancel()
+
+                raise DeadlineExceeded()
+
+            yield
+
+    def finish(self):
+        """
+        Marks our group as done; DeadlineExceeded is thrown instead if we
+        were cut off.
+
+        """
+        with self._lock:
+            if self.passed:
+                raise DeadlineExceeded()
+
+            self.done = True
+
+    def cut(self):
+        """
+        Cuts our thread off unless its group is done.  Returns True if we
+        were cut off, and False if the group's outcome can be used.
+
+        """
+        with self._lock:
+            if not self.done:
+                self.passed = True
+
+            return self.passed
@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2019 Chris Caron <lead2gold@gmail.com>
+# All rights reserved.
+#
+# This code is licensed under the MIT License.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files(the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and / or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions :
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import hashlib
+import threading
+from collections import OrderedDict
+
+from .common import NotifyType
+from .circuit import CircuitBreakers
+
+try:
+    # Python 3.3+
+    from time import monotonic
+
+except ImportError:  # pragma: no cover
+    # Python 2.7
+    from time import time as monotonic
+
+
+class DuplicateFilter(object):
+    """
+    A thread-safe (and bounded) record of the notifications recently sent to
+    each server; a notification identical to one sent to the same server
+    less then ttl seconds ago is suppressed.
+
+    Notifications are identified by the URL of the server, their type, their
+    title and a digest of their body.  A filter can be shared by as many
+    Apprise objects as you like.
+
+    """
+
+    # The number of seconds a notification is remembered for
+    ttl = 300.0
+
+    # The maximum number of notifications we remember; the oldest ones are
+    # forgotten first
+    maxsize = 10000
+
+    def __init__(self, ttl=None, maxsize=None):
+        """
+        Initialize our filter; any argument not specified uses the default
+        defined by the class.
+
+        """
+        if ttl is not None:
+            self.ttl = max(0.0, float(ttl))
+
+        if maxsize is not None:
+            self.maxsize = max(0, int(maxsize))
+
+        # The (monotonic) time each of our notifications expires at; they're
+        # kept in the order they were sent in (and therefore expire in)
+        self._seen = OrderedDict()
+
+        # The number of notifications we've suppressed
+        self.suppressed = 0
+
+        # Protects the above from concurrent access
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(server, body, title='', notify_type=NotifyType.INFO):
+        """
+        Returns the key that identifies a notification sent to the server
+        """
+        try:
+            body = body.encode('utf-8')
+
+        except (AttributeError, UnicodeDecodeError):
+            # Python v2.7 str objects are already encoded
+            pass
+
+        return (
+            CircuitBreakers.key(server), notify_type, title,
+            hashlib.sha1(body or b'').hexdigest())
+
+    def seen(self, server, body, title='', notify_type=NotifyType.INFO):
+        """
+        Returns True if the notification is a duplicate (and should be
+        suppressed), otherwise it's remembered and False is returned.
+
+        """
+        key = self.key(
+            server, body=body, title=title, notify_type=notify_type)
+        reference = monotonic()
+
+        with self._lock:
+            self._expire(reference)
+
+            if key in self._seen:
+                self.suppressed += 1
+                return True
+
+            if self.ttl > 0.0 and self.maxsize > 0:
+                self._seen[key] = reference + self.ttl
+                if len(self._seen) > self.maxsize:
+                    # Forget our oldest notification
+                    self._seen.popitem(last=False)
+
+        return False
+
+    def forget(self, server, body, title='', notify_type=NotifyType.INFO):
+        """
+        Forgets a notification; this is done when it could not be sent so
+        that it isn't suppressed the next time it is.
+
+        """
+        key = self.key(
+            server, body=body, title=title, notify_type=notify_type)
+
+        with self._lock:
+            self._seen.pop(key, None)
+
+    def clear(self):
+        """
+        Forgets every notification
+        """
+        with self._lock:
+            self._seen.clear()
+
+    def _expire(self, reference):
+        """
+        Forgets the notifications that have expired; this function expects
+        our lock to already be held.
+
+        """
+        while self._seen:
+            key, expires = next(iter(self._seen.items()))
+            if expires > reference:
+                break
+
+            del self._seen[key]
+
+    def __len__(self):
+        """
+        Returns the number of notifications we remember
+        """
+        with self._lock:
+            self._expire(monotonic())
+            return len(self._seen)
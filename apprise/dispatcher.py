@@ -0,0 +1,377 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2019 Chris Caron <lead2gold@gmail.com>
+# All rights reserved.
+#
+# This code is licensed under the MIT License.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files(the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and / or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions :
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import logging
+import threading
+from collections import deque
+from itertools import count
+
+try:
+    # Python 3.x (or Python 2.7 with the futures backport installed)
+    from concurrent.futures import Future
+
+except ImportError:  # pragma: no cover
+    # Background notifications are not supported
+    Future = None
+
+from .common import NotifyType
+from .common import QueuePolicy
+from .common import QUEUE_POLICIES
+
+try:
+    # Python 3.3+
+    from time import monotonic
+
+except ImportError:  # pragma: no cover
+    # Python 2.7
+    from time import time as monotonic
+
+logger = logging.getLogger(__name__)
+
+
+class Dispatcher(object):
+    """
+    Sends notifications in the background.
+
+    Notifications are placed in a bounded queue and sent by a pool of worker
+    threads.  Each notification queued is represented by a Future; it's
+    cancelled if the notification is dropped (or closed) before being sent.
+
+    Notifications are sent in order of their priority (failures first, then
+    warnings, then everything else) and in the order they were queued when
+    their priority is the same.  So that nothing waits forever, the priority
+    of a notification is raised by one for every aging seconds it waits.
+
+    When the queue is full, our policy decides what happens to the next
+    notification queued: we either wait for there to be room, drop it, or
+    drop the oldest info notification in the queue instead.
+
+    """
+
+    # The maximum number of notifications waiting to be sent
+    maxsize = 1000
+
+    # The number of threads sending our notifications
+    workers = 1
+
+    # What happens when our queue is full (see QueuePolicy)
+    policy = QueuePolicy.BLOCK
+
+    # The priority of each type of notification; lower values are sent
+    # first. Notifications of any other type are sent last.
+    priorities = {
+        NotifyType.FAILURE: 0,
+        NotifyType.WARNING: 1,
+        NotifyType.SUCCESS: 2,
+        NotifyType.INFO: 2,
+    }
+
+    # The number of seconds a notification waits in our queue before its
+    # priority is raised by one; set this to zero (0) to disable aging.
+    aging = 30.0
+
+    def __init__(self, maxsize=None, workers=None, policy=None, aging=None):
+        """
+        Initialize our dispatcher; any argument not specified uses the
+        default defined by the class.  Our workers are only started once the
+        first notification is queued.
+
+        """
+        if Future is None:  # pragma: no cover
+            raise NotImplementedError(
+                'Background notifications require the futures module.')
+
+        if maxsize is not None:
+            self.maxsize = max(1, int(maxsize))
+
+        if workers is not None:
+            self.workers = max(1, int(workers))
+
+        if policy is not None:
+            self.policy = policy
+
+        if aging is not None:
+            self.aging = max(0.0, float(aging))
+
+        if self.policy not in QUEUE_POLICIES:
+            raise TypeError(
+                'An invalid queue policy ({}) was specified.'.format(
+                    self.policy))
+
+        # The notifications waiting to be sent, keyed by their priority; each
+        # priority is a (first in first out) queue of tuples containing
+        # (sequence, queued, future, notify_type, function, kwargs)
+        self._queues = dict()
+
+        # The number of notifications waiting to be sent
+        self._size = 0
+
+        # Tracks the order our notifications were queued in
+        self._sequence = count()
+
+        # The number of notifications queued (or being sent) that haven't
+        # completed yet
+        self._unfinished = 0
+
+        # The number of notifications we dropped
+        self.dropped = 0
+
+        # Set once we're closed
+        self._closed = False
+
+        # Our worker threads
+        self._threads = list()
+
+        # Protects the above; it's notified whenever our queue changes
+        self._cond = threading.Condition(threading.Lock())
+
+    @property
+    def depth(self):
+        """
+        Returns the number of notifications waiting to be sent
+        """
+        with self._cond:
+            return self._size
+
+    def submit(self, func, notify_type=NotifyType.INFO, priority=None,
+               **kwargs):
+        """
+        Queues func(notify_type=notify_type, **kwargs) to be called by one
+        of our workers and returns a Future tracking its outcome.
+
+        The notify_type also identifies the notifications we can drop to make
+        room and, unless a priority is specified, the priority of our
+        notification (lower values are sent first).
+
+        """
+        future = Future()
+
+        if priority is None:
+            priority = self.priorities.get(
+                notify_type, max(self.priorities.values()) + 1)
+
+        with self._cond:
+            if self._closed:
+                raise RuntimeError(
+                    'Notifications can not be queued once closed.')
+
+            while self._size >= self.maxsize:
+                if self.policy == QueuePolicy.BLOCK:
+                    # Wait for room
+                    self._cond.wait()
+                    if self._closed:
+                        raise RuntimeError(
+                            'Notifications can not be queued once closed.')
+                    continue
+
+                # Find the oldest info notification to drop
+                oldest = None
+                if self.policy == QueuePolicy.DROP_OLDEST_INFO:
+                    for (key, queue) in self._queues.items():
+                        entry = next((
+                            e for e in queue
+                            if e[3] == NotifyType.INFO), None)
+
+                        if entry is not None and \
+                                (oldest is None or entry[0] < oldest[1][0]):
+                            oldest = (key, entry)
+
+                if oldest is None:
+                    # Drop our own notification
+                    self._drop(future)
+                    return future
+
+                (key, entry) = oldest
+                self._queues[key].remove(entry)
+                if not self._queues[key]:
+                    del self._queues[key]
+
+                self._size -= 1
+                self._unfinished -= 1
+                self._drop(entry[2])
+                self._cond.notify_all()
+
+            self._queues.setdefault(priority, deque()).append((
+                next(self._sequence), monotonic(), future, notify_type, func,
+                kwargs))
+            self._size += 1
+            self._unfinished += 1
+
+            if len(self._threads) < self.workers:
+                self._start()
+
+            self._cond.notify_all()
+
+        return future
+
+    def flush(self, timeout=None):
+        """
+        Waits for every notification queued to be sent; returns True if they
+        were or False if our timeout (in seconds) passed first.
+
+        """
+        expires = None if timeout is None else monotonic() + timeout
+
+        with self._cond:
+            while self._unfinished:
+                remaining = None if expires is None \
+                    else expires - monotonic()
+                if remaining is not None and remaining <= 0.0:
+                    return False
+
+                self._cond.wait(remaining)
+
+        return True
+
+    def close(self, timeout=None):
+        """
+        Stops accepting notifications and waits for the ones already queued
+        to be sent (for up to timeout seconds).  Notifications that are
+        still queued after that are cancelled.
+
+        Returns True if every notification queued was sent.
+
+        """
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+        status = self.flush(timeout=timeout)
+
+        with self._cond:
+            # Cancel anything that's left
+            for queue in self._queues.values():
+                for entry in queue:
+                    entry[2].cancel()
+                    self._unfinished -= 1
+
+            self._queues.clear()
+            self._size = 0
+
+            threads = self._threads
+            self._threads = list()
+            self._cond.notify_all()
+
+        if status:
+            # Our workers exit once our queue is empty
+            for thread in threads:
+                thread.join()
+
+        return status
+
+    def _drop(self, future):
+        """
+        Drops a notification; this function expects our lock to already be
+        held.
+
+        """
+        self.dropped += 1
+        future.cancel()
+        logger.warning(
+            'Dropped a notification; the notification queue is full.')
+
+    def _pop(self):
+        """
+        Removes (and returns) the next notification to send; this function
+        expects our lock to already be held (and our queue to not be
+        empty).
+
+        The oldest notification of each priority is the one that has aged
+        the most; we pick the most urgent of them.
+
+        """
+        reference = monotonic()
+
+        best = None
+        for (key, queue) in self._queues.items():
+            entry = queue[0]
+            priority = key
+            if self.aging > 0.0:
+                # Raise our priority based on the time we've been waiting
+                priority -= int((reference - entry[1]) / self.aging)
+
+            if best is None or (priority, entry[0]) < best[0]:
+                best = ((priority, entry[0]), key)
+
+        queue = self._queues[best[1]]
+        entry = queue.popleft()
+        if not queue:
+            del self._queues[best[1]]
+
+        self._size -= 1
+        return entry
+
+    def _start(self):
+        """
+        Starts a worker thread; this function expects our lock to already be
+        held.
+
+        """
+        thread = threading.Thread(
+            target=self._worker,
+            name='AppriseDispatcher-{}'.format(len(self._threads)))
+        thread.daemon = True
+        self._threads.append(thread)
+        thread.start()
+
+    def _worker(self):
+        """
+        Sends our queued notifications until we're closed
+        """
+        while True:
+            with self._cond:
+                while not self._size:
+                    if self._closed:
+                        return
+
+                    self._cond.wait()
+
+                (_, _, future, notify_type, func, kwargs) = self._pop()
+
+                # There's room in our queue
+                self._cond.notify_all()
+
+            try:
+                if future.set_running_or_notify_cancel():
+                    try:
+                        future.set_result(
+                            func(notify_type=notify_type, **kwargs))
+
+                    except Exception as e:
+                        logger.exception("Dispatcher Exception")
+                        future.set_exception(e)
+
+            finally:
+                with self._cond:
+                    self._unfinished -= 1
+                    self._cond.notify_all()
+
+    def __len__(self):
+        """
+        Returns the number of notifications that haven't been sent yet
+        (including the ones being sent)
+        """
+        with self._cond:
+            return self._unfinished
@@ -0,0 +1,261 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2019 Chris Caron <lead2gold@gmail.com>
+# All rights reserved.
+#
+# This code is licensed under the MIT License.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files(the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and / or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions :
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import logging
+import threading
+
+try:
+    # Python 3.3+
+    from time import monotonic
+
+except ImportError:  # pragma: no cover
+    # Python 2.7
+    from time import time as monotonic
+
+logger = logging.getLogger(__name__)
+
+
+class HookStage(object):
+    """
+    The stages our hooks are fired around
+
+    """
+    # Parsing (and loading) a server URL
+    PARSE = 'parse'
+
+    # Converting the body to the format a server expects
+    CONVERT = 'convert'
+
+    # Splitting a message to fit the limits of a server (overflow); the
+    # chunks are generated as they're sent so this only covers the first
+    OVERFLOW = 'overflow'
+
+    # Waiting before we're allowed to perform i/o to a server
+    THROTTLE = 'throttle'
+
+    # Sending a message (chunk) to a server
+    SEND = 'send'
+
+
+HOOK_STAGES = (
+    HookStage.PARSE,
+    HookStage.CONVERT,
+    HookStage.OVERFLOW,
+    HookStage.THROTTLE,
+    HookStage.SEND,
+)
+
+
+class Hook(object):
+    """
+    The base class of our hooks; override before() and/or after().
+
+    Both functions are passed the stage (refer to HookStage) and a context
+    dictionary describing it.  The same dictionary is passed to after() so
+    it can be used to carry state (such as a tracing span) from before().
+
+    Once a stage completes, its context also contains:
+      - elapsed: the number of seconds the stage took
+      - error: the exception the stage ended with (if any)
+
+    """
+
+    def before(self, stage, context):
+        """
+        Called before a stage begins
+        """
+        pass
+
+    def after(self, stage, context):
+        """
+        Called after a stage completes (successfully or not)
+        """
+        pass
+
+
+class _NullStage(object):
+    """
+    The stage returned when there are no hooks to fire; it does nothing.
+
+    """
+
+    def update(self, **kwargs):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+class Stage(object):
+    """
+    Fires our hooks around a stage; it's used as a context manager.
+
+    """
+
+    def __init__(self, hooks, stage, context):
+        """
+        Initialize our stage
+
+        """
+        # The hooks we fire
+        self.hooks = hooks
+
+        # The stage we wrap
+        self.stage = stage
+
+        # The context passed to our hooks
+        self.context = context
+
+        # The (monotonic) time our stage started at
+        self._started = None
+
+    def update(self, **kwargs):
+        """
+        Adds details to the context that's passed along to after()
+        """
+        self.context.update(kwargs)
+
+    def _fire(self, hooks, method):
+        """
+        Fires the specified method of each of our hooks
+
+        """
+        for hook in hooks:
+            try:
+                getattr(hook, method)(self.stage, self.context)
+
+            except Exception:
+                # A catch all so that a misbehaving hook never prevents our
+                # notifications from going out
+                logger.exception('Hook Exception')
+
+    def __enter__(self):
+        self._fire(self.hooks, 'before')
+        self._started = monotonic()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.context['elapsed'] = monotonic() - self._started
+        if exc_value is not None:
+            self.context['error'] = exc_value
+
+        self._fire(reversed(self.hooks), 'after')
+        return False
+
+
+# Returned when there is nothing to fire
+NULL_STAGE = _NullStage()
+
+
+class Hooks(object):
+    """
+    A registry of hooks.
+
+    Each registry can be linked to a parent whose hooks are fired along with
+    (and before) its own; a server's hooks are linked to those of the Apprise
+    object it's loaded into.
+
+    """
+
+    # The number of hooks registered across all of our registries; while it's
+    # zero there is nothing to fire and stage() returns right away
+    registered = 0
+
+    # Protects our registered count
+    _lock = threading.Lock()
+
+    def __init__(self, parent=None):
+        """
+        Initialize our registry
+
+        """
+        # Our hooks; this tuple is replaced (instead of altered) so that it
+        # can safely be iterated over without holding our lock
+        self.hooks = tuple()
+
+        # The registry whose hooks are fired along with ours (if any)
+        self.parent = parent
+
+    def register(self, hook):
+        """
+        Registers a hook; it's returned for convenience.
+
+        """
+        with Hooks._lock:
+            if hook not in self.hooks:
+                self.hooks = self.hooks + (hook, )
+                Hooks.registered += 1
+
+        return hook
+
+    def unregister(self, hook):
+        """
+        Unregisters a previously registered hook
+
+        """
+        with Hooks._lock:
+            if hook in self.hooks:
+                self.hooks = tuple(h for h in self.hooks if h is not hook)
+                Hooks.registered -= 1
+
+    def clear(self):
+        """
+        Unregisters all of our hooks
+
+        """
+        with Hooks._lock:
+            Hooks.registered -= len(self.hooks)
+            self.hooks = tuple()
+
+    def stage(self, stage, **context):
+        """
+        Returns a context manager that fires our hooks (and those of our
+        parent) around the specified stage.
+
+        """
+        if not Hooks.registered:
+            # There is nothing to fire
+            return NULL_STAGE
+
+        hooks = self.hooks
+        parent = self.parent
+        while parent is not None:
+            hooks = parent.hooks + hooks
+            parent = parent.parent
+
+        if not hooks:
+            # There is nothing to fire
+            return NULL_STAGE
+
+        return Stage(hooks, stage, context)
+
+    def __len__(self):
+        """
+        Returns the number of hooks registered
+        """
+        return len(self.hooks)
@@ -0,0 +1,291 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2019 Chris Caron <lead2gold@gmail.com>
+# All rights reserved.
+#
+# This code is licensed under the MIT License.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files(the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and / or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions :
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import threading
+from bisect import bisect_left
+
+
+class MetricsSink(object):
+    """
+    The base class of everything our metrics can be sent to; a sink is
+    told about every counter increment and every (histogram) observation
+    made.
+
+    Labels are passed along as a dictionary of strings; for example:
+        {'service': 'Pushover', 'protocol': 'pover'}
+
+    """
+
+    def increment(self, name, labels, value=1):
+        """
+        Increments the counter identified by name (and labels) by value.
+
+        """
+        raise NotImplementedError(
+            "increment() is implimented by the child class.")
+
+    def observe(self, name, labels, value):
+        """
+        Adds an observation (such as a number of seconds) to the histogram
+        identified by name (and labels).
+
+        """
+        raise NotImplementedError(
+            "observe() is implimented by the child class.")
+
+
+class Metrics(object):
+    """
+    The registry of the sinks our metrics are sent to.
+
+    Metrics are only gathered while there is (at least) one sink registered;
+    callers are expected to check the sinks attribute before gathering
+    anything so that there is next to no overhead otherwise.
+
+    """
+
+    def __init__(self):
+        """
+        Initialize our registry
+
+        """
+        # The sinks our metrics are sent to
+        self.sinks = tuple()
+
+        # Protects our sinks from concurrent changes
+        self._lock = threading.Lock()
+
+    def register(self, sink):
+        """
+        Registers a sink; it's returned for convenience.
+
+        """
+        with self._lock:
+            if sink not in self.sinks:
+                # We replace (instead of alter) our tuple so that it can
+                # safely be iterated over without holding our lock
+                self.sinks = self.sinks + (sink, )
+
+        return sink
+
+    def unregister(self, sink):
+        """
+        Unregisters a previously registered sink
+
+        """
+        with self._lock:
+            self.sinks = tuple(s for s in self.sinks if s is not sink)
+
+    def clear(self):
+        """
+        Unregisters all of our sinks
+
+        """
+        with self._lock:
+            self.sinks = tuple()
+
+    def increment(self, name, labels, value=1):
+        """
+        Increments a counter in each of our sinks
+
+        """
+        for sink in self.sinks:
+            sink.increment(name, labels, value)
+
+    def observe(self, name, labels, value):
+        """
+        Adds an observation to a histogram in each of our sinks
+
+        """
+        for sink in self.sinks:
+            sink.observe(name, labels, value)
+
+    def __len__(self):
+        """
+        Returns the number of sinks registered
+        """
+        return len(self.sinks)
+
+
+class MemoryMetrics(MetricsSink):
+    """
+    A sink that aggregates our metrics in memory; refer to prometheus_text()
+    to export them.
+
+    """
+
+    # The upper bounds of our default histogram buckets (in seconds)
+    default_buckets = (
+        0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0,
+        60.0)
+
+    def __init__(self, buckets=None):
+        """
+        Initialize our aggregator
+
+        """
+        # The upper bounds of our histogram buckets
+        self.buckets = tuple(sorted(
+            self.default_buckets if buckets is None else buckets))
+
+        # Our counters; the keys are (name, labels) tuples
+        self.counters = dict()
+
+        # Our histograms; the keys are (name, labels) tuples and the values
+        # are [count, sum, [bucket counts...]] lists
+        self.histograms = dict()
+
+        # Protects our metrics from concurrent access
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(name, labels):
+        """
+        Returns the (hashable) key we track a metric with
+        """
+        return (name, tuple(sorted(labels.items())) if labels else tuple())
+
+    def increment(self, name, labels, value=1):
+        """
+        Increments the counter identified by name (and labels) by value.
+
+        """
+        key = self.key(name, labels)
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def observe(self, name, labels, value):
+        """
+        Adds an observation to the histogram identified by name (and labels).
+
+        """
+        key = self.key(name, labels)
+        with self._lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = [0, 0.0, [0] * len(self.buckets)]
+                self.histograms[key] = histogram
+
+            histogram[0] += 1
+            histogram[1] += value
+
+            # Only the first bucket our value fits in is tracked; they're
+            # made cumulative when exported
+            index = bisect_left(self.buckets, value)
+            if index < len(self.buckets):
+                histogram[2][index] += 1
+
+    def counter(self, name, **labels):
+        """
+        Returns the value of a counter (0 if it was never incremented)
+        """
+        with self._lock:
+            return self.counters.get(self.key(name, labels), 0)
+
+    def histogram(self, name, **labels):
+        """
+        Returns a (count, sum) tuple describing the observations made to a
+        histogram
+        """
+        with self._lock:
+            histogram = self.histograms.get(self.key(name, labels))
+            return (0, 0.0) if histogram is None \
+                else (histogram[0], histogram[1])
+
+    def clear(self):
+        """
+        Resets all of our metrics
+
+        """
+        with self._lock:
+            self.counters.clear()
+            self.histograms.clear()
+
+
+def _prometheus_labels(labels, extra=None):
+    """
+    Returns labels in the Prometheus text format; for example:
+        {protocol="json",service="JSON"}
+
+    """
+    labels = list(labels)
+    if extra:
+        labels.append(extra)
+
+    if not labels:
+        return ''
+
+    return '{' + ','.join(
+        '{}="{}"'.format(key, str(value)
+                         .replace('\\', '\\\\')
+                         .replace('"', '\\"')
+                         .replace('\n', '\\n'))
+        for (key, value) in labels) + '}'
+
+
+def prometheus_text(metrics):
+    """
+    Returns the metrics aggregated by a MemoryMetrics object in the
+    Prometheus text exposition format.
+
+    """
+    with metrics._lock:
+        counters = sorted(metrics.counters.items())
+        histograms = sorted(
+            (key, (value[0], value[1], list(value[2])))
+            for (key, value) in metrics.histograms.items())
+
+    lines = list()
+
+    name = None
+    for ((_name, labels), value) in counters:
+        if _name != name:
+            name = _name
+            lines.append('# TYPE {} counter'.format(name))
+
+        lines.append('{}{} {}'.format(
+            name, _prometheus_labels(labels), value))
+
+    name = None
+    for ((_name, labels), (count, total, buckets)) in histograms:
+        if _name != name:
+            name = _name
+            lines.append('# TYPE {} histogram'.format(name))
+
+        cumulative = 0
+        for (bound, bucket) in zip(metrics.buckets, buckets):
+            cumulative += bucket
+            lines.append('{}_bucket{} {}'.format(
+                name, _prometheus_labels(labels, ('le', repr(bound))),
+                cumulative))
+
+        lines.append('{}_bucket{} {}'.format(
+            name, _prometheus_labels(labels, ('le', '+Inf')), count))
+        lines.append('{}_sum{} {!r}'.format(
+            name, _prometheus_labels(labels), total))
+        lines.append('{}_count{} {}'.format(
+            name, _prometheus_labels(labels), count))
+
+    return '\n'.join(lines) + '\n' if lines else ''
@@ -25,8 +25,24 @@
 
 import re
 import logging
+import threading
+from itertools import chain
+from itertools import islice
+from weakref import WeakSet
 from time import sleep
+from time import time
+from random import uniform
 from datetime import datetime
+from email.utils import parsedate_tz
+from email.utils import mktime_tz
+
+try:
+    # Python 3.3+
+    from time import monotonic
+
+except ImportError:  # pragma: no cover
+    # Python 2.7
+    from time import time as monotonic
 
 try:
     # Python 2.7
@@ -44,6 +60,7 @@ from ..utils import parse_url
 from ..utils import parse_bool
 from ..utils import parse_list
 from ..utils import is_hostname
+from ..utils import compat_is_basestring
 from ..common import NotifyType
 from ..common import NOTIFY_TYPES
 from ..common import NotifyFormat
@@ -52,6 +69,14 @@ from ..common import OverflowMode
 from ..common import OVERFLOW_MODES
 
 from ..AppriseAsset import AppriseAsset
+from ..AppriseResult import NotifyResult
+from ..session import SessionPool
+from ..ratelimit import RateLimiter
+from ..metrics import Metrics
+from ..hooks import Hooks
+from ..hooks import HookStage
+from ..deadline import Deadline
+from ..deadline import DeadlineExceeded
 
 # use sax first because it's faster
 from xml.sax.saxutils import escape as sax_escape
@@ -72,6 +97,53 @@ NOTIFY_NEWLINE = '\r\n'
 # Used to break a path list into parts
 PATHSPLIT_LIST_DELIM = re.compile(r'[ \t\r\n,\\/]+')
 
+# Used to detect an (incomplete) HTML entity such as &amp
+HTML_ENTITY_RE = re.compile(r'^&#?[a-z0-9]*$', re.I)
+
+
+class TagSet(set):
+    """
+    The set of tags associated with a notification service; the Apprise
+    objects the service was added to are told whenever it changes so that
+    they can update their tag index.
+
+    """
+
+    def __init__(self, tags=(), server=None):
+        super(TagSet, self).__init__(tags)
+
+        # The notification service we belong to
+        self.server = server
+
+    def _changed(self):
+        if self.server is not None:
+            self.server._tags_changed()
+
+
+def _tagset_mutator(name):
+    """
+    Returns a set method that reports the changes it makes
+    """
+    method = getattr(set, name)
+
+    def wrapper(self, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        self._changed()
+        return result
+
+    wrapper.__name__ = name
+    wrapper.__doc__ = method.__doc__
+    return wrapper
+
+
+for _name in ('add', 'clear', 'discard', 'pop', 'remove', 'update',
+              'difference_update', 'intersection_update',
+              'symmetric_difference_update', '__ior__', '__iand__',
+              '__isub__', '__ixor__'):
+    setattr(TagSet, _name, _tagset_mutator(_name))
+
+del _name
+
 # Regular expression retrieved from:
 # http://www.regular-expressions.info/email.html
 IS_EMAIL_RE = re.compile(
@@ -110,10 +182,44 @@ class NotifyBase(object):
     # A URL that takes you to the setup/help of the specific protocol
     setup_url = None
 
+    # The attributes holding state we acquire while notifying (such as a
+    # session token) rather then state our URL describes; refer to
+    # url_lossless()
+    url_volatile = ()
+
+    # Set if our host identifies the server we connect to (as opposed to
+    # holding a credential such as an API key); refer to url_privacy()
+    url_privacy_host = False
+
     # Most Servers do not like more then 1 request per 5 seconds, so 5.5 gives
-    # us a safe play range.
+    # us a safe play range. This is the (sustained) number of seconds we wait
+    # between requests made to the same host; set it to zero (0) to disable
+    # throttling entirely.
     request_rate_per_sec = 5.5
 
+    # The number of requests we can make to the same host back to back
+    # before we're throttled to the rate defined above.
+    request_burst = 1
+
+    # The number of times a failed HTTP request is retried; this can be
+    # overridden on a per URL basis using ?retry=
+    request_retries = 0
+
+    # The HTTP status codes (and connection errors) we retry our requests on
+    request_retry_codes = (429, 502, 503, 504)
+
+    # Retries are spread out using an exponential backoff (with jitter); the
+    # base delay (in seconds) doubles with each retry made.
+    request_backoff = 1.0
+
+    # The maximum number of seconds we wait between our retries
+    request_backoff_max = 30.0
+
+    # Servers can tell us how long to wait before retrying (using the
+    # Retry-After or X-RateLimit-Reset headers).  We give up instead if
+    # they ask us to wait longer then this many seconds.
+    request_retry_after_max = 60.0
+
     # Allows the user to specify the NotifyImageSize object
     image_size = None
 
@@ -136,12 +242,46 @@ class NotifyBase(object):
     # Default Overflow Mode
     overflow_mode = OverflowMode.UPSTREAM
 
+    # The maximum number of chunks a message is split into (when our overflow
+    # mode is SPLIT); anything beyond it is discarded.  Setting this to zero
+    # disables this feature.
+    overflow_max_chunks = 0
+
+    # When set, each chunk of a split message is labeled with its position
+    # (such as [2/7]) using the format below.
+    overflow_label = False
+    overflow_label_format = '[{}/{}] '
+
     # Maintain a set of tags to associate with this specific notification
-    tags = set()
+    # (see the tags property)
+    _tags = set()
 
     # Logging
     logger = logging.getLogger(__name__)
 
+    # The HTTP sessions shared by all of our notification services; refer to
+    # http_request() for more details.
+    session_pool = SessionPool()
+
+    # The token buckets (keyed by our service and host) shared by all of our
+    # notification services; refer to throttle() for more details.
+    rate_limiter = RateLimiter()
+
+    # The sinks our metrics are sent to; they're shared by all of our
+    # notification services.  Refer to emit_metrics() for more details.
+    metrics = Metrics()
+
+    # The number of seconds we wait to establish a connection to (and for a
+    # response from) the remote server by default; when set to None, the
+    # timeouts defined by our asset are used.  Services that are known to be
+    # slower than most can set their own here.
+    default_socket_connect_timeout = None
+    default_socket_read_timeout = None
+
+    # The token bucket (per thread) whose token was taken ahead of time by
+    # the send() in progress; refer to _send_prepaid() for more details.
+    _prepaid = threading.local()
+
     def __init__(self, **kwargs):
         """
         Initialize some general logging and common server arguments that will
@@ -197,52 +337,392 @@ class NotifyBase(object):
             # Provide override
             self.overflow_mode = overflow
 
-        if 'tag' in kwargs:
-            # We want to associate some tags with our notification service.
-            # the code below gets the 'tag' argument if defined, otherwise
-            # it just falls back to whatever was already defined globally
-            self.tags = set(parse_list(kwargs.get('tag', self.tags)))
+        if 'retry' in kwargs:
+            # Store the number of times our requests are retried
+            try:
+                self.request_retries = max(0, int(kwargs.get('retry')))
+
+            except (TypeError, ValueError):
+                self.logger.error(
+                    'Invalid retry count %s' % kwargs.get('retry'),
+                )
+                raise TypeError(
+                    'Invalid retry count %s' % kwargs.get('retry'),
+                )
+
+        # Our socket timeouts (in seconds); if they're not specified then the
+        # ones defined by our asset are used.
+        self._socket_connect_timeout = \
+            self.parse_timeout(kwargs.get('cto'), 'connect')
+        self._socket_read_timeout = \
+            self.parse_timeout(kwargs.get('rto'), 'read')
 
-        # Tracks the time any i/o was made to the remote server.  This value
-        # is automatically set and controlled through the throttle() call.
-        self._last_io_datetime = None
+        # The Apprise objects we were added to; they're told when our tags
+        # change
+        self._tag_owners = WeakSet()
+
+        # We want to associate some tags with our notification service.
+        # the code below gets the 'tag' argument if defined, otherwise
+        # it just falls back to whatever was already defined globally
+        self.tags = set(parse_list(kwargs.get('tag', self._tags)))
+
+        # Serializes the notifications sent through this object so that the
+        # messages (and their chunks) arrive in the order they were sent even
+        # when notify() is called from more then one thread.
+        self._notify_lock = threading.RLock()
+
+        # The hooks fired around the stages of our notifications; they're
+        # linked to those of the Apprise object we're loaded into (if any)
+        self.hooks = Hooks()
 
     def throttle(self, last_io=None):
         """
-        A common throttle control
+        A common throttle control; this blocks until we're allowed to perform
+        our next i/o to the remote server and returns the number of seconds
+        we waited for.
+
+        If last_io (a datetime object) is specified, then we assume our last
+        i/o to the remote server took place at that time.
+
+        A DeadlineExceeded exception is thrown (instead of waiting) if the
+        wait would carry us past the active deadline.
         """
 
+        bucket = self.throttle_bucket()
+
+        if getattr(self._prepaid, 'bucket', None) is bucket:
+            # Our token was already taken (and waited on); refer to
+            # _send_prepaid()
+            self._prepaid.bucket = None
+            return 0.0
+
         if last_io is not None:
             # Assume specified last_io
-            self._last_io_datetime = last_io
+            bucket.drain(
+                elapsed=(datetime.now() - last_io).total_seconds())
+
+        self._throttle_check(bucket, Deadline.current())
+
+        with self.hooks.stage(HookStage.THROTTLE, server=self) as stage:
+            # Reserve our turn; this tells us how long we need to wait (if at
+            # all)
+            delay = bucket.acquire()
+            stage.update(delay=delay)
+
+            if delay > 0:
+                self.logger.debug('Throttling for {}s...'.format(delay))
+                sleep(delay)
+
+        self._throttled(delay, NotifyResult.current())
+        return delay
+
+    def _throttle_check(self, bucket, deadline=None):
+        """
+        Throws a DeadlineExceeded exception if waiting on the token bucket
+        specified would carry us past our deadline (if specified).
 
-        # Get ourselves a reference time of 'now'
-        reference = datetime.now()
+        """
+        if deadline is not None and \
+                bucket.delay() >= max(deadline.remaining(), 1e-3):
+            self.logger.warning(
+                'Refusing to throttle past our deadline; {} notification '
+                'aborted.'.format(self.service_name or 'unknown'))
+            raise DeadlineExceeded()
+
+    def _throttled(self, delay, result=None):
+        """
+        Tracks the number of seconds we spent throttling in our result (if
+        specified) and metrics.
 
-        if self._last_io_datetime is None:
-            # Set time to 'now' and no need to throttle
-            self._last_io_datetime = reference
+        """
+        if delay <= 0:
             return
 
+        if result is not None:
+            # Track the time we spent waiting
+            result.throttle += delay
+
+        if self.metrics.sinks:
+            self.metrics.increment(
+                'apprise_throttle_wait_seconds_total',
+                self.metric_labels(), delay)
+
+    def throttle_delay(self, reference=None):
+        """
+        Returns the number of seconds remaining before we're allowed to
+        perform our next i/o to the remote server.  Unlike throttle(), this
+        function never blocks and never alters the throttle state.
+        """
+
         if self.request_rate_per_sec <= 0.0:
-            # We're done if there is no throttle limit set
-            return
+            # No need to throttle
+            return 0.0
+
+        return self.throttle_bucket().delay(reference=reference)
+
+    def throttle_bucket(self):
+        """
+        Returns the token bucket that throttles our i/o; it's shared with all
+        of the other services of the same type notifying the same host.
+        """
+
+        return self.rate_limiter.bucket(
+            (self.__class__, self.host),
+            interval=self.request_rate_per_sec,
+            burst=self.request_burst,
+        )
+
+    def async_throttle(self):
+        """
+        Returns a coroutine that takes a token from our bucket and waits
+        until it can be used with asyncio.sleep() so that the event loop is
+        never blocked; the bucket is returned.
+        """
+        from ..py3compat import asyncio as py3aio
+        return py3aio.throttle(self)
+
+    @property
+    def socket_connect_timeout(self):
+        """
+        Returns the number of seconds we wait to establish a connection to
+        the remote server (None if we wait forever).
+        """
+        if self._socket_connect_timeout is not None:
+            return self._deadline_timeout(self._socket_connect_timeout)
+
+        return self._deadline_timeout(self._default_timeout('connect'))
+
+    @property
+    def socket_read_timeout(self):
+        """
+        Returns the number of seconds we wait for the remote server to
+        respond once connected (None if we wait forever).
+        """
+        if self._socket_read_timeout is not None:
+            return self._deadline_timeout(self._socket_read_timeout)
+
+        return self._deadline_timeout(self._default_timeout('read'))
+
+    def _default_timeout(self, name):
+        """
+        Returns our (connect or read) timeout when one wasn't specified for
+        us; it's our asset's, unless we define a default of our own and our
+        asset's wasn't explicitly set.
+        """
+        key = 'socket_{}_timeout'.format(name)
+        default = getattr(self, 'default_{}'.format(key))
+        if default is None or key in vars(self.asset):
+            return getattr(self.asset, key)
+
+        return default
+
+    @staticmethod
+    def _deadline_timeout(timeout):
+        """
+        Returns the specified timeout shortened (if need be) so that it never
+        runs past the active deadline.
+        """
+        deadline = Deadline.current()
+        if deadline is None:
+            return timeout
+
+        # A timeout of zero (0) would make our sockets non-blocking
+        remaining = max(deadline.remaining(), 1e-3)
+        return remaining if timeout is None else min(timeout, remaining)
+
+    @property
+    def socket_timeout(self):
+        """
+        Returns a single timeout for use with sockets that don't distinguish
+        between connecting and reading; this is the larger of the two (or
+        None if either of them waits forever).
+        """
+        timeouts = (self.socket_connect_timeout, self.socket_read_timeout)
+        return None if None in timeouts else max(timeouts)
+
+    @property
+    def request_timeout(self):
+        """
+        Returns the (connect, read) timeout tuple passed along to requests
+        """
+        return (self.socket_connect_timeout, self.socket_read_timeout)
+
+    def parse_timeout(self, timeout, name):
+        """
+        Returns the specified timeout (in seconds) as a float; None is
+        returned if no timeout was specified.  A TypeError is thrown if the
+        timeout is invalid.
+        """
+        if timeout is None:
+            return None
+
+        try:
+            timeout = float(timeout)
+            if timeout <= 0:
+                raise ValueError()
+
+        except (TypeError, ValueError):
+            self.logger.error(
+                'Invalid {} timeout {}'.format(name, timeout),
+            )
+            raise TypeError(
+                'Invalid {} timeout {}'.format(name, timeout),
+            )
+
+        return timeout
+
+    def http_request(self, method, url, **kwargs):
+        """
+        Performs an HTTP request (such as 'post' or 'get') using a pooled
+        session associated with the schema, host and port of the url.
+
+        All of the keyword arguments are passed along to requests and the
+        response object is returned.  Exceptions are not caught here; the
+        caller is expected to handle requests.RequestException.
+
+        Requests that fail with one of our request_retry_codes (or a
+        connection error) are retried up to request_retries times.  Only
+        the thread making the request waits between our retries, and each
+        retry is throttled just like the request that preceded it.
+
+        Unless a timeout is specified, our socket timeouts are applied.
+        A DeadlineExceeded exception is thrown if the active deadline has
+        already passed.  The status code (or exception) our request ends with
+        is tracked in the active NotifyResult (if any).
+        """
+        from requests.exceptions import ConnectionError
+        from requests.exceptions import Timeout
+
+        # Never wait forever on a stalled server
+        timeout = kwargs.pop('timeout', None)
+
+        deadline = Deadline.current()
+
+        # The result (if any) we track the outcome of our requests in
+        result = NotifyResult.current()
+
+        attempt = 0
+        while True:
+            if deadline is not None and deadline.expired():
+                raise DeadlineExceeded()
+
+            kwargs['timeout'] = \
+                self.request_timeout if timeout is None else timeout
+
+            try:
+                response = self.session_pool.request(method, url, **kwargs)
+
+            except Exception as e:
+                if result is not None:
+                    result.status = None
+                    result.error = e.__class__.__name__
+
+                if not isinstance(e, (ConnectionError, Timeout)) or \
+                        attempt >= self.request_retries:
+                    raise
+
+                delay = self.retry_delay(attempt)
+                if deadline is not None and delay >= deadline.remaining():
+                    # We'd run past our deadline
+                    raise
+
+                self.logger.debug(
+                    'HTTP request failed ({}); retrying in {:.2f}s...'.format(
+                        e.__class__.__name__, delay))
+
+            else:
+                if result is not None:
+                    result.status = response.status_code
+                    result.error = None
+
+                if attempt >= self.request_retries or \
+                        response.status_code not in self.request_retry_codes:
+                    return response
+
+                delay = self.retry_delay(attempt, response=response)
+                if delay is None or (deadline is not None and
+                                     delay >= deadline.remaining()):
+                    # We were asked to wait too long
+                    return response
+
+                self.logger.debug(
+                    'HTTP request failed (error={}); retrying in {:.2f}s...'
+                    .format(response.status_code, delay))
+
+            attempt += 1
+            sleep(delay)
+
+            # Our retry is i/o like any other; take our turn so that we never
+            # add to the load of a server that is already refusing us.  This
+            # throws DeadlineExceeded if our turn would arrive too late.
+            self.throttle()
+
+    def retry_delay(self, attempt, response=None):
+        """
+        Returns the number of seconds to wait before retrying a request for
+        the specified (zero based) attempt.
+
+        If the server told us how long to wait through the response's headers
+        we honour it; None is returned if that is longer then we're willing
+        to wait.  Otherwise an exponential backoff with full jitter is used.
+        """
+        if response is not None:
+            delay = self.retry_after(response)
+            if delay is not None:
+                return None if delay > self.request_retry_after_max \
+                    else delay
+
+        return uniform(0, min(
+            self.request_backoff_max, self.request_backoff * (2 ** attempt)))
+
+    @staticmethod
+    def retry_after(response):
+        """
+        Returns the number of seconds the server asked us to wait (using the
+        Retry-After or X-RateLimit-Reset headers) before making our next
+        request, or None if it didn't say.
+        """
+        headers = response.headers
+        if not headers:
+            return None
+
+        value = headers.get('Retry-After')
+        if value:
+            try:
+                # Retry-After: <seconds>
+                return max(0.0, float(value))
 
-        # If we reach here, we need to do additional logic.
-        # If the difference between the reference time and 'now' is less than
-        # the defined request_rate_per_sec then we need to throttle for the
-        # remaining balance of this time.
+            except ValueError:
+                # Retry-After: <http-date>
+                date = parsedate_tz(value)
+                if date is not None:
+                    return max(0.0, mktime_tz(date) - time())
+
+        value = headers.get('X-RateLimit-Reset')
+        if value:
+            try:
+                value = float(value)
 
-        elapsed = (reference - self._last_io_datetime).total_seconds()
+            except ValueError:
+                return None
 
-        if elapsed < self.request_rate_per_sec:
-            self.logger.debug('Throttling for {}s...'.format(
-                self.request_rate_per_sec - elapsed))
-            sleep(self.request_rate_per_sec - elapsed)
+            # Most services provide the (epoch) time our limit is reset at,
+            # while some provide the number of seconds remaining instead
+            return max(0.0, value - time() if value > 1e9 else value)
 
-        # Update our timestamp before we leave
-        self._last_io_datetime = reference
-        return
+        return None
+
+    def http_post(self, url, **kwargs):
+        """
+        Performs an HTTP POST; refer to http_request() for more details
+        """
+        return self.http_request('post', url, **kwargs)
+
+    def http_get(self, url, **kwargs):
+        """
+        Performs an HTTP GET; refer to http_request() for more details
+        """
+        return self.http_request('get', url, **kwargs)
 
     def image_url(self, notify_type, logo=False, extension=None):
         """
@@ -313,44 +793,200 @@ class NotifyBase(object):
 
         """
 
+        if not self.metrics.sinks:
+            # There is nothing to measure
+            return self._notify(
+                body=body, title=title, notify_type=notify_type,
+                overflow=overflow)
+
+        result = NotifyResult.current()
+        if result is None or result.server is not self:
+            # We need a result to track the details of our notification in
+            with NotifyResult(self):
+                return self.notify(
+                    body=body, title=title, notify_type=notify_type,
+                    overflow=overflow)
+
+        measured = self._measure(result)
+
+        try:
+            status = self._notify(
+                body=body, title=title, notify_type=notify_type,
+                overflow=overflow)
+
+        except Exception as e:
+            measured(False, reason=e.__class__.__name__)
+            raise
+
+        measured(status)
+        return status
+
+    def _notify(self, body, title=None, notify_type=NotifyType.INFO,
+                overflow=None):
+        """
+        Sends our (overflow adjusted) notification
+
+        """
+
         # Handle situations where the title is None
         title = '' if not title else title
 
-        # Apply our overflow (if defined)
-        for chunk in self._apply_overflow(body=body, title=title,
-                                          overflow=overflow):
-            # Send notification
-            if not self.send(body=chunk['body'], title=chunk['title'],
-                             notify_type=notify_type):
-
-                # Toggle our return status flag
-                return False
+        with self._notify_lock:
+            for chunk in self._chunks(
+                    body=body, title=title, overflow=overflow,
+                    deadline=Deadline.current()):
+                # Send notification
+                with self.hooks.stage(
+                        HookStage.SEND, server=self, body=chunk['body'],
+                        title=chunk['title'],
+                        notify_type=notify_type) as stage:
+                    status = self.send(
+                        body=chunk['body'], title=chunk['title'],
+                        notify_type=notify_type)
+                    stage.update(result=status)
+
+                if not status:
+                    # Toggle our return status flag
+                    return False
+
+                result = NotifyResult.current()
+                if result is not None:
+                    # Track what we've sent
+                    result.sent(chunk)
 
         return True
 
+    def _chunks(self, body, title='', overflow=None, deadline=None):
+        """
+        A generator of the (overflow adjusted) chunks of our notification;
+        refer to _apply_overflow().  DeadlineExceeded is thrown instead of
+        producing our next chunk once our deadline (if specified) passes.
+
+        """
+        # Apply our overflow (if defined); our chunks are generated as
+        # they're sent so only the first is prepared here
+        chunks = self._apply_overflow(
+            body=body, title=title, overflow=overflow)
+        with self.hooks.stage(
+                HookStage.OVERFLOW, server=self, body=body, title=title,
+                overflow=overflow):
+            chunks = chain([next(chunks)], chunks)
+
+        for chunk in chunks:
+            if deadline is not None and deadline.expired():
+                # We ran out of time
+                raise DeadlineExceeded()
+
+            yield chunk
+
+    def _measure(self, result):
+        """
+        Starts measuring a notification whose details are tracked in the
+        result specified; a function is returned that sends our metrics
+        (refer to emit_metrics()) once it's called with our outcome.
+
+        """
+        # Only measure what this notification sends
+        chunks, nbytes = result.chunks, result.bytes
+        started = monotonic()
+
+        def measured(success, reason=None):
+            self.emit_metrics(
+                result, success, latency=monotonic() - started,
+                chunks=result.chunks - chunks, nbytes=result.bytes - nbytes,
+                reason=reason)
+
+        return measured
+
+    def metric_labels(self, **labels):
+        """
+        Returns the labels our metrics are identified by; any additional
+        labels specified are included.
+
+        """
+        protocol = self.secure_protocol \
+            if self.secure and self.secure_protocol else \
+            (self.protocol or self.secure_protocol)
+
+        if isinstance(protocol, (list, tuple, set)):
+            protocol = sorted(protocol)[0] if protocol else None
+
+        labels['service'] = self.service_name or self.__class__.__name__
+        labels['protocol'] = protocol or 'unknown'
+        return labels
+
+    def emit_metrics(self, result, success, latency, chunks=0, nbytes=0,
+                     reason=None):
+        """
+        Sends the metrics describing a notify() call to our sinks; these
+        are:
+          - apprise_notify_attempts_total: the notifications attempted
+          - apprise_notify_successes_total: the notifications sent
+          - apprise_notify_failures_total: the notifications that failed;
+            they're labelled by reason (an exception class, an HTTP status
+            code such as http_500 or simply 'failed')
+          - apprise_notify_chunks_total: the chunks (messages) sent
+          - apprise_notify_bytes_total: the bytes (of content) sent
+          - apprise_notify_latency_seconds: a histogram of the time it took
+            to notify our server
+
+        The time spent throttling is tracked separately (refer to
+        throttle()).
+
+        """
+        labels = self.metric_labels()
+        metrics = self.metrics
+
+        metrics.increment('apprise_notify_attempts_total', labels)
+        if success:
+            metrics.increment('apprise_notify_successes_total', labels)
+
+        else:
+            if reason is None:
+                reason = result.error if result.error else \
+                    'http_{}'.format(result.status) \
+                    if result.status is not None else 'failed'
+
+            metrics.increment(
+                'apprise_notify_failures_total',
+                self.metric_labels(reason=reason))
+
+        if chunks:
+            metrics.increment('apprise_notify_chunks_total', labels, chunks)
+
+        if nbytes:
+            metrics.increment('apprise_notify_bytes_total', labels, nbytes)
+
+        metrics.observe('apprise_notify_latency_seconds', labels, latency)
+
+    def async_notify(self, body, title=None, notify_type=NotifyType.INFO,
+                     overflow=None, **kwargs):
+        """
+        Returns a coroutine that performs the notification; this is the
+        asyncio equivalent of notify() and requires Python v3.5 or newer.
+
+        """
+        from ..py3compat import asyncio as py3aio
+        return py3aio.notify(
+            self, body=body, title=title, notify_type=notify_type,
+            overflow=overflow, **kwargs)
+
     def _apply_overflow(self, body, title=None, overflow=None):
         """
         Takes the message body and title as input.  This function then
         applies any defined overflow restrictions associated with the
         notification service and may alter the message if/as required.
 
-        The function will always return a list object in the following
-        structure:
-            [
-                {
-                    title: 'the title goes here',
-                    body: 'the message body goes here',
-                },
-                {
-                    title: 'the title goes here',
-                    body: 'the message body goes here',
-                },
+        The function is a generator; each chunk of our message is produced
+        (as it's consumed) in the following structure:
+            {
+                title: 'the title goes here',
+                body: 'the message body goes here',
+            }
 
-            ]
+        Only one chunk is yielded unless we're in SPLIT mode.
         """
 
-        response = list()
-
         # tidy
         title = '' if not title else title.strip()
         body = '' if not body else body.rstrip()
@@ -373,34 +1009,140 @@ class NotifyBase(object):
 
         if overflow == OverflowMode.UPSTREAM:
             # Nothing more to do
-            response.append({'body': body, 'title': title})
-            return response
+            yield {'body': body, 'title': title}
+            return
 
         elif len(title) > self.title_maxlen:
             # Truncate our Title
             title = title[:self.title_maxlen]
 
-        if self.body_maxlen > 0 and len(body) <= self.body_maxlen:
-            response.append({'body': body, 'title': title})
-            return response
+        if self.body_maxlen <= 0 or len(body) <= self.body_maxlen:
+            yield {'body': body, 'title': title}
+            return
 
         if overflow == OverflowMode.TRUNCATE:
-            # Truncate our body and return
-            response.append({
-                'body': body[:self.body_maxlen],
-                'title': title,
-            })
-            # For truncate mode, we're done now
-            return response
+            # Truncate our body; for truncate mode, we're done now
+            yield {'body': body[:self.body_maxlen], 'title': title}
+            return
 
         # If we reach here, then we are in SPLIT mode.
         # For here, we want to split the message as many times as we have to
         # in order to fit it within the designated limits.
-        response = [{
-            'body': body[i: i + self.body_maxlen],
-            'title': title} for i in range(0, len(body), self.body_maxlen)]
+        limit = self.body_maxlen
+        spans = None
+        total = None
+
+        if self.overflow_label:
+            # Estimate how many chunks we'll need so we can make room for
+            # our label; if the chunks we end up with need a longer label
+            # (such as going from 9 to 10 of them), we try again with it.
+            total = (len(body) + self.body_maxlen - 1) // self.body_maxlen
+            if self.overflow_max_chunks > 0:
+                total = min(total, self.overflow_max_chunks)
+
+            while True:
+                label = len(self.overflow_label_format.format(total, total))
+                limit = self.body_maxlen - label
+                if limit <= 0:
+                    # There is no room for our label
+                    limit = self.body_maxlen
+                    spans = None
+                    total = None
+                    break
+
+                # We need to know how many chunks there are before we can
+                # label them; only their offsets are stored though
+                spans = list(islice(
+                    self._split_overflow(body, limit),
+                    (self.overflow_max_chunks + 1)
+                    if self.overflow_max_chunks > 0 else None))
+                total = min(len(spans), self.overflow_max_chunks) \
+                    if self.overflow_max_chunks > 0 else len(spans)
+
+                if len(self.overflow_label_format.format(
+                        total, total)) <= label:
+                    # Our label fits
+                    break
+
+        if spans is None:
+            spans = self._split_overflow(body, limit)
+
+        for (index, (start, end)) in enumerate(spans, start=1):
+            if self.overflow_max_chunks > 0 \
+                    and index > self.overflow_max_chunks:
+                self.logger.warning(
+                    'Message exceeds {} chunks; the remainder was '
+                    'discarded.'.format(self.overflow_max_chunks))
+                return
+
+            chunk = body[start:end]
+            if total is not None:
+                chunk = self.overflow_label_format.format(index, total) \
+                    + chunk
+
+            yield {'body': chunk, 'title': title}
+
+    def _split_overflow(self, body, limit):
+        """
+        A generator of the (start, end) offsets of each chunk our body is
+        split into; no chunk is longer than the limit specified.
 
-        return response
+        We prefer to split on a line boundary, and then a word boundary, so
+        long as it's in the second half of our chunk; otherwise we split
+        mid-word.  HTML tags and entities are never split in half.
+
+        """
+        html = self.notify_format == NotifyFormat.HTML
+        start = 0
+        length = len(body)
+
+        while start < length:
+            end = start + limit
+            if end >= length:
+                # The remainder fits
+                yield (start, length)
+                return
+
+            # Our boundary may be the first character after our chunk as it
+            # isn't included in it
+            floor = start + (limit // 2)
+            cut = body.rfind('\n', floor, end + 1)
+            if cut < 0:
+                cut = max(
+                    body.rfind(' ', floor, end + 1),
+                    body.rfind('\t', floor, end + 1))
+
+            # The boundary (whitespace) is skipped over
+            skip = 1
+            if cut < 0:
+                # Split mid-word
+                cut, skip = end, 0
+
+            if html:
+                tag = body.rfind('<', start, cut)
+                if tag > start and body.find('>', tag, cut) < 0:
+                    # Don't split our HTML tag in half
+                    cut, skip = tag, 0
+
+                else:
+                    entity = body.rfind('&', max(start, cut - 32), cut)
+                    if entity > start and \
+                            HTML_ENTITY_RE.match(body[entity:cut]):
+                        # Don't split our HTML entity in half
+                        cut, skip = entity, 0
+
+            # Trailing whitespace (such as a carriage return) is dropped
+            stop = cut
+            while stop > start and body[stop - 1].isspace():
+                stop -= 1
+
+            if stop > start:
+                yield (start, stop)
+
+            # Our next chunk never starts with a line break
+            start = cut + skip
+            while start < length and body[start] in '\r\n':
+                start += 1
 
     def send(self, body, title='', notify_type=NotifyType.INFO, **kwargs):
         """
@@ -409,6 +1151,39 @@ class NotifyBase(object):
         """
         raise NotImplementedError("send() is implimented by the child class.")
 
+    def _send_prepaid(self, bucket, **kwargs):
+        """
+        Calls send() having already taken (and waited on) a token from the
+        token bucket specified; the first throttle() call it makes won't
+        take another.  This lets our coroutines do their waiting without
+        blocking (see async_throttle()).
+
+        """
+        self._prepaid.bucket = bucket
+        try:
+            return self.send(**kwargs)
+
+        finally:
+            self._prepaid.bucket = None
+
+    def async_send(self, body, title='', notify_type=NotifyType.INFO,
+                   **kwargs):
+        """
+        Returns a coroutine that performs the actual notification itself.
+
+        Child classes capable of performing their i/o without blocking may
+        over-ride this; by default the throttle is awaited using
+        asyncio.sleep() and send() is run inside of the event loop's default
+        executor (without throttling a second time).  None of our plugins
+        over-ride it, so no more notifications are sent at once than there
+        are threads in that executor's pool; use loop.set_default_executor()
+        to allow more.
+
+        """
+        from ..py3compat import asyncio as py3aio
+        return py3aio.send(
+            self, body=body, title=title, notify_type=notify_type, **kwargs)
+
     def url(self):
         """
         Assembles the URL associated with the notification based on the
@@ -417,6 +1192,112 @@ class NotifyBase(object):
         """
         raise NotImplementedError("url() is implimented by the child class.")
 
+    def url_lossless(self):
+        """
+        Returns True if the server loaded from our url() is identical to us;
+        only then can our URL stand in for us (such as when it's stored to
+        notify us later on).  Our answer is cached.
+
+        Servers are compared by their (public) attributes holding plain data
+        other then their tags and url_volatile attributes.
+
+        """
+        lossless = getattr(self, '_url_lossless', None)
+        if lossless is not None:
+            return lossless
+
+        # Avoid a circular import
+        from ..Apprise import Apprise
+
+        try:
+            server = Apprise.instantiate(self.url(), asset=self.asset)
+
+        except NotImplementedError:
+            # We have no URL
+            server = None
+
+        lossless = server is not None and \
+            server.__class__ is self.__class__ and \
+            server._url_state(self) == self._url_state(server)
+
+        self._url_lossless = lossless
+        return lossless
+
+    def _url_state(self, other=None):
+        """
+        Returns the attributes compared by url_lossless(); the attributes
+        the other server (if specified) holds are included too.
+
+        """
+        ignore = ('tags', ) + tuple(self.url_volatile)
+
+        names = set(vars(self))
+        if other is not None:
+            names |= set(vars(other))
+
+        state = dict()
+        for name in names:
+            if name.startswith('_') or name in ignore:
+                continue
+
+            value = getattr(self, name, None)
+            if value is None or compat_is_basestring(value) or isinstance(
+                    value, (bool, int, float, list, tuple, dict, set)):
+                state[name] = value
+
+        return state
+
+    def url_privacy(self):
+        """
+        Returns a version of our URL that is safe to share (such as in our
+        logs and results); it identifies our service along with the host
+        (and port) we connect to if url_privacy_host is set.  Everything
+        else is left out as any part of our URL may hold a credential.
+
+        """
+        try:
+            schema = self.url().split('://', 1)[0]
+
+        except NotImplementedError:
+            # We have no URL
+            schema = self.__class__.__name__.lower()
+
+        if not (self.url_privacy_host and self.host):
+            return '{}://'.format(schema)
+
+        return '{schema}://{host}{port}/'.format(
+            schema=schema,
+            host=self.host,
+            port='' if self.port is None else ':{}'.format(self.port),
+        )
+
+    def url_args(self, args=None):
+        """
+        Returns the URL arguments shared by all of our services (such as our
+        format and overflow mode) for use by url(); any (service specific)
+        arguments specified are included.
+
+        Our retries and timeouts are only included if they were set.
+        """
+        results = {
+            'format': self.notify_format,
+            'overflow': self.overflow_mode,
+        }
+
+        if self.request_retries != self.__class__.request_retries:
+            results['retry'] = self.request_retries
+
+        if self._socket_connect_timeout is not None:
+            results['cto'] = self._socket_connect_timeout
+
+        if self._socket_read_timeout is not None:
+            results['rto'] = self._socket_read_timeout
+
+        if args:
+            results.update(args)
+
+        return results
+
     def __contains__(self, tags):
         """
         Returns true if the tag specified is associated with this notification.
@@ -430,6 +1311,32 @@ class NotifyBase(object):
         # return any match
         return tags in self.tags
 
+    @property
+    def tags(self):
+        """
+        Returns the tags associated with this notification service
+        """
+        return self._tags
+
+    @tags.setter
+    def tags(self, tags):
+        """
+        Associates a new set of tags with this notification service
+        """
+        if isinstance(tags, (set, frozenset)):
+            # Track the changes made to our set from here on
+            tags = TagSet(tags, server=self)
+
+        self._tags = tags
+        self._tags_changed()
+
+    def _tags_changed(self):
+        """
+        Tells the Apprise objects we were added to that our tags changed
+        """
+        for owner in list(getattr(self, '_tag_owners', ())):
+            owner._index_invalidate()
+
     @property
     def app_id(self):
         return self.asset.app_id
@@ -684,6 +1591,15 @@ class NotifyBase(object):
                         results['overflow']))
                 del results['overflow']
 
+        # Our credentials are URL encoded (just as url() writes them)
+        for key in ('user', 'password'):
+            if results[key]:
+                results[key] = NotifyBase.unquote(results[key])
+
+        if not results['password']:
+            # An empty password is no password at all
+            results['password'] = None
+
         # Password overrides
         if 'pass' in results['qsd']:
             results['password'] = results['qsd']['pass']
@@ -692,4 +1608,29 @@ class NotifyBase(object):
         if 'user' in results['qsd']:
             results['user'] = results['qsd']['user']
 
+        # Allow overriding our connect and read timeouts
+        for key in ('cto', 'rto'):
+            if key in results['qsd']:
+                try:
+                    timeout = float(results['qsd'][key])
+                    if timeout <= 0:
+                        raise ValueError()
+
+                    results[key] = timeout
+
+                except (TypeError, ValueError):
+                    NotifyBase.logger.warning(
+                        'Unsupported timeout specified {}={}'.format(
+                            key, results['qsd'][key]))
+
+        # Allow overriding the number of times our requests are retried
+        if 'retry' in results['qsd']:
+            try:
+                results['retry'] = max(0, int(results['qsd']['retry']))
+
+            except (TypeError, ValueError):
+                NotifyBase.logger.warning(
+                    'Unsupported retry count specified {}'.format(
+                        results['qsd']['retry']))
+
         return results
@@ -234,7 +234,7 @@ class NotifyBoxcar(NotifyBase):
         self.throttle()
 
         try:
-            r = requests.post(
+            r = self.http_post(
                 notify_url,
                 data=dumps(payload),
                 headers=headers,
@@ -282,10 +282,7 @@ class NotifyBoxcar(NotifyBase):
         """
 
         # Define any arguments set
-        args = {
-            'format': self.notify_format,
-            'overflow': self.overflow_mode,
-        }
+        args = self.url_args()
 
         return '{schema}://{access}/{secret}/{recipients}/?{args}'.format(
             schema=self.secure_protocol,
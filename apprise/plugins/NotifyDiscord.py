@@ -207,7 +207,7 @@ class NotifyDiscord(NotifyBase):
         self.throttle()
 
         try:
-            r = requests.post(
+            r = self.http_post(
                 notify_url,
                 data=dumps(payload),
                 headers=headers,
@@ -252,17 +252,23 @@ class NotifyDiscord(NotifyBase):
         """
 
         # Define any arguments set
-        args = {
-            'format': self.notify_format,
-            'overflow': self.overflow_mode,
+        args = self.url_args({
             'tts': 'yes' if self.tts else 'no',
             'avatar': 'yes' if self.avatar else 'no',
             'footer': 'yes' if self.footer else 'no',
             'thumbnail': 'yes' if self.thumbnail else 'no',
-        }
+        })
+
+        # Determine Authentication
+        auth = ''
+        if self.user:
+            auth = '{user}@'.format(
+                user=self.quote(self.user, safe=''),
+            )
 
-        return '{schema}://{webhook_id}/{webhook_token}/?{args}'.format(
+        return '{schema}://{auth}{webhook_id}/{webhook_token}/?{args}'.format(
             schema=self.secure_protocol,
+            auth=auth,
             webhook_id=self.quote(self.webhook_id),
             webhook_token=self.quote(self.webhook_token),
             args=self.urlencode(args),
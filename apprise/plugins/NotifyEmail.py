@@ -226,6 +226,9 @@ class NotifyEmail(NotifyBase):
     # A URL that takes you to the setup/help of the specific protocol
     setup_url = 'https://github.com/caronc/apprise/wiki/Notify_email'
 
+    # Our host is the server we connect to; it can be shared
+    url_privacy_host = True
+
     # Default Notify Format
     notify_format = NotifyFormat.HTML
 
@@ -238,8 +241,10 @@ class NotifyEmail(NotifyBase):
     # Default Secure Mode
     default_secure_mode = SecureMailMode.STARTTLS
 
-    # Default SMTP Timeout (in seconds)
-    connect_timeout = 15
+    # Default SMTP Timeouts (in seconds); SMTP greetings and STARTTLS
+    # handshakes can be slow so we wait longer than most
+    default_socket_connect_timeout = 15.0
+    default_socket_read_timeout = 15.0
 
     def __init__(self, **kwargs):
         """
@@ -255,12 +260,22 @@ class NotifyEmail(NotifyBase):
             else:
                 self.port = self.default_port
 
-        # Email SMTP Server Timeout
+        # Email SMTP Server Timeout; if specified, it is used as both our
+        # connect and read timeout (unless they're otherwise specified).
         try:
-            self.timeout = int(kwargs.get('timeout', self.connect_timeout))
+            self.timeout = int(kwargs.get('timeout'))
+            if self.timeout <= 0:
+                raise ValueError()
 
         except (ValueError, TypeError):
-            self.timeout = self.connect_timeout
+            self.timeout = None
+
+        if self.timeout:
+            if self._socket_connect_timeout is None:
+                self._socket_connect_timeout = float(self.timeout)
+
+            if self._socket_read_timeout is None:
+                self._socket_read_timeout = float(self.timeout)
 
         # Now we want to construct the To and From email
         # addresses from the URL provided
@@ -389,9 +404,12 @@ class NotifyEmail(NotifyBase):
                 self.smtp_host,
                 self.port,
                 None,
-                timeout=self.timeout,
+                timeout=self.socket_connect_timeout,
             )
 
+            # Now that we're connected, apply our read timeout
+            socket.sock.settimeout(self.socket_read_timeout)
+
             if self.secure and self.secure_mode == SecureMailMode.STARTTLS:
                 # Handle Secure Connections
                 self.logger.debug('Securing connection with STARTTLS...')
@@ -430,17 +448,23 @@ class NotifyEmail(NotifyBase):
         """
 
         # Define any arguments set
-        args = {
-            'format': self.notify_format,
-            'overflow': self.overflow_mode,
+        args = self.url_args({
             'to': self.to_addr,
             'from': self.from_addr,
             'name': self.from_name,
             'mode': self.secure_mode,
             'smtp': self.smtp_host,
-            'timeout': self.timeout,
             'user': self.user,
-        }
+        })
+
+        if self.timeout:
+            args['timeout'] = self.timeout
+
+            # Our timeout already covers the connect and read timeouts that
+            # weren't otherwise specified
+            for key in ('cto', 'rto'):
+                if args.get(key) == self.timeout:
+                    del args[key]
 
         # pull email suffix from username (if present)
         user = self.user.split('@')[0]
@@ -60,9 +60,15 @@ class NotifyEmby(NotifyBase):
     # A URL that takes you to the setup/help of the specific protocol
     setup_url = 'https://github.com/caronc/apprise/wiki/Notify_emby'
 
+    # Our host is the server we connect to; it can be shared
+    url_privacy_host = True
+
     # Emby uses the http protocol with JSON requests
     emby_default_port = 8096
 
+    # Our session is acquired when we login; it isn't part of our URL
+    url_volatile = ('access_token', 'user_id')
+
     # By default Emby requires you to provide it a device id
     # The following was just a random uuid4 generated one.  There
     # is no real reason to change this, but hey; that's what open
@@ -160,7 +166,7 @@ class NotifyEmby(NotifyBase):
                 url, self.verify_certificate))
 
         try:
-            r = requests.post(
+            r = self.http_post(
                 url,
                 headers=headers,
                 data=dumps(payload),
@@ -322,7 +328,7 @@ class NotifyEmby(NotifyBase):
                 url, self.verify_certificate))
 
         try:
-            r = requests.get(
+            r = self.http_get(
                 url,
                 headers=headers,
                 verify=self.verify_certificate,
@@ -400,7 +406,7 @@ class NotifyEmby(NotifyBase):
             'Emby logout() POST URL: %s (cert_verify=%r)' % (
                 url, self.verify_certificate))
         try:
-            r = requests.post(
+            r = self.http_post(
                 url,
                 headers=headers,
                 verify=self.verify_certificate,
@@ -500,7 +506,7 @@ class NotifyEmby(NotifyBase):
             self.throttle()
 
             try:
-                r = requests.post(
+                r = self.http_post(
                     session_url,
                     data=dumps(payload),
                     headers=headers,
@@ -546,11 +552,9 @@ class NotifyEmby(NotifyBase):
         """
 
         # Define any arguments set
-        args = {
-            'format': self.notify_format,
-            'overflow': self.overflow_mode,
+        args = self.url_args({
             'modal': 'yes' if self.modal else 'no',
-        }
+        })
 
         # Determine Authentication
         auth = ''
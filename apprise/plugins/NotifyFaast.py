@@ -91,7 +91,7 @@ class NotifyFaast(NotifyBase):
         self.throttle()
 
         try:
-            r = requests.post(
+            r = self.http_post(
                 self.notify_url,
                 data=payload,
                 headers=headers,
@@ -135,10 +135,7 @@ class NotifyFaast(NotifyBase):
         """
 
         # Define any arguments set
-        args = {
-            'format': self.notify_format,
-            'overflow': self.overflow_mode,
-        }
+        args = self.url_args()
 
         return '{schema}://{authtoken}/?{args}'.format(
             schema=self.protocol,
@@ -68,6 +68,9 @@ class NotifyGrowl(NotifyBase):
     # A URL that takes you to the setup/help of the specific protocol
     setup_url = 'https://github.com/caronc/apprise/wiki/Notify_growl'
 
+    # Our host is the server we connect to; it can be shared
+    url_privacy_host = True
+
     # Allows the user to specify the NotifyImageSize object
     image_size = NotifyImageSize.XY_72
 
@@ -122,6 +125,9 @@ class NotifyGrowl(NotifyBase):
         self.logger.debug('Growl Registration Payload: %s' % str(payload))
         self.growl = notifier.GrowlNotifier(**payload)
 
+        # GNTP uses a single timeout for all of its socket operations
+        self.growl.socketTimeout = self.socket_timeout
+
         try:
             self.growl.register()
             self.logger.debug(
@@ -186,6 +192,10 @@ class NotifyGrowl(NotifyBase):
         # Always call throttle before any remote server i/o is made
         self.throttle()
 
+        # Our asset (and therefore our timeouts) may have changed since we
+        # were initialized
+        self.growl.socketTimeout = self.socket_timeout
+
         try:
             response = self.growl.notify(**payload)
             if not isinstance(response, bool):
@@ -229,19 +239,24 @@ class NotifyGrowl(NotifyBase):
         }
 
         # Define any arguments set
-        args = {
-            'format': self.notify_format,
-            'overflow': self.overflow_mode,
+        args = self.url_args({
             'priority':
                 _map[GrowlPriority.NORMAL] if self.priority not in _map
                 else _map[self.priority],
             'version': self.version,
-        }
+        })
 
+        # Our password is usually found where our user is (refer to
+        # parse_url()), but both can be specified
         auth = ''
-        if self.password:
+        if self.user and self.password and self.user != self.password:
+            auth = '{user}:{password}@'.format(
+                user=self.quote(self.user, safe=''),
+                password=self.quote(self.password, safe=''),
+            )
+        elif self.password:
             auth = '{password}@'.format(
-                password=self.quote(self.user, safe=''),
+                password=self.quote(self.password, safe=''),
             )
 
         return '{schema}://{auth}{hostname}{port}/?{args}'.format(
@@ -189,7 +189,7 @@ class NotifyIFTTT(NotifyBase):
             self.throttle()
 
             try:
-                r = requests.post(
+                r = self.http_post(
                     url,
                     data=dumps(payload),
                     headers=headers,
@@ -239,10 +239,7 @@ class NotifyIFTTT(NotifyBase):
         """
 
         # Define any arguments set
-        args = {
-            'format': self.notify_format,
-            'overflow': self.overflow_mode,
-        }
+        args = self.url_args()
 
         # Store any new key/value pairs added to our list
         args.update({'+{}'.format(k): v for k, v in self.add_tokens})
@@ -50,6 +50,9 @@ class NotifyJSON(NotifyBase):
     # A URL that takes you to the setup/help of the specific protocol
     setup_url = 'https://github.com/caronc/apprise/wiki/Notify_Custom_JSON'
 
+    # Our host is the server we connect to; it can be shared
+    url_privacy_host = True
+
     # Allows the user to specify the NotifyImageSize object
     image_size = NotifyImageSize.XY_128
 
@@ -90,10 +93,7 @@ class NotifyJSON(NotifyBase):
         """
 
         # Define any arguments set
-        args = {
-            'format': self.notify_format,
-            'overflow': self.overflow_mode,
-        }
+        args = self.url_args()
 
         # Append our headers into our args
         args.update({'+{}'.format(k): v for k, v in self.headers.items()})
@@ -110,14 +110,12 @@ class NotifyJSON(NotifyBase):
                 user=self.quote(self.user, safe=''),
             )
 
-        default_port = 443 if self.secure else 80
-
-        return '{schema}://{auth}{hostname}{port}/?{args}'.format(
+        return '{schema}://{auth}{hostname}{port}{fullpath}?{args}'.format(
             schema=self.secure_protocol if self.secure else self.protocol,
             auth=auth,
             hostname=self.host,
-            port='' if self.port is None or self.port == default_port
-                 else ':{}'.format(self.port),
+            port='' if self.port is None else ':{}'.format(self.port),
+            fullpath=self.quote(self.fullpath, safe='/'),
             args=self.urlencode(args),
         )
 
@@ -164,7 +162,7 @@ class NotifyJSON(NotifyBase):
         self.throttle()
 
         try:
-            r = requests.post(
+            r = self.http_post(
                 url,
                 data=dumps(payload),
                 headers=headers,
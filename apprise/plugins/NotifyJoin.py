@@ -186,7 +186,7 @@ class NotifyJoin(NotifyBase):
             self.throttle()
 
             try:
-                r = requests.post(
+                r = self.http_post(
                     url,
                     data=payload,
                     headers=headers,
@@ -232,10 +232,7 @@ class NotifyJoin(NotifyBase):
         """
 
         # Define any arguments set
-        args = {
-            'format': self.notify_format,
-            'overflow': self.overflow_mode,
-        }
+        args = self.url_args()
 
         return '{schema}://{apikey}/{devices}/?{args}'.format(
             schema=self.secure_protocol,
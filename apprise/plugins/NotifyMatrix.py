@@ -76,6 +76,9 @@ class NotifyMatrix(NotifyBase):
     # A URL that takes you to the setup/help of the specific protocol
     setup_url = 'https://github.com/caronc/apprise/wiki/Notify_matrix'
 
+    # Our host is the server we connect to; it can be shared
+    url_privacy_host = True
+
     # The maximum allowable characters allowed in the body per message
     body_maxlen = 1000
 
@@ -175,7 +178,7 @@ class NotifyMatrix(NotifyBase):
         self.throttle()
 
         try:
-            r = requests.post(
+            r = self.http_post(
                 url,
                 data=dumps(payload),
                 headers=headers,
@@ -247,11 +250,9 @@ class NotifyMatrix(NotifyBase):
         """
 
         # Define any arguments set
-        args = {
-            'format': self.notify_format,
-            'overflow': self.overflow_mode,
+        args = self.url_args({
             'mode': self.mode,
-        }
+        })
 
         # Determine Authentication
         auth = ''
@@ -260,15 +261,12 @@ class NotifyMatrix(NotifyBase):
                 user=self.quote(self.user, safe=''),
             )
 
-        default_port = 443 if self.secure else 80
-
-        return '{schema}://{auth}{host}/{token}{port}/?{args}'.format(
+        return '{schema}://{auth}{host}{port}/{token}/?{args}'.format(
             schema=self.secure_protocol if self.secure else self.protocol,
             host=self.host,
             auth=auth,
             token=self.token,
-            port='' if self.port is None or self.port == default_port
-                 else ':{}'.format(self.port),
+            port='' if self.port is None else ':{}'.format(self.port),
             args=self.urlencode(args),
         )
 
@@ -286,7 +284,12 @@ class NotifyMatrix(NotifyBase):
             return results
 
         # Apply our settings now
-        results['token'] = NotifyBase.unquote(results['query'])
+        results['token'] = ''
+        tokens = [x for x in filter(
+            bool, NotifyBase.split_path(results['fullpath']))]
+        if tokens:
+            # Our token is the last entry in our path
+            results['token'] = tokens[-1]
 
         if 'mode' in results['qsd'] and len(results['qsd']['mode']):
             results['mode'] = results['qsd']\
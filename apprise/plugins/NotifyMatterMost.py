@@ -60,6 +60,9 @@ class NotifyMatterMost(NotifyBase):
     # A URL that takes you to the setup/help of the specific protocol
     setup_url = 'https://github.com/caronc/apprise/wiki/Notify_mattermost'
 
+    # Our host is the server we connect to; it can be shared
+    url_privacy_host = True
+
     # The default Mattermost port
     default_port = 8065
 
@@ -149,7 +152,7 @@ class NotifyMatterMost(NotifyBase):
         self.throttle()
 
         try:
-            r = requests.post(
+            r = self.http_post(
                 url,
                 data=dumps(payload),
                 headers=headers,
@@ -193,16 +196,25 @@ class NotifyMatterMost(NotifyBase):
         """
 
         # Define any arguments set
-        args = {
-            'format': self.notify_format,
-            'overflow': self.overflow_mode,
-        }
+        args = self.url_args()
+
+        if self.channel:
+            # Our channel (if specified)
+            args['channel'] = self.channel
+
+        # Determine Authentication
+        auth = ''
+        if self.user:
+            auth = '{user}@'.format(
+                user=self.quote(self.user, safe=''),
+            )
 
         default_port = 443 if self.secure else self.default_port
         default_schema = self.secure_protocol if self.secure else self.protocol
 
-        return '{schema}://{hostname}{port}/{authtoken}/?{args}'.format(
+        return '{schema}://{auth}{hostname}{port}/{authtoken}/?{args}'.format(
             schema=default_schema,
+            auth=auth,
             hostname=self.host,
             port='' if not self.port or self.port == default_port
                  else ':{}'.format(self.port),
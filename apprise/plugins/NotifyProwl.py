@@ -160,7 +160,7 @@ class NotifyProwl(NotifyBase):
         self.throttle()
 
         try:
-            r = requests.post(
+            r = self.http_post(
                 self.notify_url,
                 data=payload,
                 headers=headers,
@@ -213,12 +213,10 @@ class NotifyProwl(NotifyBase):
         }
 
         # Define any arguments set
-        args = {
-            'format': self.notify_format,
-            'overflow': self.overflow_mode,
+        args = self.url_args({
             'priority': 'normal' if self.priority not in _map
                         else _map[self.priority]
-        }
+        })
 
         return '{schema}://{apikey}/{providerkey}/?{args}'.format(
             schema=self.secure_protocol,
@@ -140,7 +140,7 @@ class NotifyPushBullet(NotifyBase):
             self.throttle()
 
             try:
-                r = requests.post(
+                r = self.http_post(
                     self.notify_url,
                     data=dumps(payload),
                     headers=headers,
@@ -188,10 +188,7 @@ class NotifyPushBullet(NotifyBase):
         """
 
         # Define any arguments set
-        args = {
-            'format': self.notify_format,
-            'overflow': self.overflow_mode,
-        }
+        args = self.url_args()
 
         recipients = '/'.join([self.quote(x) for x in self.recipients])
         if recipients == PUSHBULLET_SEND_TO_ALL:
@@ -216,7 +216,7 @@ class NotifyPushed(NotifyBase):
         self.throttle()
 
         try:
-            r = requests.post(
+            r = self.http_post(
                 self.notify_url,
                 data=dumps(payload),
                 headers=headers,
@@ -261,10 +261,7 @@ class NotifyPushed(NotifyBase):
         """
 
         # Define any arguments set
-        args = {
-            'format': self.notify_format,
-            'overflow': self.overflow_mode,
-        }
+        args = self.url_args()
 
         return '{schema}://{app_key}/{app_secret}/{targets}/?{args}'.format(
             schema=self.secure_protocol,
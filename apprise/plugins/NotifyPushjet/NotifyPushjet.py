@@ -53,6 +53,9 @@ class NotifyPushjet(NotifyBase):
     # A URL that takes you to the setup/help of the specific protocol
     setup_url = 'https://github.com/caronc/apprise/wiki/Notify_pushjet'
 
+    # Our host is the server we connect to; it can be shared
+    url_privacy_host = True
+
     # Disable throttle rate for Pushjet requests since they are normally
     # local anyway (the remote/online service is no more)
     request_rate_per_sec = 0
@@ -80,7 +83,10 @@ class NotifyPushjet(NotifyBase):
             server += ":" + str(self.port)
 
         try:
-            api = pushjet.Api(server)
+            # Our requests are made using our shared (pooled) sessions
+            api = pushjet.Api(
+                server, timeout=self.request_timeout,
+                session=self.session_pool)
             service = api.Service(secret_key=self.secret_key)
 
             service.send(body, title)
@@ -99,19 +105,13 @@ class NotifyPushjet(NotifyBase):
         """
 
         # Define any arguments set
-        args = {
-            'format': self.notify_format,
-            'overflow': self.overflow_mode,
-        }
-
-        default_port = 443 if self.secure else 80
+        args = self.url_args()
 
         return '{schema}://{secret_key}@{hostname}{port}/?{args}'.format(
             schema=self.secure_protocol if self.secure else self.protocol,
             secret_key=self.quote(self.secret_key, safe=''),
             hostname=self.host,
-            port='' if self.port is None or self.port == default_port
-                 else ':{}'.format(self.port),
+            port='' if self.port is None else ':{}'.format(self.port),
             args=self.urlencode(args),
         )
 
@@ -281,21 +281,28 @@ class Api(object):
     Pushjet API instance, or a non-standard one in general.
 
     :param url: The URL to the API instance.
+    :param timeout: The timeout passed along to requests (optional).
+    :param session: The object our requests are made through (optional); it
+        must provide ``request(method, url, **kwargs)`` such as a
+        :class:`requests.Session` does. By default :mod:`requests` is used.
     :ivar url: The URL to the API instance, as supplied.
     """
 
     def __repr__(self):
         return "<Pushjet Api: {}>".format(self.url).encode(sys.stdout.encoding, errors='replace')
 
-    def __init__(self, url):
+    def __init__(self, url, timeout=None, session=None):
         self.url = text_type(url)
+        self.timeout = timeout
+        self.session = session
         self.Service = with_api_bound(Service, self)
         self.Device = with_api_bound(Device, self)
     
     def _request(self, endpoint, method, params=None, data=None):
         url = urljoin(self.url, endpoint)
         try:
-            r = requests.request(method, url, params=params, data=data)
+            r = (self.session or requests).request(
+                method, url, params=params, data=data, timeout=self.timeout)
         except requests.RequestException as e:
             raise RequestError(e)
         status = r.status_code
@@ -195,7 +195,7 @@ class NotifyPushover(NotifyBase):
             self.throttle()
 
             try:
-                r = requests.post(
+                r = self.http_post(
                     self.notify_url,
                     data=payload,
                     headers=headers,
@@ -252,13 +252,11 @@ class NotifyPushover(NotifyBase):
         }
 
         # Define any arguments set
-        args = {
-            'format': self.notify_format,
-            'overflow': self.overflow_mode,
+        args = self.url_args({
             'priority':
                 _map[PushoverPriority.NORMAL] if self.priority not in _map
                 else _map[self.priority],
-        }
+        })
 
         devices = '/'.join([self.quote(x) for x in self.devices])
         if devices == PUSHOVER_SEND_TO_ALL:
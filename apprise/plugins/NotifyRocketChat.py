@@ -68,6 +68,9 @@ class NotifyRocketChat(NotifyBase):
     # A URL that takes you to the setup/help of the specific protocol
     setup_url = 'https://github.com/caronc/apprise/wiki/Notify_rocketchat'
 
+    # Our host is the server we connect to; it can be shared
+    url_privacy_host = True
+
     # The title is not used
     title_maxlen = 0
 
@@ -150,10 +153,7 @@ class NotifyRocketChat(NotifyBase):
         """
 
         # Define any arguments set
-        args = {
-            'format': self.notify_format,
-            'overflow': self.overflow_mode,
-        }
+        args = self.url_args()
 
         # Determine Authentication
         auth = '{user}:{password}@'.format(
@@ -161,14 +161,11 @@ class NotifyRocketChat(NotifyBase):
             password=self.quote(self.password, safe=''),
         )
 
-        default_port = 443 if self.secure else 80
-
         return '{schema}://{auth}{hostname}{port}/{targets}/?{args}'.format(
             schema=self.secure_protocol if self.secure else self.protocol,
             auth=auth,
             hostname=self.host,
-            port='' if self.port is None or self.port == default_port
-                 else ':{}'.format(self.port),
+            port='' if self.port is None else ':{}'.format(self.port),
             targets='/'.join(
                 [self.quote(x) for x in chain(
                     # Channels are prefixed with a pound/hashtag symbol
@@ -245,7 +242,7 @@ class NotifyRocketChat(NotifyBase):
         self.throttle()
 
         try:
-            r = requests.post(
+            r = self.http_post(
                 self.api_url + 'chat.postMessage',
                 data=payload,
                 headers=self.headers,
@@ -295,7 +292,7 @@ class NotifyRocketChat(NotifyBase):
         }
 
         try:
-            r = requests.post(
+            r = self.http_post(
                 self.api_url + 'login',
                 data=payload,
                 verify=self.verify_certificate,
@@ -346,7 +343,7 @@ class NotifyRocketChat(NotifyBase):
         logout of our server
         """
         try:
-            r = requests.post(
+            r = self.http_post(
                 self.api_url + 'logout',
                 headers=self.headers,
                 verify=self.verify_certificate,
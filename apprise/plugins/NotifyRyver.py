@@ -184,7 +184,7 @@ class NotifyRyver(NotifyBase):
         self.throttle()
 
         try:
-            r = requests.post(
+            r = self.http_post(
                 url,
                 data=dumps(payload),
                 headers=headers,
@@ -232,11 +232,9 @@ class NotifyRyver(NotifyBase):
         """
 
         # Define any arguments set
-        args = {
-            'format': self.notify_format,
-            'overflow': self.overflow_mode,
+        args = self.url_args({
             'webhook': self.webhook,
-        }
+        })
 
         # Determine if there is a botname present
         botname = ''
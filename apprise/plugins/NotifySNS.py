@@ -94,6 +94,9 @@ class NotifySNS(NotifyBase):
     # Source: https://docs.aws.amazon.com/sns/latest/api/API_Publish.html
     body_maxlen = 140
 
+    # The AWS SNS API URL; it's specific to the region we notify
+    notify_url = 'https://sns.{region}.amazonaws.com/'
+
     # A title can not be used for SMS Messages.  Setting this to zero will
     # cause any title (if defined) to get placed into the message body.
     title_maxlen = 0
@@ -137,8 +140,7 @@ class NotifySNS(NotifyBase):
         self.aws_region_name = region_name
 
         # Set our notify_url based on our region
-        self.notify_url = 'https://sns.{}.amazonaws.com/'\
-            .format(self.aws_region_name)
+        self.notify_url = self.notify_url.format(region=self.aws_region_name)
 
         # AWS Service Details
         self.aws_service_name = 'sns'
@@ -292,7 +294,7 @@ class NotifySNS(NotifyBase):
         self.logger.debug('AWS Payload: %s' % str(payload))
 
         try:
-            r = requests.post(
+            r = self.http_post(
                 self.notify_url,
                 data=payload,
                 headers=headers,
@@ -536,10 +538,7 @@ class NotifySNS(NotifyBase):
         """
 
         # Define any arguments set
-        args = {
-            'format': self.notify_format,
-            'overflow': self.overflow_mode,
-        }
+        args = self.url_args()
 
         return '{schema}://{key_id}/{key_secret}/{region}/{targets}/'\
             '?{args}'.format(
@@ -255,7 +255,7 @@ class NotifySlack(NotifyBase):
             # Always call throttle before any remote server i/o is made
             self.throttle()
             try:
-                r = requests.post(
+                r = self.http_post(
                     url,
                     data=dumps(payload),
                     headers=headers,
@@ -302,10 +302,7 @@ class NotifySlack(NotifyBase):
         """
 
         # Define any arguments set
-        args = {
-            'format': self.notify_format,
-            'overflow': self.overflow_mode,
-        }
+        args = self.url_args()
 
         # Determine if there is a botname present
         botname = ''
@@ -186,7 +186,7 @@ class NotifyTelegram(NotifyBase):
                 url, self.verify_certificate))
 
         try:
-            r = requests.post(
+            r = self.http_post(
                 url,
                 files=files,
                 data=payload,
@@ -240,7 +240,7 @@ class NotifyTelegram(NotifyBase):
                 url, self.verify_certificate))
 
         try:
-            r = requests.post(
+            r = self.http_post(
                 url,
                 headers=headers,
                 verify=self.verify_certificate,
@@ -429,7 +429,7 @@ class NotifyTelegram(NotifyBase):
             self.logger.debug('Telegram Payload: %s' % str(payload))
 
             try:
-                r = requests.post(
+                r = self.http_post(
                     url,
                     data=dumps(payload),
                     headers=headers,
@@ -492,18 +492,24 @@ class NotifyTelegram(NotifyBase):
         """
 
         # Define any arguments set
-        args = {
-            'format': self.notify_format,
-            'overflow': self.overflow_mode,
-        }
+        args = self.url_args({
+            'image': 'yes' if self.include_image else 'no',
+        })
+
+        chat_ids = list(self.chat_ids)
+
+        # Our user was appended into our list of chat ids; it's placed back
+        # in front of our bot token (our 'bot' prefix keeps it from being
+        # confused with one)
+        prefix = ''
+        if self.user and chat_ids and chat_ids[-1] == self.user:
+            prefix = 'bot{}@'.format(self.quote(chat_ids.pop(), safe=''))
 
-        # No need to check the user token because the user automatically gets
-        # appended into the list of chat ids
-        return '{schema}://{bot_token}/{targets}/?{args}'.format(
+        return '{schema}://{prefix}{bot_token}/{targets}/?{args}'.format(
             schema=self.secure_protocol,
-            bot_token=self.quote(self.bot_token, safe=''),
-            targets='/'.join(
-                [self.quote('@{}'.format(x)) for x in self.chat_ids]),
+            prefix=prefix,
+            bot_token=self.quote(self.bot_token, safe=':'),
+            targets='/'.join([self.quote(x, safe='@') for x in chat_ids]),
             args=self.urlencode(args))
 
     @staticmethod
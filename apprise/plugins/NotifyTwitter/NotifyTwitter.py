@@ -119,7 +119,7 @@ class NotifyTwitter(NotifyBase):
 
         try:
             # Get our API
-            api = tweepy.API(self.auth)
+            api = tweepy.API(self.auth, timeout=self.request_timeout)
 
             # Send our Direct Message
             api.send_direct_message(self.user, text=body)
@@ -57,6 +57,9 @@ class NotifyXBMC(NotifyBase):
     # A URL that takes you to the setup/help of the specific protocol
     setup_url = 'https://github.com/caronc/apprise/wiki/Notify_kodi'
 
+    # Our host is the server we connect to; it can be shared
+    url_privacy_host = True
+
     # Disable throttle rate for XBMC/KODI requests since they are normally
     # local anyway
     request_rate_per_sec = 0
@@ -195,7 +198,7 @@ class NotifyXBMC(NotifyBase):
         self.throttle()
 
         try:
-            r = requests.post(
+            r = self.http_post(
                 url,
                 data=payload,
                 headers=headers,
@@ -240,10 +243,7 @@ class NotifyXBMC(NotifyBase):
         """
 
         # Define any arguments set
-        args = {
-            'format': self.notify_format,
-            'overflow': self.overflow_mode,
-        }
+        args = self.url_args()
 
         # Determine Authentication
         auth = ''
@@ -257,19 +257,19 @@ class NotifyXBMC(NotifyBase):
                 user=self.quote(self.user, safe=''),
             )
 
-        default_schema = self.xbmc_protocol if (
-            self.protocol <= self.xbmc_remote_protocol) else self.kodi_protocol
-        default_port = 443 if self.secure else self.xbmc_default_port
-        if self.secure:
-            # Append 's' to schema
-            default_schema + 's'
+        if self.protocol <= self.xbmc_remote_protocol:
+            schema = self.xbmc_secure_protocol if self.secure \
+                else self.xbmc_protocol
+
+        else:
+            schema = self.kodi_secure_protocol if self.secure \
+                else self.kodi_protocol
 
         return '{schema}://{auth}{hostname}{port}/?{args}'.format(
-            schema=default_schema,
+            schema=schema,
             auth=auth,
             hostname=self.host,
-            port='' if not self.port or self.port == default_port
-                 else ':{}'.format(self.port),
+            port='' if not self.port else ':{}'.format(self.port),
             args=self.urlencode(args),
         )
 
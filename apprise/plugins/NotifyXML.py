@@ -50,6 +50,9 @@ class NotifyXML(NotifyBase):
     # A URL that takes you to the setup/help of the specific protocol
     setup_url = 'https://github.com/caronc/apprise/wiki/Notify_Custom_XML'
 
+    # Our host is the server we connect to; it can be shared
+    url_privacy_host = True
+
     # Allows the user to specify the NotifyImageSize object
     image_size = NotifyImageSize.XY_128
 
@@ -105,10 +108,7 @@ class NotifyXML(NotifyBase):
         """
 
         # Define any arguments set
-        args = {
-            'format': self.notify_format,
-            'overflow': self.overflow_mode,
-        }
+        args = self.url_args()
 
         # Append our headers into our args
         args.update({'+{}'.format(k): v for k, v in self.headers.items()})
@@ -125,14 +125,12 @@ class NotifyXML(NotifyBase):
                 user=self.quote(self.user, safe=''),
             )
 
-        default_port = 443 if self.secure else 80
-
-        return '{schema}://{auth}{hostname}{port}/?{args}'.format(
+        return '{schema}://{auth}{hostname}{port}{fullpath}?{args}'.format(
             schema=self.secure_protocol if self.secure else self.protocol,
             auth=auth,
             hostname=self.host,
-            port='' if self.port is None or self.port == default_port
-                 else ':{}'.format(self.port),
+            port='' if self.port is None else ':{}'.format(self.port),
+            fullpath=self.quote(self.fullpath, safe='/'),
             args=self.urlencode(args),
         )
 
@@ -182,7 +180,7 @@ class NotifyXML(NotifyBase):
         self.throttle()
 
         try:
-            r = requests.post(
+            r = self.http_post(
                 url,
                 data=payload,
                 headers=headers,
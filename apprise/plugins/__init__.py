@@ -23,47 +23,69 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 
-# Used for Testing; specifically test_email_plugin.py needs access
-# to the modules WEBBASE_LOOKUP_TABLE and WebBaseLogin objects
-from . import NotifyEmail as NotifyEmailBase
-
-from .NotifyBoxcar import NotifyBoxcar
-from .NotifyDBus import NotifyDBus
-from .NotifyDiscord import NotifyDiscord
-from .NotifyEmail import NotifyEmail
-from .NotifyEmby import NotifyEmby
-from .NotifyFaast import NotifyFaast
-from .NotifyGrowl.NotifyGrowl import NotifyGrowl
-from .NotifyGnome import NotifyGnome
-from .NotifyIFTTT import NotifyIFTTT
-from .NotifyJoin import NotifyJoin
-from .NotifyJSON import NotifyJSON
-from .NotifyMatrix import NotifyMatrix
-from .NotifyMatterMost import NotifyMatterMost
-from .NotifyProwl import NotifyProwl
-from .NotifyPushed import NotifyPushed
-from .NotifyPushBullet import NotifyPushBullet
-from .NotifyPushjet.NotifyPushjet import NotifyPushjet
-from .NotifyPushover import NotifyPushover
-from .NotifyRocketChat import NotifyRocketChat
-from .NotifyRyver import NotifyRyver
-from .NotifySlack import NotifySlack
-from .NotifySNS import NotifySNS
-from .NotifyTelegram import NotifyTelegram
-from .NotifyTwitter.NotifyTwitter import NotifyTwitter
-from .NotifyXBMC import NotifyXBMC
-from .NotifyXML import NotifyXML
-from .NotifyWindows import NotifyWindows
-
-from .NotifyPushjet import pushjet
-from .NotifyGrowl import gntp
-from .NotifyTwitter import tweepy
+import sys
+from importlib import import_module
+from types import ModuleType
 
 from ..common import NotifyImageSize
 from ..common import NOTIFY_IMAGE_SIZES
 from ..common import NotifyType
 from ..common import NOTIFY_TYPES
 
+# A static manifest of all of our Notification Services.  This allows us to
+# identify the plugin that supports a given schema without having to import
+# every one of our plugin modules (and their dependencies) up front.
+#
+# Each entry is keyed by the name of the plugin and identifies the module
+# (relative to this package) it can be found in along with all of the
+# (secure and insecure) schemas it supports.  If you add a new plugin (or
+# alter the protocols an existing one supports), you must update this table.
+PLUGIN_MANIFEST = {
+    'NotifyBoxcar': ('NotifyBoxcar', ('boxcar', )),
+    'NotifyDBus': ('NotifyDBus', ('qt', 'kde', 'glib', 'dbus')),
+    'NotifyDiscord': ('NotifyDiscord', ('discord', )),
+    'NotifyEmail': ('NotifyEmail', ('mailto', 'mailtos')),
+    'NotifyEmby': ('NotifyEmby', ('emby', 'embys')),
+    'NotifyFaast': ('NotifyFaast', ('faast', )),
+    'NotifyGnome': ('NotifyGnome', ('gnome', )),
+    'NotifyGrowl': ('NotifyGrowl.NotifyGrowl', ('growl', )),
+    'NotifyIFTTT': ('NotifyIFTTT', ('ifttt', )),
+    'NotifyJoin': ('NotifyJoin', ('join', )),
+    'NotifyJSON': ('NotifyJSON', ('json', 'jsons')),
+    'NotifyMatrix': ('NotifyMatrix', ('matrix', 'matrixs')),
+    'NotifyMatterMost': ('NotifyMatterMost', ('mmost', 'mmosts')),
+    'NotifyProwl': ('NotifyProwl', ('prowl', )),
+    'NotifyPushed': ('NotifyPushed', ('pushed', )),
+    'NotifyPushBullet': ('NotifyPushBullet', ('pbul', )),
+    'NotifyPushjet': ('NotifyPushjet.NotifyPushjet', ('pjet', 'pjets')),
+    'NotifyPushover': ('NotifyPushover', ('pover', )),
+    'NotifyRocketChat': ('NotifyRocketChat', ('rocket', 'rockets')),
+    'NotifyRyver': ('NotifyRyver', ('ryver', )),
+    'NotifySlack': ('NotifySlack', ('slack', )),
+    'NotifySNS': ('NotifySNS', ('sns', )),
+    'NotifyTelegram': ('NotifyTelegram', ('tgram', )),
+    'NotifyTwitter': ('NotifyTwitter.NotifyTwitter', ('tweet', )),
+    'NotifyXBMC': ('NotifyXBMC', ('xbmc', 'kodi', 'xbmcs', 'kodis')),
+    'NotifyXML': ('NotifyXML', ('xml', 'xmls')),
+    'NotifyWindows': ('NotifyWindows', ('windows', )),
+}
+
+# Additional modules made accessible from this package (mostly for testing)
+MODULE_REFERENCES = {
+    # Used for Testing; specifically test_email_plugin.py needs access
+    # to the modules WEBBASE_LOOKUP_TABLE and WebBaseLogin objects
+    'NotifyEmailBase': 'NotifyEmail',
+
+    # gntp (used for NotifyGrowl Testing)
+    'gntp': 'NotifyGrowl.gntp',
+
+    # pushjet (used for NotifyPushjet Testing)
+    'pushjet': 'NotifyPushjet.pushjet',
+
+    # tweepy (used for NotifyTwitter Testing)
+    'tweepy': 'NotifyTwitter.tweepy',
+}
+
 __all__ = [
     # Notification Services
     'NotifyBoxcar', 'NotifyDBus', 'NotifyEmail', 'NotifyEmby', 'NotifyDiscord',
@@ -89,3 +111,83 @@ __all__ = [
     # tweepy (used for NotifyTwitter Testing)
     'tweepy',
 ]
+
+
+def _resolve(module, name):
+    """
+    Imports (and returns) the plugin or module reference identified by name
+    and stores it in our package so that it's only ever looked up once.
+
+    """
+    if name in PLUGIN_MANIFEST:
+        value = getattr(import_module(
+            '.' + PLUGIN_MANIFEST[name][0], __name__), name)
+
+    elif name in MODULE_REFERENCES:
+        value = import_module('.' + MODULE_REFERENCES[name], __name__)
+
+    else:
+        raise AttributeError(
+            "module '{}' has no attribute '{}'".format(__name__, name))
+
+    # Bypass our __setattr__() below
+    module.__dict__[name] = value
+    return value
+
+
+class _PluginPackage(ModuleType):
+    """
+    Our package; our plugins are only imported the first time they are
+    referenced.
+
+    """
+
+    def __getattr__(self, name):
+        """
+        Only called when an attribute can't otherwise be found
+        """
+        return _resolve(self, name)
+
+    def __setattr__(self, name, value):
+        """
+        Python sets an attribute on our package for every sub-module that is
+        imported.  Our plugins share the name of the module they're found in
+        so we make sure the plugin (and not its module) is always what's
+        referenced.
+        """
+        if name in PLUGIN_MANIFEST and isinstance(value, ModuleType):
+            if value.__name__ != '{}.{}'.format(
+                    __name__, PLUGIN_MANIFEST[name][0]) or \
+                    not hasattr(value, name):
+                # Leave it for __getattr__() to resolve
+                self.__dict__.pop(name, None)
+                return
+
+            # Store our plugin instead
+            value = getattr(value, name)
+
+        # We intentionally avoid super() here as our class is re-defined if
+        # our package is ever reloaded
+        ModuleType.__setattr__(self, name, value)
+
+    def __dir__(self):
+        """
+        Include the entries we haven't loaded yet
+        """
+        return sorted(set(self.__dict__).union(
+            PLUGIN_MANIFEST, MODULE_REFERENCES))
+
+
+# Discard any plugins we may have already resolved; this only occurs if our
+# package is reloaded and ensures they are looked up again
+for _name in list(PLUGIN_MANIFEST) + list(MODULE_REFERENCES):
+    globals().pop(_name, None)
+
+if sys.version_info >= (3, 5):
+    # Load our plugins on demand
+    sys.modules[__name__].__class__ = _PluginPackage
+
+else:  # pragma: no cover
+    # Module classes can not be altered; load everything now
+    for _name in list(PLUGIN_MANIFEST) + list(MODULE_REFERENCES):
+        globals()[_name] = _resolve(sys.modules[__name__], _name)
@@ -0,0 +1,274 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2019 Chris Caron <lead2gold@gmail.com>
+# All rights reserved.
+#
+# This code is licensed under the MIT License.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files(the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and / or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions :
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# This module is only imported when running Python v3.5 or newer; refer to
+# ASYNCIO_SUPPORT defined in __init__.py
+
+import asyncio
+from functools import partial
+
+from ..common import NotifyType
+from ..AppriseResult import AppriseResult
+from ..AppriseResult import NotifyResult
+from ..hooks import HookStage
+
+
+async def throttle(server, deadline=None, result=None):
+    """
+    A non-blocking equivalent of NotifyBase.throttle().
+
+    We take a token from the server's bucket and wait (using asyncio.sleep())
+    until we're allowed to use it; the bucket is returned so that the send()
+    that follows doesn't take (and block on) a token of its own.
+
+    """
+    bucket = server.throttle_bucket()
+    server._throttle_check(bucket, deadline)
+
+    with server.hooks.stage(HookStage.THROTTLE, server=server) as stage:
+        # Reserve our turn; this tells us how long we need to wait (if at
+        # all)
+        delay = bucket.acquire()
+        stage.update(delay=delay)
+
+        if delay > 0:
+            server.logger.debug('Throttling for {}s...'.format(delay))
+            await asyncio.sleep(delay)
+
+    server._throttled(delay, result)
+    return bucket
+
+
+def call(func, deadline=None, result=None, **kwargs):
+    """
+    Calls the specified function with our deadline and result (if specified)
+    active in the current thread.
+
+    """
+    if result is not None:
+        with result:
+            return call(func, deadline=deadline, **kwargs)
+
+    if deadline is None:
+        return func(**kwargs)
+
+    with deadline:
+        return func(**kwargs)
+
+
+async def send(server, body, title='', notify_type=NotifyType.INFO,
+               deadline=None, result=None, **kwargs):
+    """
+    The default NotifyBase.async_send() implementation; the (blocking) send()
+    call is run inside of our event loop's default executor.
+
+    """
+    bucket = await throttle(server, deadline=deadline, result=result)
+
+    # Our token has been taken already
+    loop = asyncio.get_event_loop()
+    return await loop.run_in_executor(None, partial(
+        call, server._send_prepaid, deadline=deadline, result=result,
+        bucket=bucket, body=body, title=title, notify_type=notify_type,
+        **kwargs))
+
+
+async def notify(server, body, title=None, notify_type=NotifyType.INFO,
+                 overflow=None, **kwargs):
+    """
+    The coroutine equivalent of NotifyBase.notify()
+
+    """
+    if not server.metrics.sinks:
+        # There is nothing to measure
+        return await _notify(
+            server, body=body, title=title, notify_type=notify_type,
+            overflow=overflow, **kwargs)
+
+    result = kwargs.get('result')
+    if result is None:
+        # We need a result to track the details of our notification in
+        result = kwargs['result'] = NotifyResult(server)
+
+    measured = server._measure(result)
+
+    try:
+        status = await _notify(
+            server, body=body, title=title, notify_type=notify_type,
+            overflow=overflow, **kwargs)
+
+    except Exception as e:
+        measured(False, reason=e.__class__.__name__)
+        raise
+
+    measured(status)
+    return status
+
+
+async def _notify(server, body, title=None, notify_type=NotifyType.INFO,
+                  overflow=None, **kwargs):
+    """
+    The coroutine equivalent of NotifyBase._notify()
+
+    """
+    # Handle situations where the title is None
+    title = '' if not title else title
+
+    # A deadline and result (if specified) are passed along to our
+    # async_send() calls
+    deadline = kwargs.get('deadline')
+    result = kwargs.get('result')
+    kwargs = {
+        key: value for (key, value) in
+        (('deadline', deadline), ('result', result)) if value is not None}
+
+    for chunk in server._chunks(
+            body=body, title=title, overflow=overflow, deadline=deadline):
+        # Send notification
+        with server.hooks.stage(
+                HookStage.SEND, server=server, body=chunk['body'],
+                title=chunk['title'], notify_type=notify_type) as stage:
+            status = await server.async_send(
+                body=chunk['body'], title=chunk['title'],
+                notify_type=notify_type, **kwargs)
+            stage.update(result=status)
+
+        if not status:
+            # Toggle our return status flag
+            return False
+
+        if result is not None:
+            # Track what we've sent
+            result.sent(chunk)
+
+    return True
+
+
+async def notify_group(group, title='', notify_type=NotifyType.INFO,
+                       outbox=None, deadline=None, digest=None, dedupe=None,
+                       breakers=None):
+    """
+    The coroutine equivalent of Apprise._notify_group()
+
+    """
+    # Avoid a circular import
+    from ..Apprise import Apprise
+
+    # Acquire what we're sending; our results include the notifications
+    # suppressed (or held in our digest)
+    entries, results = Apprise._coalesce(
+        group, title=title, notify_type=notify_type, digest=digest,
+        dedupe=dedupe, outbox=outbox, breakers=breakers)
+
+    loop = asyncio.get_event_loop()
+
+    for (server, body, title, notify_type) in entries:
+        result, breaker = Apprise._admit(
+            server, deadline=deadline, breakers=breakers)
+        results.append(result)
+
+        if not result.skipped:
+            started = loop.time()
+            try:
+                # Send notification
+                if deadline is None:
+                    result.success = await server.async_notify(
+                        body=body, title=title, notify_type=notify_type,
+                        result=result)
+
+                else:
+                    result.success = await server.async_notify(
+                        body=body, title=title, notify_type=notify_type,
+                        deadline=deadline, result=result)
+
+            except asyncio.CancelledError:
+                # We're no longer waited on (an Exception before Python
+                # v3.8); our outcome is unknown
+                if breaker is not None:
+                    breaker.cancel()
+
+                raise
+
+            except Exception as e:
+                Apprise._failed(result, e, deadline=deadline)
+
+            # Track the time it took to notify our server
+            result.latency = loop.time() - started
+
+        Apprise._settle(
+            result, breaker, body=body, title=title,
+            notify_type=notify_type, outbox=outbox, dedupe=dedupe)
+
+    return results
+
+
+async def apprise_notify(apobj, body, title='', notify_type=NotifyType.INFO,
+                         body_format=None, tag=None, deadline=None,
+                         details=False):
+    """
+    The coroutine equivalent of Apprise.notify(); all of the matched servers
+    are notified concurrently.
+
+    """
+    # Acquire the servers we're going to notify (and what to send them)
+    deadline, groups, status = apobj._notify_prepare(
+        body=body, title=title, body_format=body_format, tag=tag,
+        deadline=deadline)
+
+    if not groups:
+        # Nothing to notify
+        return AppriseResult(success=status) if details else status
+
+    # The outcome of each server notified
+    results = list()
+
+    tasks = [
+        asyncio.ensure_future(notify_group(
+            group, title=title, notify_type=notify_type, outbox=apobj.outbox,
+            deadline=deadline, digest=apobj.digest, dedupe=apobj.dedupe,
+            breakers=apobj.circuit_breakers))
+        for group in groups]
+
+    if deadline is None:
+        for group_results in await asyncio.gather(*tasks):
+            results.extend(group_results)
+
+    else:
+        # Stop waiting once our deadline passes
+        _, pending = await asyncio.wait(tasks, timeout=deadline.remaining())
+        for task in pending:
+            task.cancel()
+
+        for (group, task) in zip(groups, tasks):
+            results.extend(
+                apobj._unfinished(group, deadline) if task in pending
+                else task.result())
+
+    if apobj.outbox is not None:
+        # Write the notifications we failed to deliver
+        loop = asyncio.get_event_loop()
+        await loop.run_in_executor(None, apobj.outbox.sync)
+
+    return apobj._notify_outcome(results, details=details)
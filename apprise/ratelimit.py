@@ -0,0 +1,206 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2019 Chris Caron <lead2gold@gmail.com>
+# All rights reserved.
+#
+# This code is licensed under the MIT License.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files(the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and / or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions :
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import threading
+
+try:
+    # Python 3.3+
+    from time import monotonic
+
+except ImportError:  # pragma: no cover
+    # Python 2.7
+    from time import time as monotonic
+
+
+class TokenBucket(object):
+    """
+    A thread-safe token bucket.
+
+    The bucket holds (at most) burst tokens and is refilled at a rate of one
+    token every interval seconds.  Each request made takes a token from the
+    bucket; when there are none left, the request must wait for the next
+    one to be added.
+
+    Tokens can be reserved ahead of time; concurrent requests are each told
+    how long to wait so that they're spread out at the sustained rate.
+
+    """
+
+    def __init__(self, interval, burst=1):
+        """
+        Initialize our bucket; it starts out full.
+
+        """
+        # The number of seconds it takes to add a token to our bucket
+        self.interval = max(0.0, float(interval))
+
+        # The maximum number of tokens our bucket can hold
+        self.burst = max(1, int(burst))
+
+        # The tokens available (as of our last update). This value can go
+        # negative when tokens are reserved ahead of time.
+        self._tokens = float(self.burst)
+
+        # The (monotonic) time our tokens were last updated
+        self._updated = monotonic()
+
+        # Protects our bucket from concurrent access
+        self._lock = threading.Lock()
+
+    def configure(self, interval, burst=1):
+        """
+        Alters the rate our bucket is refilled at and the number of tokens
+        it can hold.
+
+        """
+        with self._lock:
+            self._refill(monotonic())
+            self.interval = max(0.0, float(interval))
+            self.burst = max(1, int(burst))
+            self._tokens = min(self._tokens, float(self.burst))
+
+    def delay(self, reference=None):
+        """
+        Returns the number of seconds to wait before a token is available.
+        Unlike acquire(), this function never alters the bucket.
+
+        """
+        with self._lock:
+            tokens = self._tokens
+            if self.interval > 0.0:
+                elapsed = (
+                    monotonic() if reference is None else reference) \
+                    - self._updated
+                tokens = min(
+                    float(self.burst),
+                    tokens + max(0.0, elapsed) / self.interval)
+
+            return self._wait(tokens)
+
+    def acquire(self, reference=None):
+        """
+        Takes a token from our bucket and returns the number of seconds the
+        caller must wait before using it.  This function never blocks.
+
+        """
+        with self._lock:
+            self._refill(monotonic() if reference is None else reference)
+            self._tokens -= 1.0
+            return self._wait(self._tokens + 1.0)
+
+    def drain(self, elapsed=0.0):
+        """
+        Empties our bucket as though its last token was taken elapsed
+        seconds ago.
+
+        """
+        with self._lock:
+            self._tokens = 0.0
+            self._updated = monotonic() - max(0.0, elapsed)
+            self._refill(monotonic())
+
+    def _refill(self, reference):
+        """
+        Adds the tokens earned since our last update; this function expects
+        our lock to already be held.
+
+        """
+        if self.interval <= 0.0:
+            # We're not rate limited
+            self._tokens = float(self.burst)
+
+        elif reference > self._updated:
+            self._tokens = min(
+                float(self.burst),
+                self._tokens + (reference - self._updated) / self.interval)
+
+        self._updated = max(self._updated, reference)
+
+    def _wait(self, tokens):
+        """
+        Returns the number of seconds it takes before a token is available
+        when our bucket holds the specified number of them.
+
+        """
+        if tokens >= 1.0 or self.interval <= 0.0:
+            return 0.0
+
+        return (1.0 - tokens) * self.interval
+
+
+class RateLimiter(object):
+    """
+    A thread-safe collection of token buckets shared by all of our
+    notification services.
+
+    Buckets are keyed by the service and host they're associated with; this
+    allows all of the services that notify the same remote server to honour
+    its rate limit together, instead of each one keeping track of it's own.
+
+    """
+
+    def __init__(self):
+        """
+        Initialize our rate limiter
+
+        """
+        # Our token buckets
+        self._buckets = {}
+
+        # Protects our buckets from concurrent access
+        self._lock = threading.Lock()
+
+    def bucket(self, key, interval, burst=1):
+        """
+        Returns the token bucket associated with the specified key; one is
+        created if it doesn't already exist.  The bucket is (re)configured to
+        use the specified interval and burst.
+
+        """
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = TokenBucket(interval=interval, burst=burst)
+                self._buckets[key] = bucket
+                return bucket
+
+        if bucket.interval != interval or bucket.burst != burst:
+            bucket.configure(interval=interval, burst=burst)
+
+        return bucket
+
+    def clear(self):
+        """
+        Removes all of our token buckets
+
+        """
+        with self._lock:
+            self._buckets.clear()
+
+    def __len__(self):
+        """
+        Returns the number of token buckets we're tracking
+        """
+        return len(self._buckets)
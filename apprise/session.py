@@ -0,0 +1,226 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2019 Chris Caron <lead2gold@gmail.com>
+# All rights reserved.
+#
+# This code is licensed under the MIT License.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files(the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and / or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions :
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import threading
+
+try:
+    # Python 2.7
+    from urlparse import urlparse
+
+except ImportError:
+    # Python 3.x
+    from urllib.parse import urlparse
+
+try:
+    # Python 3.3+
+    from time import monotonic
+
+except ImportError:  # pragma: no cover
+    # Python 2.7
+    from time import time as monotonic
+
+# The ports used when one isn't explicitly identified in the URL
+DEFAULT_PORTS = {
+    'http': 80,
+    'https': 443,
+}
+
+
+class SessionPool(object):
+    """
+    A thread-safe pool of requests.Session() objects shared by all of the
+    HTTP based notification services.
+
+    Sessions are keyed by the schema, host and port of the URL they're used
+    to connect to; this allows repeated notifications to the same server to
+    re-use an already established (warm) connection instead of paying for a
+    new TCP connection and TLS handshake each time.
+
+    """
+
+    # Keep our connections open between requests; if this is set to False a
+    # new session is created (and closed) for every request made.
+    keepalive = True
+
+    # The maximum number of connections each session keeps open to its host
+    pool_maxsize = 10
+
+    # Sessions that haven't been used in this many seconds are closed. Set
+    # this to zero (0) to keep sessions around until clear() is called.
+    idle_timeout = 300
+
+    def __init__(self, keepalive=None, pool_maxsize=None, idle_timeout=None):
+        """
+        Initialize our pool; any argument not specified uses the default
+        defined by the class.
+
+        """
+        if keepalive is not None:
+            self.keepalive = keepalive
+
+        if pool_maxsize is not None:
+            self.pool_maxsize = pool_maxsize
+
+        if idle_timeout is not None:
+            self.idle_timeout = idle_timeout
+
+        # Our sessions are stored as key: (session, last_used)
+        self._sessions = {}
+
+        # Protects our sessions from concurrent access
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(url):
+        """
+        Returns the (schema, host, port) tuple the specified URL belongs to.
+
+        """
+        parsed = urlparse(url)
+        schema = parsed.scheme.lower()
+
+        try:
+            port = parsed.port
+
+        except ValueError:
+            # Invalid port specified
+            port = None
+
+        return (
+            schema,
+            (parsed.hostname or '').lower(),
+            port if port else DEFAULT_PORTS.get(schema),
+        )
+
+    def session(self, url):
+        """
+        Returns the session associated with the specified URL; one is created
+        if it doesn't already exist.
+
+        """
+        if not self.keepalive:
+            # Always return a new session
+            return self._create()
+
+        key = self.key(url)
+        reference = monotonic()
+
+        with self._lock:
+            # Close anything that has been sitting idle for too long
+            self._evict(reference)
+
+            try:
+                session = self._sessions[key][0]
+
+            except KeyError:
+                session = self._create()
+
+            # Update our last use
+            self._sessions[key] = (session, reference)
+
+        return session
+
+    def request(self, method, url, **kwargs):
+        """
+        Performs an HTTP request (such as 'post' or 'get') against the
+        specified URL using a pooled session.  The arguments are the same as
+        the ones accepted by requests.Session().request().
+
+        """
+        session = self.session(url)
+
+        try:
+            return getattr(session, method.lower())(url, **kwargs)
+
+        finally:
+            if not self.keepalive:
+                # We're done with our session
+                session.close()
+
+    def evict(self, max_idle=None):
+        """
+        Closes all of the sessions that have been idle for at least max_idle
+        seconds.  If no max_idle is specified, the idle_timeout is used.
+
+        Returns the number of sessions closed.
+
+        """
+        with self._lock:
+            return self._evict(monotonic(), max_idle=max_idle)
+
+    def clear(self):
+        """
+        Closes all of our pooled sessions
+
+        """
+        with self._lock:
+            return self._evict(None, max_idle=0)
+
+    def _evict(self, reference, max_idle=None):
+        """
+        Closes all sessions idle for at least max_idle seconds relative to
+        the reference time provided. If the reference is None then all of the
+        sessions are closed.
+
+        This function expects our lock to already be held.
+
+        """
+        if max_idle is None:
+            max_idle = self.idle_timeout
+
+            if max_idle <= 0:
+                # Idle eviction is disabled
+                return 0
+
+        expired = [
+            key for (key, (_, last_used)) in self._sessions.items()
+            if reference is None or reference - last_used >= max_idle]
+
+        for key in expired:
+            self._sessions.pop(key)[0].close()
+
+        return len(expired)
+
+    def _create(self):
+        """
+        Returns a new requests.Session() object
+
+        """
+        # We import requests here so that it is only loaded once a session is
+        # actually required
+        import requests
+
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=1, pool_maxsize=self.pool_maxsize)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
+    def __len__(self):
+        """
+        Returns the number of sessions currently pooled
+        """
+        return len(self._sessions)
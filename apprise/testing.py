@@ -0,0 +1,555 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2019 Chris Caron <lead2gold@gmail.com>
+# All rights reserved.
+#
+# This code is licensed under the MIT License.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files(the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and / or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions :
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# A local stand-in for the services we notify.  It emulates (just enough of)
+# the APIs our plugins talk to so that they can be load tested (and our
+# retry, throttling and circuit breaking behaviour exercised) offline:
+#
+#   from apprise import Apprise
+#   from apprise.testing import StubServer
+#
+#   with StubServer(latency=0.05, rate_limit=20) as server:
+#       with server.redirect():
+#           a = Apprise()
+#           a.add('slack://T1JJ3T3L2/A1BRTD4JD/TIiajkdnlazkcOXrIdevi7FQ')
+#           a.add('json://{}/'.format(server.netloc))
+#           a.notify(title='title', body='body')
+#
+#       print(server.stats)
+
+import re
+import threading
+from collections import deque
+from collections import namedtuple
+from json import dumps
+from random import Random
+from time import sleep
+
+try:
+    # Python 3.x
+    from http.server import BaseHTTPRequestHandler
+    from http.server import HTTPServer
+    from socketserver import ThreadingMixIn
+    from urllib.parse import parse_qs
+    from urllib.parse import urlparse
+
+except ImportError:  # pragma: no cover
+    # Python 2.7
+    from BaseHTTPServer import BaseHTTPRequestHandler
+    from BaseHTTPServer import HTTPServer
+    from SocketServer import ThreadingMixIn
+    from urlparse import parse_qs
+    from urlparse import urlparse
+
+from .ratelimit import TokenBucket
+
+# The base URLs of the services we emulate (relative to our server) keyed by
+# the plugin that notifies them; see StubServer.redirect().
+STUB_REDIRECTS = {
+    'NotifyDiscord': '{}/api/webhooks',
+    'NotifySlack': '{}/services',
+    'NotifySNS': '{}/',
+    'NotifyTelegram': '{}/bot',
+}
+
+# A request received by our server
+StubRequest = namedtuple(
+    'StubRequest', ('method', 'path', 'headers', 'body', 'status'))
+
+# Our (canned) AWS SNS responses
+SNS_CREATE_TOPIC_RESPONSE = \
+    '<?xml version="1.0" encoding="UTF-8"?>' \
+    '<CreateTopicResponse xmlns="http://sns.amazonaws.com/doc/2010-03-31/">' \
+    '<CreateTopicResult>' \
+    '<TopicArn>arn:aws:sns:us-east-1:000000000000:{topic}</TopicArn>' \
+    '</CreateTopicResult>' \
+    '<ResponseMetadata><RequestId>{request_id}</RequestId>' \
+    '</ResponseMetadata>' \
+    '</CreateTopicResponse>'
+
+SNS_PUBLISH_RESPONSE = \
+    '<?xml version="1.0" encoding="UTF-8"?>' \
+    '<PublishResponse xmlns="http://sns.amazonaws.com/doc/2010-03-31/">' \
+    '<PublishResult><MessageId>{request_id}</MessageId></PublishResult>' \
+    '<ResponseMetadata><RequestId>{request_id}</RequestId>' \
+    '</ResponseMetadata>' \
+    '</PublishResponse>'
+
+SNS_ERROR_RESPONSE = \
+    '<?xml version="1.0" encoding="UTF-8"?>' \
+    '<ErrorResponse xmlns="http://sns.amazonaws.com/doc/2010-03-31/">' \
+    '<Error><Type>Sender</Type><Code>InvalidAction</Code>' \
+    '<Message>Unsupported action: {action}</Message></Error>' \
+    '<RequestId>{request_id}</RequestId>' \
+    '</ErrorResponse>'
+
+# The Emby session we report to be active
+EMBY_SESSION_ID = '7e8f0a6c4e2d4b6e8a1f3c5d7b9e0f12'
+
+# The user that messaged our Telegram bot
+TELEGRAM_USER_ID = 532389719
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """
+    Handles the requests made to our StubServer; the response returned
+    depends on the path (and payload) of the request.
+
+    """
+    # Allow our connections to be kept alive
+    protocol_version = 'HTTP/1.1'
+
+    # Our headers and payload are written separately; don't let them be
+    # held back waiting on an acknowledgement
+    disable_nagle_algorithm = True
+
+    # Our routes (tried in order); each maps a path to the function that
+    # generates its response.
+    routes = (
+        (re.compile(r'^/services/'), 'slack'),
+        (re.compile(r'^/api/webhooks/'), 'discord'),
+        (re.compile(r'^/bot[^/]+/(?P<method>[a-z]+)$', re.I), 'telegram'),
+        (re.compile(r'^/Users/AuthenticateByName$'), 'emby_login'),
+        (re.compile(r'^/Sessions/Logout$'), 'emby_logout'),
+        (re.compile(r'^/Sessions/[^/]+/Message$'), 'emby_message'),
+        (re.compile(r'^/Sessions$'), 'emby_sessions'),
+    )
+
+    def handle_request(self):
+        """
+        Handles every request made to us
+        """
+        server = self.server
+
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length) if length else b''
+
+        if server.latency:
+            sleep(server.latency)
+
+        # Determine if we were asked to fail this request
+        status, headers = server.inject()
+        if status is None:
+            status, headers, content = self.respond(body)
+
+        else:
+            content = dumps({
+                'error': self.responses.get(status, ('Error', ))[0]})
+
+        server.record(StubRequest(
+            self.command, self.path, dict(self.headers), body, status))
+
+        content = content.encode('utf-8') if content else b''
+        self.send_response(status)
+        for key, value in headers.items():
+            self.send_header(key, value)
+
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        if content:
+            self.wfile.write(content)
+
+    # Treat all of our requests the same way
+    do_GET = do_POST = do_PUT = do_DELETE = handle_request
+
+    def respond(self, body):
+        """
+        Returns the status, headers and content of our response
+        """
+        path = urlparse(self.path).path
+        for regex, name in self.routes:
+            match = regex.match(path)
+            if match:
+                return getattr(self, 'respond_' + name)(
+                    body, **match.groupdict())
+
+        if b'Action=' in body:
+            # An AWS request; these are made to the root of our server
+            return self.respond_sns(body)
+
+        # Otherwise we're a generic JSON/XML endpoint
+        if 'xml' in (self.headers.get('Content-Type') or '').lower():
+            return 200, {'Content-Type': 'application/xml'}, \
+                '<?xml version="1.0" encoding="utf-8"?><response/>'
+
+        return 200, {'Content-Type': 'application/json'}, '{}'
+
+    def respond_slack(self, body):
+        """
+        Slack incoming webhooks reply in plain text
+        """
+        return 200, {'Content-Type': 'text/html'}, 'ok'
+
+    def respond_discord(self, body):
+        """
+        Discord webhooks have nothing to say (unless asked to wait)
+        """
+        return 204, {}, None
+
+    def respond_telegram(self, body, method):
+        """
+        Emulates the Telegram Bot API
+        """
+        method = method.lower()
+        if method == 'getupdates':
+            # Someone has started a conversation with our bot
+            result = [{
+                'update_id': 1,
+                'message': {
+                    'message_id': 1,
+                    'from': {
+                        'id': TELEGRAM_USER_ID,
+                        'first_name': 'Apprise',
+                    },
+                    'chat': {
+                        'id': TELEGRAM_USER_ID,
+                        'first_name': 'Apprise',
+                        'type': 'private',
+                    },
+                    'date': 0,
+                    'text': '/start',
+                },
+            }]
+
+        elif method in ('sendmessage', 'sendphoto'):
+            result = {'message_id': self.server.request_id()}
+
+        else:
+            return 404, {'Content-Type': 'application/json'}, dumps({
+                'ok': False,
+                'error_code': 404,
+                'description': 'Not Found',
+            })
+
+        return 200, {'Content-Type': 'application/json'}, dumps({
+            'ok': True,
+            'result': result,
+        })
+
+    def respond_sns(self, body):
+        """
+        Emulates the AWS SNS API (CreateTopic and Publish)
+        """
+        payload = parse_qs(body.decode('utf-8'))
+        action = payload.get('Action', [''])[0]
+        request_id = self.server.request_id()
+
+        if action == 'CreateTopic':
+            return 200, {'Content-Type': 'text/xml'}, \
+                SNS_CREATE_TOPIC_RESPONSE.format(
+                    topic=payload.get('Name', [''])[0],
+                    request_id=request_id)
+
+        elif action == 'Publish':
+            return 200, {'Content-Type': 'text/xml'}, \
+                SNS_PUBLISH_RESPONSE.format(request_id=request_id)
+
+        return 400, {'Content-Type': 'text/xml'}, \
+            SNS_ERROR_RESPONSE.format(action=action, request_id=request_id)
+
+    def respond_emby_login(self, body):
+        """
+        Emby authentication always succeeds
+        """
+        return 200, {'Content-Type': 'application/json'}, dumps({
+            'AccessToken': self.server.request_id(),
+            'User': {'Id': self.server.request_id()},
+        })
+
+    def respond_emby_sessions(self, body):
+        """
+        Returns our (one) active Emby session
+        """
+        return 200, {'Content-Type': 'application/json'}, dumps([{
+            'Id': EMBY_SESSION_ID,
+            'Client': 'Apprise',
+            'DeviceName': 'Apprise',
+            'SupportsRemoteControl': True,
+        }])
+
+    def respond_emby_message(self, body):
+        """
+        Emby messages have no response
+        """
+        return 204, {}, None
+
+    def respond_emby_logout(self, body):
+        """
+        Emby logouts have no response
+        """
+        return 204, {}, None
+
+    def log_message(self, *args):
+        # Keep quiet
+        pass
+
+
+class StubServer(ThreadingMixIn, HTTPServer):
+    """
+    A threaded HTTP server (running on a local port) that emulates the
+    services our plugins notify.
+
+    Its behaviour can be shaped to resemble a real (and busy) service:
+      - latency: the number of seconds each request takes to be answered.
+      - rate_limit: the number of requests per second it accepts (in bursts
+          of up to rate_burst); any others are refused with a 429 and a
+          Retry-After header.
+      - failure_rate: the (0.0 to 1.0) probability a request fails with
+          failure_status.
+
+    Specific failures can be queued up with throttle() and fail().
+
+    """
+    # Don't hold up the interpreter on exit
+    daemon_threads = True
+
+    # Allow our port to be reused right away
+    allow_reuse_address = True
+
+    # The number of requests we keep a record of
+    history = 1000
+
+    def __init__(self, host='127.0.0.1', port=0, latency=0.0, rate_limit=0,
+                 rate_burst=1, retry_after=1.0, failure_rate=0.0,
+                 failure_status=500, seed=None):
+        """
+        Initialize our server; it's not started until start() is called.
+
+        A port of zero (0) has one chosen for us.
+
+        """
+        HTTPServer.__init__(self, (host, port), StubHandler)
+
+        # The number of seconds each request takes
+        self.latency = max(0.0, float(latency))
+
+        # The number of seconds we ask throttled clients to wait
+        self.retry_after = max(0.0, float(retry_after))
+
+        # Our rate limit (if one was specified)
+        self._bucket = TokenBucket(1.0 / rate_limit, burst=rate_burst) \
+            if rate_limit > 0 else None
+
+        # The probability of a request failing and the status code it fails
+        # with
+        self.failure_rate = min(1.0, max(0.0, float(failure_rate)))
+        self.failure_status = int(failure_status)
+
+        # The failures we were explicitly asked to produce
+        self._failures = deque()
+
+        # The requests we received (most recent last)
+        self.requests = deque(maxlen=self.history)
+
+        # Our statistics
+        self.stats = {
+            'requests': 0,
+            'throttled': 0,
+            'failed': 0,
+        }
+
+        # Used for our failure injection
+        self._random = Random(seed)
+
+        # Used to generate our (unique) identifiers
+        self._request_id = 0
+
+        # Protects the above from concurrent access
+        self._lock = threading.Lock()
+
+        # The thread serving our requests
+        self._thread = None
+
+    @property
+    def url(self):
+        """
+        Returns the base URL of our server
+        """
+        return 'http://{}'.format(self.netloc)
+
+    @property
+    def netloc(self):
+        """
+        Returns the host:port our server is listening on
+        """
+        return '{}:{}'.format(*self.server_address[:2])
+
+    def start(self):
+        """
+        Starts serving requests (in the background)
+        """
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self.serve_forever, kwargs={'poll_interval': 0.1})
+            self._thread.daemon = True
+            self._thread.start()
+
+        return self
+
+    def stop(self):
+        """
+        Stops serving requests and closes our server
+        """
+        if self._thread is not None:
+            self.shutdown()
+            self._thread.join()
+            self._thread = None
+
+        self.server_close()
+
+    def throttle(self, count=1, retry_after=None):
+        """
+        Has the next count requests refused with a 429
+        """
+        retry_after = self.retry_after if retry_after is None \
+            else max(0.0, float(retry_after))
+
+        with self._lock:
+            self._failures.extend(
+                [(429, {'Retry-After': '{:.3f}'.format(retry_after)})] *
+                count)
+
+    def fail(self, count=1, status=None):
+        """
+        Has the next count requests fail with the specified status code
+        """
+        status = self.failure_status if status is None else int(status)
+        with self._lock:
+            self._failures.extend([(status, {})] * count)
+
+    def inject(self):
+        """
+        Returns the (status, headers) of the failure our next request should
+        produce, or (None, {}) if it should be handled normally.
+        """
+        with self._lock:
+            self.stats['requests'] += 1
+
+            delay = self._bucket.delay() if self._bucket is not None \
+                else 0.0
+
+            if self._failures:
+                status, headers = self._failures.popleft()
+
+            elif delay > 0.0:
+                status, headers = 429, {
+                    'Retry-After': '{:.3f}'.format(max(
+                        self.retry_after, delay))}
+
+            elif self.failure_rate and \
+                    self._random.random() < self.failure_rate:
+                status, headers = self.failure_status, {}
+
+            else:
+                if self._bucket is not None:
+                    self._bucket.acquire()
+
+                return None, {}
+
+            self.stats['throttled' if status == 429 else 'failed'] += 1
+            return status, headers
+
+    def record(self, request):
+        """
+        Keeps a record of a request we handled
+        """
+        with self._lock:
+            self.requests.append(request)
+
+    def request_id(self):
+        """
+        Returns a unique identifier
+        """
+        with self._lock:
+            self._request_id += 1
+            return '{:032x}'.format(self._request_id)
+
+    def redirect(self, *plugins):
+        """
+        Returns a context manager that points the specified plugins (all of
+        the ones we emulate if none are specified) at our server instead of
+        their real endpoints.
+
+        Services that are notified by host (such as json://, xml:// and
+        emby://) are simply pointed at our netloc instead.
+
+        """
+        return StubRedirect(self, plugins or sorted(STUB_REDIRECTS.keys()))
+
+    def __enter__(self):
+        """
+        Starts our server
+        """
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        Stops our server
+        """
+        self.stop()
+
+
+class StubRedirect(object):
+    """
+    Points plugins at a StubServer for as long as it's active (as a context
+    manager).
+
+    """
+
+    def __init__(self, server, plugins):
+        """
+        Initialize our redirect
+        """
+        self.server = server
+        self.plugins = plugins
+
+        # The URLs we replaced (so that they can be restored)
+        self._saved = list()
+
+    def __enter__(self):
+        """
+        Points our plugins at our server
+        """
+        # Import here to avoid a circular import
+        from . import plugins
+
+        for name in self.plugins:
+            plugin = getattr(plugins, name)
+            self._saved.append((plugin, plugin.__dict__.get('notify_url')))
+            plugin.notify_url = STUB_REDIRECTS[name].format(self.server.url)
+
+        return self.server
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        Restores the URLs our plugins were originally pointed at
+        """
+        while self._saved:
+            plugin, url = self._saved.pop()
+            if url is None:
+                del plugin.notify_url
+
+            else:
+                plugin.notify_url = url
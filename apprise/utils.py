@@ -24,7 +24,9 @@
 # THE SOFTWARE.
 
 import re
+import threading
 
+from collections import OrderedDict
 from os.path import expanduser
 
 try:
@@ -324,10 +326,11 @@ def parse_url(url, default_schema='http', verify_host=True):
     result['fullpath'] = quote(unquote(tidy_path(parsed[2].strip())))
 
     try:
-        # Handle trailing slashes removed by tidy_path
+        # Handle trailing slashes removed by tidy_path; our query string
+        # (if any) isn't part of our path
         if result['fullpath'][-1] not in ('/', '\\') and \
-           url[-1] in ('/', '\\'):
-            result['fullpath'] += url.strip()[-1]
+           host[-1] in ('/', '\\'):
+            result['fullpath'] += host[-1]
 
     except IndexError:
         # No problem, there simply isn't any returned results
@@ -494,3 +497,117 @@ def parse_list(*args):
     # a list, we need to change it into a list object to remain compatible with
     # both distribution types.
     return sorted([x for x in filter(bool, list(set(result)))])
+
+
+class LRUCache(object):
+    """
+    A simple thread-safe, bounded, least recently used (LRU) cache.
+
+    Once the cache holds maxsize entries, the least recently used one is
+    discarded to make room for the next.  Setting maxsize to zero (0)
+    disables the cache entirely.
+
+    """
+
+    def __init__(self, maxsize=128):
+        """
+        Initialize our cache
+
+        """
+        # Our cached entries in the order they were last used
+        self._cache = OrderedDict()
+
+        # Protects our cache from concurrent access
+        self._lock = threading.Lock()
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+
+        # Our maximum size
+        self._maxsize = max(0, int(maxsize))
+
+    @property
+    def maxsize(self):
+        """
+        Returns the maximum number of entries our cache can hold
+        """
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, maxsize):
+        """
+        Alters the maximum number of entries our cache can hold; entries are
+        discarded (least recently used first) if there are now too many.
+        """
+        with self._lock:
+            self._maxsize = max(0, int(maxsize))
+            while len(self._cache) > self._maxsize:
+                self._cache.popitem(last=False)
+
+    def get(self, key, default=None):
+        """
+        Returns the cached value associated with the key (if found),
+        otherwise the default is returned.
+        """
+        with self._lock:
+            try:
+                # Move our entry to the end of our list (most recently used)
+                value = self._cache.pop(key)
+
+            except KeyError:
+                self.misses += 1
+                return default
+
+            self._cache[key] = value
+            self.hits += 1
+            return value
+
+    def set(self, key, value):
+        """
+        Stores the value in our cache
+        """
+        with self._lock:
+            if self._maxsize <= 0:
+                # Our cache is disabled
+                return
+
+            self._cache.pop(key, None)
+            self._cache[key] = value
+
+            if len(self._cache) > self._maxsize:
+                # Discard our least recently used entry
+                self._cache.popitem(last=False)
+
+    def clear(self):
+        """
+        Empties our cache and resets our statistics
+        """
+        with self._lock:
+            self._cache.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        """
+        Returns a dictionary containing our cache statistics
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'size': len(self._cache),
+            'maxsize': self._maxsize,
+        }
+
+    def __contains__(self, key):
+        """
+        Returns True if the key is cached; this does not affect the order
+        entries are discarded in, nor our statistics.
+        """
+        return key in self._cache
+
+    def __len__(self):
+        """
+        Returns the number of entries cached
+        """
+        return len(self._cache)
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2019 Chris Caron <lead2gold@gmail.com>
+# All rights reserved.
+#
+# This code is licensed under the MIT License.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files(the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and / or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions :
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import pytest
+
+from apprise import Apprise
+
+# These benchmarks require pytest-benchmark
+pytest.importorskip('pytest_benchmark')
+
+# The services (and the URLs) we notify; each is made unique by a number
+SERVICES = {
+    'json': 'json://{host}/?n={n}',
+    'slack': 'slack://T1JJ3T3L2/A1BRTD4JD/TIiajkdnlazkcOXrIdevi7FQ/#c{n}',
+    'discord': 'discord://{n:024d}/' + 't' * 64,
+}
+
+
+def targets(service, count, host):
+    """
+    Returns an Apprise object loaded with count targets of the specified
+    service; they're all pointed at our local server.
+
+    """
+    a = Apprise(max_workers=8)
+    for n in range(count):
+        assert a.add(SERVICES[service].format(host=host, n=n)) is True
+
+    return a
+
+
+@pytest.mark.parametrize('service', sorted(SERVICES.keys()))
+@pytest.mark.parametrize('count', (1, 10, 50))
+def test_notify_fanout(benchmark, local_endpoints, service, count):
+    """
+    Benchmark: Apprise.notify() fanning out to many targets
+
+    """
+    a = targets(service, count, host=local_endpoints.netloc)
+
+    result = benchmark(a.notify, title='title', body='body')
+    assert result is True
+
+
+@pytest.mark.parametrize('count', (10, 50))
+def test_notify_fanout_sequential(benchmark, local_endpoints, count):
+    """
+    Benchmark: Apprise.notify() notifying many targets one at a time
+
+    """
+    a = targets('json', count, host=local_endpoints.netloc)
+    a.max_workers = None
+
+    result = benchmark(a.notify, title='title', body='body')
+    assert result is True
+
+
+@pytest.mark.parametrize('count', (10, 50))
+def test_notify_latency(benchmark, local_endpoints, count):
+    """
+    Benchmark: Apprise.notify() per-target latency (reported in the extra
+    info of our results)
+
+    """
+    a = targets('json', count, host=local_endpoints.netloc)
+
+    result = benchmark(
+        a.notify, title='title', body='body', details=True)
+    assert result
+
+    latencies = sorted(r.latency for r in result)
+    benchmark.extra_info['latency_median'] = latencies[len(latencies) // 2]
+    benchmark.extra_info['latency_max'] = latencies[-1]
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2019 Chris Caron <lead2gold@gmail.com>
+# All rights reserved.
+#
+# This code is licensed under the MIT License.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files(the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and / or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions :
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Our benchmarks are only collected when explicitly asked for; refer to the
+# benchmark environment defined in tox.ini:
+#   tox -e benchmark
+#
+# or run them directly with:
+#   pytest test/benchmarks -o python_files='bench_*.py' --benchmark-autosave
+#
+# Each run is stored (as JSON) in the .benchmarks directory so that it can be
+# compared to those before it (--benchmark-compare).
+
+import mock
+import pytest
+
+from apprise import NotifyBase
+from apprise.testing import StubServer
+
+
+@pytest.fixture(scope='session')
+def stub_server():
+    """
+    Returns a local server that stands in for the services we notify
+
+    """
+    with StubServer() as server:
+        yield server
+
+
+@pytest.fixture
+def local_endpoints(stub_server):
+    """
+    Points the services we benchmark at our local server (instead of their
+    real endpoints) and disables throttling; we're measuring our dispatch
+    path, not the time we spend waiting to be allowed to send.
+
+    """
+    with mock.patch.object(NotifyBase, 'request_rate_per_sec', 0), \
+            stub_server.redirect():
+        yield stub_server
@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2019 Chris Caron <lead2gold@gmail.com>
+# All rights reserved.
+#
+# This code is licensed under the MIT License.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files(the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and / or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions :
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# The tests found here make use of the async/await syntax which is only
+# supported by Python v3.5 (and newer); refer to conftest.py
+
+import asyncio
+from apprise import Apprise
+from apprise import NotifyBase
+from apprise.Apprise import SCHEMA_MAP
+from time import sleep
+from timeit import default_timer
+import mock
+
+
+def test_apprise_async_notify():
+    """
+    API: Apprise() asyncio notifications
+
+    """
+    class SlowNotification(NotifyBase):
+        # Each of our servers throttle for 1 second between requests
+        request_rate_per_sec = 1.0
+
+        def send(self, **kwargs):
+            # Simulate a slow (blocking) server
+            sleep(0.5)
+            return True
+
+    class FailNotification(NotifyBase):
+        # Disable throttling
+        request_rate_per_sec = 0
+
+        def send(self, **kwargs):
+            # Pretend something went wrong
+            return False
+
+    SCHEMA_MAP['aslow'] = SlowNotification
+    SCHEMA_MAP['afail'] = FailNotification
+
+    a = Apprise()
+    for n in range(4):
+        assert(a.add('aslow://server{}'.format(n)) is True)
+
+    # Pretend we just notified one of our servers; this forces a throttle
+    assert a[0].throttle() == 0.0
+    assert a[0].throttle_delay() > 0.5
+    assert a[1].throttle_delay() == 0.0
+
+    # Tracks how often our event loop got to run while we were notifying
+    ticks = list()
+
+    async def ticker():
+        while True:
+            ticks.append(True)
+            await asyncio.sleep(0.05)
+
+    async def run(**kwargs):
+        task = asyncio.ensure_future(ticker())
+        try:
+            return await a.async_notify(**kwargs)
+
+        finally:
+            task.cancel()
+
+    loop = asyncio.new_event_loop()
+    try:
+        start_time = default_timer()
+        assert loop.run_until_complete(
+            run(title="title", body="body")) is True
+        elapsed = default_timer() - start_time
+
+        # Our servers were notified concurrently; one of which throttled
+        assert elapsed > 1.0 and elapsed < 2.5
+
+        # Neither the throttle or the blocking send() calls blocked our loop
+        assert len(ticks) > 10
+
+        # Don't wait on our throttle from here on
+        SlowNotification.request_rate_per_sec = 0
+
+        # No title or body
+        assert loop.run_until_complete(run(title="", body="")) is False
+
+        # Nothing matched our tag
+        assert loop.run_until_complete(
+            run(title="title", body="body", tag='missing')) is True
+
+        # A failure is reported in our response
+        assert(a.add('afail://localhost') is True)
+        assert loop.run_until_complete(
+            run(title="title", body="body")) is False
+
+        # Our failures are stored in our outbox (if we have one)
+        a.outbox = mock.Mock()
+        assert loop.run_until_complete(
+            run(title="title", body="body")) is False
+        assert a.outbox.put.call_count == 1
+        assert a.outbox.put.call_args[0][0] is a[4]
+        assert a.outbox.sync.call_count == 1
+
+        # Our NotifyBase objects can also be notified directly
+        assert loop.run_until_complete(
+            a[0].async_notify(body="body")) is True
+
+    finally:
+        loop.close()
+
+
+def test_apprise_async_throttle():
+    """
+    API: Apprise() asyncio notifications sharing a throttle
+
+    """
+    class SharedNotification(NotifyBase):
+        # Our servers all share one token bucket
+        request_rate_per_sec = 0.2
+
+        def send(self, **kwargs):
+            # Just like our plugins, we throttle before our i/o
+            self.throttle()
+            return True
+
+    SCHEMA_MAP['ashared'] = SharedNotification
+
+    a = Apprise()
+    for n in range(4):
+        assert a.add('ashared://localhost/?n={}'.format(n)) is True
+
+    # Our waits are spread out at our sustained rate
+    delays = list()
+    real_sleep = asyncio.sleep
+
+    def fake_sleep(delay):
+        delays.append(delay)
+        return real_sleep(0)
+
+    loop = asyncio.new_event_loop()
+    try:
+        with mock.patch('asyncio.sleep', fake_sleep), \
+                mock.patch('apprise.plugins.NotifyBase.sleep') as mock_sleep:
+            assert loop.run_until_complete(
+                a.async_notify(title="title", body="body")) is True
+
+            # Our executor threads never blocked on our throttle
+            assert mock_sleep.call_count == 0
+
+    finally:
+        loop.close()
+
+    assert len(delays) == 3
+    assert sorted(round(d, 1) for d in delays) == [0.2, 0.4, 0.6]
+
+    # We're not left holding a token we didn't use
+    assert getattr(NotifyBase._prepaid, 'bucket', None) is None
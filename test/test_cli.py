@@ -25,9 +25,21 @@
 
 from __future__ import print_function
 from apprise import cli
+from apprise import Apprise
 from apprise import NotifyBase
+from apprise import AppriseOutbox
 from click.testing import CliRunner
 from apprise.Apprise import SCHEMA_MAP
+from time import sleep
+import mock
+
+try:
+    # Python 2.7
+    from StringIO import StringIO
+
+except ImportError:
+    # Python 3.x
+    from io import StringIO
 
 
 def test_apprise_cli():
@@ -89,3 +101,138 @@ def test_apprise_cli():
         'bad://localhost',
     ])
     assert result.exit_code == 1
+
+
+def test_apprise_cli_outbox(tmpdir):
+    """
+    API: Apprise() CLI outbox
+
+    """
+
+    class OutboxNotification(NotifyBase):
+        # Whether or not our servers are online
+        online = False
+
+        def url(self):
+            return 'clioutbox://{}'.format(self.host)
+
+        def notify(self, **kwargs):
+            return self.online
+
+    SCHEMA_MAP['clioutbox'] = OutboxNotification
+
+    path = str(tmpdir.join('outbox'))
+    runner = CliRunner()
+
+    # Our notification fails and is stored in our outbox
+    result = runner.invoke(cli.main, [
+        '-b', 'test body',
+        '--outbox', path,
+        'clioutbox://localhost',
+    ])
+    assert result.exit_code == 1
+    assert len(AppriseOutbox(path)) == 1
+
+    # Our server is still offline
+    result = runner.invoke(cli.main, ['--outbox', path, '--flush-outbox'])
+    assert result.exit_code == 1
+    assert len(AppriseOutbox(path)) == 1
+
+    # Our notification is redelivered once our server is back online
+    OutboxNotification.online = True
+    result = runner.invoke(cli.main, ['-o', path, '--flush-outbox'])
+    assert result.exit_code == 0
+    assert len(AppriseOutbox(path)) == 0
+
+    # Our default outbox is used if one isn't specified
+    with mock.patch('apprise.cli.DEFAULT_OUTBOX_PATH', path):
+        result = runner.invoke(cli.main, ['--flush-outbox'])
+        assert result.exit_code == 0
+
+
+def test_apprise_cli_stream():
+    """
+    API: Apprise() CLI stream
+
+    """
+
+    class StreamNotification(NotifyBase):
+        # Our messages are small
+        body_maxlen = 20
+
+        # The messages we've sent
+        messages = []
+
+        def notify(self, body, **kwargs):
+            StreamNotification.messages.append(body)
+            return True
+
+    class BadNotification(NotifyBase):
+        def notify(self, **kwargs):
+            return False
+
+    SCHEMA_MAP['clistream'] = StreamNotification
+    SCHEMA_MAP['clistreambad'] = BadNotification
+
+    runner = CliRunner()
+    lines = ''.join('line {}\n'.format(i) for i in range(10))
+
+    # Our lines are grouped into messages that fit our server
+    result = runner.invoke(cli.main, [
+        '-t', 'test title', '--stream', 'clistream://localhost',
+    ], input=lines)
+    assert result.exit_code == 0
+    assert StreamNotification.messages == [
+        'line {}\nline {}\n'.format(i, i + 1) for i in range(0, 10, 2)]
+
+    # We can limit the number of lines sent in each message
+    del StreamNotification.messages[:]
+    result = runner.invoke(cli.main, [
+        '-s', '--stream-lines', '1', 'clistream://localhost',
+    ], input=lines)
+    assert result.exit_code == 0
+    assert len(StreamNotification.messages) == 10
+
+    # Blank messages aren't sent
+    del StreamNotification.messages[:]
+    result = runner.invoke(cli.main, [
+        '-s', 'clistream://localhost',
+    ], input='\n' * 50)
+    assert result.exit_code == 0
+    assert StreamNotification.messages == []
+
+    # Our failures are reported
+    result = runner.invoke(cli.main, [
+        '-s', 'clistreambad://localhost',
+    ], input=lines)
+    assert result.exit_code == 1
+
+    # Our messages fit the smallest of our servers; our title is accounted
+    # for if it's added to our body
+    a = Apprise()
+    assert cli.stream_size(a.servers) == cli.DEFAULT_STREAM_SIZE
+    assert a.add('clistream://localhost') is True
+    assert cli.stream_size(a.servers) == 20
+    a[0].title_maxlen = 0
+    assert cli.stream_size(a.servers, title='title') == 13
+
+    # Lines longer than our messages are broken up
+    assert list(cli.read_stream(StringIO('x' * 50 + '\n'), size=20)) == [
+        'x' * 20, 'x' * 20, 'x' * 10 + '\n']
+
+    class SlowStream(object):
+        """
+        Our input arrives with a pause in it
+        """
+        lines = ['a\n', 'b\n', None, 'c\n']
+
+        def readline(self, size):
+            line = self.lines.pop(0) if self.lines else ''
+            if line is None:
+                sleep(0.5)
+                line = self.lines.pop(0)
+            return line
+
+    # What we've read is sent when our input goes idle
+    assert list(cli.read_stream(SlowStream(), size=20, idle=0.1)) == [
+        'a\nb\n', 'c\n']
@@ -28,6 +28,9 @@ import mock
 import sys
 import types
 import apprise
+
+# Our plugins are loaded on demand; make sure the one we test is available
+import apprise.plugins.NotifyDBus  # noqa: F401
 from apprise.utils import compat_is_basestring
 
 try:
@@ -238,6 +238,13 @@ def test_growl_plugin(mock_gntp):
                         url, obj.url()))
                     assert(False)
 
+                # Our URL must describe our object completely; it's used to
+                # notify it later on (such as by our outbox)
+                if not obj.url_lossless():
+                    print('TEST FAIL: {} regenerated differently as {}'
+                          .format(url, obj.url()))
+                    assert(False)
+
             if self:
                 # Iterate over our expected entries inside of our object
                 for key, val in self.items():
@@ -137,6 +137,13 @@ def test_plugin(mock_refresh, mock_send):
                         url, obj.url()))
                     assert(False)
 
+                # Our URL must describe our object completely; it's used to
+                # notify it later on (such as by our outbox)
+                if not obj.url_lossless():
+                    print('TEST FAIL: {} regenerated differently as {}'
+                          .format(url, obj.url()))
+                    assert(False)
+
             if self:
                 # Iterate over our expected entries inside of our object
                 for key, val in self.items():
@@ -194,3 +201,33 @@ def test_plugin(mock_refresh, mock_send):
 
             if not isinstance(e, instance):
                 raise
+
+
+@mock.patch('requests.request')
+def test_plugin_session_pool(mock_request):
+    """
+    API: NotifyPushjet Plugin() uses our pooled sessions
+
+    """
+    # Disable Throttling to speed testing
+    plugins.NotifyBase.NotifyBase.request_rate_per_sec = 0
+
+    robj = mock.Mock()
+    robj.status_code = 200
+    robj.json.return_value = {'service': {
+        'name': 'apprise', 'icon': None, 'created': 0,
+        'public': 'b' * 40, 'secret': 'a' * 32}}
+
+    obj = Apprise.instantiate(
+        'pjet://%s@localhost' % ('a' * 32), suppress_exceptions=False)
+
+    with mock.patch.object(obj, 'session_pool') as mock_pool:
+        mock_pool.request.return_value = robj
+        assert obj.notify(title='title', body='body') is True
+
+    # Our requests went through our pool (and not around it)
+    assert mock_request.call_count == 0
+    assert [c[0][0] for c in mock_pool.request.call_args_list] == \
+        ['GET', 'POST']
+    assert mock_pool.request.call_args[0][1] == 'http://localhost/message'
+    assert mock_pool.request.call_args[1]['timeout'] == obj.request_timeout
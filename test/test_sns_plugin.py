@@ -297,7 +297,7 @@ def test_aws_response_handling():
     assert(response['error_message'].endswith('required parameter'))
 
 
-@mock.patch('requests.post')
+@mock.patch('requests.Session.post')
 def test_aws_topic_handling(mock_post):
     """
     API: NotifySNS Plugin() AWS Topic Handling
@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2019 Chris Caron <lead2gold@gmail.com>
+# All rights reserved.
+#
+# This code is licensed under the MIT License.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files(the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and / or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions :
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+from apprise import Apprise
+from apprise import NotifyBase
+from apprise import plugins
+from apprise.testing import StubServer
+
+import mock
+
+
+# Our services; they're all pointed at our local server
+STUB_URLS = (
+    'slack://T1JJ3T3L2/A1BRTD4JD/TIiajkdnlazkcOXrIdevi7FQ/#channel',
+    'discord://{}/{}'.format('i' * 24, 't' * 64),
+    'tgram://123456789:abcdefg_hijklmnop/',
+    'sns://T1JJ3T3L2/A1BRTD4JD/TIiajkdnlazkcevi7FQ/us-west-2/#topic',
+    'sns://T1JJ3T3L2/A1BRTD4JD/TIiajkdnlazkcevi7FQ/us-west-2/12223334444',
+    'json://{netloc}/',
+    'xml://{netloc}/',
+    'emby://user:pass@{netloc}',
+)
+
+
+@mock.patch.object(plugins.NotifySNS, 'request_rate_per_sec', 0)
+@mock.patch.object(NotifyBase, 'request_rate_per_sec', 0)
+def test_stub_server():
+    """
+    API: StubServer() emulating our services
+
+    """
+    with StubServer() as server:
+        assert server.url == 'http://{}'.format(server.netloc)
+
+        with server.redirect():
+            assert plugins.NotifySlack.notify_url == \
+                '{}/services'.format(server.url)
+
+            for url in STUB_URLS:
+                a = Apprise()
+                assert a.add(url.format(netloc=server.netloc)) is True
+                assert a.notify(title='title', body='body') is True
+
+        # Our services are no longer redirected
+        assert plugins.NotifySlack.notify_url == \
+            'https://hooks.slack.com/services'
+        assert plugins.NotifySNS.notify_url == \
+            'https://sns.{region}.amazonaws.com/'
+
+        assert server.stats['requests'] == len(server.requests)
+        assert server.stats['throttled'] == 0
+        assert server.stats['failed'] == 0
+
+        # Every request we received was successful
+        assert all(
+            request.status in (200, 204) for request in server.requests)
+
+        # Our SNS topic was created before being published to
+        actions = [
+            request.body for request in server.requests
+            if b'Action=' in request.body]
+        assert b'Action=CreateTopic' in actions[0]
+        assert b'Action=Publish' in actions[1]
+        assert b'TopicArn=' in actions[1]
+
+    # Only the plugins specified are redirected
+    with StubServer() as server:
+        with server.redirect('NotifyDiscord'):
+            assert plugins.NotifyDiscord.notify_url == \
+                '{}/api/webhooks'.format(server.url)
+            assert plugins.NotifySlack.notify_url == \
+                'https://hooks.slack.com/services'
+
+
+@mock.patch('apprise.plugins.NotifyBase.sleep')
+@mock.patch.object(NotifyBase, 'request_rate_per_sec', 0)
+def test_stub_server_failures(mock_sleep):
+    """
+    API: StubServer() throttling and failure injection
+
+    """
+    with StubServer(retry_after=2.5) as server:
+        url = 'json://{}/?retry=2'.format(server.netloc)
+
+        # We're refused with a 429 (and told when to try again)
+        server.throttle(2)
+        a = Apprise()
+        assert a.add(url) is True
+        assert a.notify(title='title', body='body') is True
+        assert mock_sleep.call_count == 2
+        assert mock_sleep.call_args[0][0] == 2.5
+        assert server.stats['throttled'] == 2
+        assert [r.status for r in server.requests] == [429, 429, 200]
+
+        # Failures are retried as well
+        mock_sleep.reset_mock()
+        server.fail(2, status=503)
+        assert a.notify(title='title', body='body') is True
+        assert mock_sleep.call_count == 2
+        assert server.stats['failed'] == 2
+
+        # We eventually give up
+        server.fail(3, status=503)
+        assert a.notify(title='title', body='body') is False
+        assert server.stats['failed'] == 5
+        assert server.stats['requests'] == 9
+
+    # Every request fails
+    with StubServer(failure_rate=1.0, failure_status=500) as server:
+        a = Apprise()
+        assert a.add('json://{}/'.format(server.netloc)) is True
+        assert a.notify(title='title', body='body') is False
+        assert server.requests[-1].status == 500
+
+    # We only accept one request a minute
+    with StubServer(rate_limit=1 / 60.0, retry_after=0) as server:
+        a = Apprise()
+        assert a.add('json://{}/'.format(server.netloc)) is True
+        assert a.notify(title='title', body='body') is True
+        assert a.notify(title='title', body='body') is False
+        assert server.stats['throttled'] == 1
+        assert server.requests[-1].status == 429
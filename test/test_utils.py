@@ -424,3 +424,51 @@ def test_parse_list():
         '.divx', '.wmv', '.iso', '.mkv', '.mov', '.mpg', '.avi', '.vob',
         '.xvid', '.mpeg', '.mp4',
     ]))
+
+
+def test_lru_cache():
+    "utils: LRUCache() testing """
+
+    cache = utils.LRUCache(maxsize=2)
+    assert len(cache) == 0
+    assert cache.maxsize == 2
+
+    assert cache.get('a') is None
+    assert cache.get('a', 'default') == 'default'
+    cache.set('a', 1)
+    cache.set('b', 2)
+    assert 'a' in cache
+    assert cache.get('a') == 1
+
+    # 'b' is now our least recently used entry and is discarded
+    cache.set('c', 3)
+    assert 'b' not in cache
+    assert cache.get('a') == 1
+    assert cache.get('c') == 3
+    assert len(cache) == 2
+
+    # Re-setting an entry doesn't grow our cache
+    cache.set('c', 4)
+    assert cache.get('c') == 4
+    assert len(cache) == 2
+
+    assert cache.stats() == {
+        'hits': 4, 'misses': 2, 'size': 2, 'maxsize': 2}
+
+    # Shrinking our cache discards our least recently used entries
+    cache.maxsize = 1
+    assert 'a' not in cache
+    assert 'c' in cache
+
+    # A cache of zero is disabled
+    cache.maxsize = 0
+    assert len(cache) == 0
+    cache.set('a', 1)
+    assert len(cache) == 0
+
+    # Invalid sizes are treated as zero
+    assert utils.LRUCache(maxsize=-1).maxsize == 0
+
+    cache.clear()
+    assert cache.stats() == {
+        'hits': 0, 'misses': 0, 'size': 0, 'maxsize': 0}